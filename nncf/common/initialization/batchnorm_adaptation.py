@@ -12,6 +12,7 @@
 import math
 from abc import ABC
 from abc import abstractmethod
+from copy import copy
 from typing import Optional
 
 from nncf.api.compression import TModel
@@ -26,7 +27,14 @@ class BatchnormAdaptationAlgorithmImpl(ABC):
     the batch-norm statistics adaptation algorithm inherit.
     """
 
-    def __init__(self, data_loader: NNCFDataLoader, num_bn_adaptation_steps: int, device: Optional[str] = None):
+    def __init__(
+        self,
+        data_loader: NNCFDataLoader,
+        num_bn_adaptation_steps: int,
+        device: Optional[str] = None,
+        cache_batches: bool = False,
+        bn_only_forward: bool = False,
+    ):
         """
         Initializes the batch-norm statistics adaptation algorithm implementation.
 
@@ -36,10 +44,15 @@ class BatchnormAdaptationAlgorithmImpl(ABC):
             the original model.
         :param device: Device to perform initialization. If `device` is `None` then the device
             of the model parameters will be used.
+        :param cache_batches: Whether to load the batches from the data loader once and to replay
+            them on each run of the algorithm.
+        :param bn_only_forward: Whether to stop the forward pass after the last batch-norm layer.
         """
         self._data_loader = data_loader
         self._num_bn_adaptation_steps = num_bn_adaptation_steps
         self._device = device
+        self._cache_batches = cache_batches
+        self._bn_only_forward = bn_only_forward
 
     @abstractmethod
     def run(self, model: TModel) -> None:
@@ -57,7 +70,14 @@ class BatchnormAdaptationAlgorithm:
     accuracy drop even before model training.
     """
 
-    def __init__(self, data_loader: NNCFDataLoader, num_bn_adaptation_samples: int, device: Optional[str] = None):
+    def __init__(
+        self,
+        data_loader: NNCFDataLoader,
+        num_bn_adaptation_samples: int,
+        device: Optional[str] = None,
+        cache_batches: bool = False,
+        bn_only_forward: bool = False,
+    ):
         """
         Initializes the batch-norm statistics adaptation algorithm.
 
@@ -68,6 +88,11 @@ class BatchnormAdaptationAlgorithm:
             will be a closest multiple of the batch size.
         :param device: Device to perform initialization. If `device` is `None` then the device
             of the model parameters will be used.
+        :param cache_batches: Whether to load the batches from the data loader on the first run
+            of the algorithm and to replay them on the next runs. The batches are kept in the memory
+            of the device used for initialization.
+        :param bn_only_forward: Whether to stop the forward pass after the last batch-norm layer of the model,
+            since the layers that follow it do not affect the batch-norm statistics.
         """
         if num_bn_adaptation_samples < 0:
             raise ValueError("Number of adaptation samples must be >= 0")
@@ -75,6 +100,20 @@ class BatchnormAdaptationAlgorithm:
         self._device = device
         self._data_loader = data_loader
         self._num_bn_adaptation_steps = math.ceil(num_bn_adaptation_samples / data_loader.batch_size)
+        self._cache_batches = cache_batches
+        self._bn_only_forward = bn_only_forward
+        self._impl = None
+
+    def copy(self) -> "BatchnormAdaptationAlgorithm":
+        """
+        Returns the algorithm with the same parameters and data loader that does not share the cached batches
+        and the state of the runs with this one, so the copies could be run concurrently.
+
+        :return: Copy of the algorithm.
+        """
+        algorithm = copy(self)
+        algorithm._impl = None
+        return algorithm
 
     def run(self, model: TModel) -> None:
         """
@@ -96,5 +135,13 @@ class BatchnormAdaptationAlgorithm:
             )
 
             impl_cls = TFBatchnormAdaptationAlgorithmImpl
-        impl = impl_cls(self._data_loader, self._num_bn_adaptation_steps, self._device)
-        impl.run(model)
+        if not isinstance(self._impl, impl_cls):
+            # The implementation is kept between the runs since it holds the cached batches
+            self._impl = impl_cls(
+                self._data_loader,
+                self._num_bn_adaptation_steps,
+                self._device,
+                self._cache_batches,
+                self._bn_only_forward,
+            )
+        self._impl.run(model)
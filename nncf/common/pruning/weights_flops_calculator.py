@@ -9,13 +9,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
 from nncf.common.graph import NNCFGraph
+from nncf.common.graph import NNCFNode
 from nncf.common.graph import NNCFNodeName
 from nncf.common.graph.operator_metatypes import OperatorMetatype
+from nncf.common.pruning.clusterization import Clusterization
+from nncf.common.pruning.structs import PrunedLayerInfoBase
 from nncf.common.pruning.utils import get_output_channels
 from nncf.common.pruning.utils import is_prunable_depthwise_conv
 
@@ -102,44 +105,66 @@ class WeightsFlopsCalculator:
         output_channels = output_channels or {}
         kernel_sizes = kernel_sizes or {}
         op_addresses_to_skip = op_addresses_to_skip or []
-        for node in graph.get_nodes_by_metatypes(self._conv_op_metatypes):
+        nodes = graph.get_nodes_by_metatypes(self._conv_op_metatypes)
+        nodes += graph.get_nodes_by_metatypes(self._linear_op_metatypes)
+        for node in nodes:
             name = node.node_name
             if name in op_addresses_to_skip:
                 continue
-            num_in_channels = input_channels.get(name, node.layer_attributes.in_channels)
-            num_out_channels = output_channels.get(name, node.layer_attributes.out_channels)
-            kernel_size = kernel_sizes.get(name, node.layer_attributes.kernel_size)
-            if is_prunable_depthwise_conv(node):
-                # Prunable depthwise conv processed in special way
-                # because common way to calculate filters per
-                # channel for such layer leads to zero in case
-                # some of the output channels are pruned.
-                filters_per_channel = 1
-            else:
-                filters_per_channel = num_out_channels // node.layer_attributes.groups
-
-            flops_numpy = (
-                2 * np.prod(kernel_size) * num_in_channels * filters_per_channel * np.prod(output_shapes[name])
+            flops[name], weights[name] = self.count_flops_and_weights_for_node(
+                node, output_shapes, input_channels, output_channels, kernel_sizes
             )
-            weights_numpy = np.prod(kernel_size) * num_in_channels * filters_per_channel
 
-            flops[name] = flops_numpy.astype(int).item()
-            weights[name] = weights_numpy.astype(int).item()
+        return flops, weights
 
-        for node in graph.get_nodes_by_metatypes(self._linear_op_metatypes):
-            name = node.node_name
-            if name in op_addresses_to_skip:
-                continue
+    def count_flops_and_weights_for_node(
+        self,
+        node: NNCFNode,
+        output_shapes: Dict[NNCFNodeName, int],
+        input_channels: Dict[NNCFNodeName, int],
+        output_channels: Dict[NNCFNodeName, int],
+        kernel_sizes: Dict[NNCFNodeName, Tuple[int, int]] = None,
+    ) -> Tuple[int, int]:
+        """
+        Counts the number of weights and FLOPs of a single convolution or fully connected node.
 
+        :param node: A convolution or fully connected node.
+        :param output_shapes: Dictionary of output dimension shapes for convolutions and
+            fully connected layers. E.g {node_name: (height, width)}
+        :param input_channels: Dictionary of input channels number in convolutions.
+            If the node is absent, the number is taken from the graph. {node_name: channels_num}
+        :param output_channels: Dictionary of output channels number in convolutions.
+            If the node is absent, the number is taken from the graph. {node_name: channels_num}
+        :param kernel_sizes: Dictionary of kernel sizes in convolutions.
+            If not specified, taken from the graph. {node_name: kernel_size}.
+        :return number of FLOPs of the node
+                number of weights (params) of the node
+        """
+        name = node.node_name
+        if node.metatype in self._linear_op_metatypes:
             num_in_features = input_channels.get(name, node.layer_attributes.in_features)
             num_out_features = output_channels.get(name, node.layer_attributes.out_features)
 
             flops_numpy = 2 * num_in_features * num_out_features * np.prod(output_shapes[name][:-1])
             weights_numpy = num_in_features * num_out_features
-            flops[name] = flops_numpy
-            weights[name] = weights_numpy
+            return flops_numpy, weights_numpy
 
-        return flops, weights
+        kernel_sizes = kernel_sizes or {}
+        num_in_channels = input_channels.get(name, node.layer_attributes.in_channels)
+        num_out_channels = output_channels.get(name, node.layer_attributes.out_channels)
+        kernel_size = kernel_sizes.get(name, node.layer_attributes.kernel_size)
+        if is_prunable_depthwise_conv(node):
+            # Prunable depthwise conv processed in special way
+            # because common way to calculate filters per
+            # channel for such layer leads to zero in case
+            # some of the output channels are pruned.
+            filters_per_channel = 1
+        else:
+            filters_per_channel = num_out_channels // node.layer_attributes.groups
+
+        flops_numpy = 2 * np.prod(kernel_size) * num_in_channels * filters_per_channel * np.prod(output_shapes[name])
+        weights_numpy = np.prod(kernel_size) * num_in_channels * filters_per_channel
+        return flops_numpy.astype(int).item(), weights_numpy.astype(int).item()
 
     def count_filters_num(self, graph: NNCFGraph, output_channels: Dict[NNCFNodeName, int] = None) -> int:
         """
@@ -154,3 +179,125 @@ class WeightsFlopsCalculator:
         for node in graph.get_nodes_by_metatypes(self._conv_op_metatypes + self._linear_op_metatypes):
             filters_num += output_channels.get(node.node_name, get_output_channels(node))
         return filters_num
+
+
+class IncrementalWeightsFlopsCounter:
+    """
+    Keeps the number of FLOPs and weights in the model up to date while the filters of the pruning groups are
+    pruned one by one, recounting only the nodes whose shapes are changed by the pruning of a group: the nodes of
+    the group itself and the next nodes of the group.
+    """
+
+    def __init__(
+        self,
+        weights_flops_calc: WeightsFlopsCalculator,
+        graph: NNCFGraph,
+        output_shapes: Dict[NNCFNodeName, int],
+        pruning_groups: Clusterization[PrunedLayerInfoBase],
+        pruning_groups_next_nodes: Dict[int, List[Dict[str, Any]]],
+        input_channels: Dict[NNCFNodeName, int],
+        output_channels: Dict[NNCFNodeName, int],
+    ):
+        """
+        Constructor.
+
+        :param weights_flops_calc: Calculator of the FLOPs and weights per node.
+        :param graph: NNCFGraph.
+        :param output_shapes: Dictionary of output dimension shapes for convolutions and
+            fully connected layers. E.g {node_name: (height, width)}
+        :param pruning_groups: `Clusterization` of pruning groups.
+        :param pruning_groups_next_nodes: A dictionary of next nodes of each pruning group.
+        :param input_channels: Dictionary of input channels number in prunable layers. Is expected to be modified
+            by the caller, e.g. by `ShapePruningProcessor.prune_cluster_shapes`, before calling `recount_group`.
+        :param output_channels: Dictionary of output channels number in prunable layers. Is expected to be modified
+            by the caller, e.g. by `ShapePruningProcessor.prune_cluster_shapes`, before calling `recount_group`.
+        """
+        self._weights_flops_calc = weights_flops_calc
+        self._output_shapes = output_shapes
+        self._input_channels = input_channels
+        self._output_channels = output_channels
+        self._flops_per_node, self._weights_per_node = weights_flops_calc.count_flops_and_weights_per_node(
+            graph, output_shapes, input_channels, output_channels
+        )
+        self.flops = sum(self._flops_per_node.values())
+        self.weights = sum(self._weights_per_node.values())
+
+        self._affected_nodes = {}
+        for cluster in pruning_groups.get_all_clusters():
+            node_names = [minfo.node_name for minfo in cluster.elements]
+            node_names.extend(next_node["node_name"] for next_node in pruning_groups_next_nodes[cluster.id])
+            self._affected_nodes[cluster.id] = [
+                graph.get_node_by_name(name) for name in dict.fromkeys(node_names) if name in self._flops_per_node
+            ]
+
+    def recount_group(self, group_id: int) -> Tuple[int, int]:
+        """
+        Recounts the FLOPs and weights of the nodes affected by the pruning of the given group
+        according to the current input and output channels numbers.
+
+        :param group_id: Id of the pruning group whose shapes were changed.
+        :return number of FLOPs in the model
+                number of weights (params) in the model
+        """
+        for node in self._affected_nodes[group_id]:
+            name = node.node_name
+            flops, weights = self._weights_flops_calc.count_flops_and_weights_for_node(
+                node, self._output_shapes, self._input_channels, self._output_channels
+            )
+            self.flops += flops - self._flops_per_node[name]
+            self.weights += weights - self._weights_per_node[name]
+            self._flops_per_node[name] = flops
+            self._weights_per_node[name] = weights
+        return self.flops, self.weights
+
+
+class UniformPruningFlopsTable:
+    """
+    Lookup table of the number of FLOPs and weights in the model pruned uniformly, i.e. with the same pruning level
+    in all the pruning groups. The table is filled lazily on the grid of pruning levels visited by the bisection
+    search and depends on the model graph only, so the search for the pruning level achieving the target FLOPs
+    number does not recount the model again once the visited levels are in the table.
+    """
+
+    def __init__(self, count_flops_and_weights_fn: Callable[[float], Tuple[int, int]], error: float = 0.01):
+        """
+        Constructor.
+
+        :param count_flops_and_weights_fn: Function that returns the number of FLOPs and weights
+            in the uniformly pruned model for the given pruning level.
+        :param error: The maximal distance between the pruning level found by the search and the minimal pruning level
+            that achieves the target FLOPs number.
+        """
+        self._count_flops_and_weights_fn = count_flops_and_weights_fn
+        step = 1.0
+        while step > error:
+            step /= 2
+        self._num_steps = round(1 / step)
+        self._table = {}  # type: Dict[int, Tuple[int, int]]
+
+    def _get_flops_and_weights(self, level_idx: int) -> Tuple[int, int]:
+        if level_idx not in self._table:
+            self._table[level_idx] = self._count_flops_and_weights_fn(level_idx / self._num_steps)
+        return self._table[level_idx]
+
+    def find_pruning_level(self, target_flops: float) -> Optional[Tuple[float, int, int]]:
+        """
+        Searches for the minimal uniform pruning level on the grid for which the number of FLOPs
+        in the pruned model is less than the target one.
+
+        :param target_flops: Target number of FLOPs in the pruned model.
+        :return: The pruning level and the number of FLOPs and weights in the model pruned with it,
+            or None if the target number of FLOPs can't be achieved.
+        """
+        left, right = 0, self._num_steps
+        while right - left > 1:
+            middle = (left + right) // 2
+            flops, _ = self._get_flops_and_weights(middle)
+            if flops < target_flops:
+                right = middle
+            else:
+                left = middle
+        flops, params_num = self._get_flops_and_weights(right)
+        if flops <= target_flops:
+            return right / self._num_steps, flops, params_num
+        return None
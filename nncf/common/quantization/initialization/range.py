@@ -175,6 +175,11 @@ class RangeInitCollectorParams:
         """Applies abs(max) for symmetric quantization."""
         return self._mode == QuantizationMode.SYMMETRIC
 
+    @property
+    def is_per_channel(self) -> bool:
+        """Statistics are collected per channel."""
+        return self._per_channel
+
     @property
     def use_means_of_mins(self) -> bool:
         return not self._is_weights and not self._per_channel and self._mode == "asymmetric"
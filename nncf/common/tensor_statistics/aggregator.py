@@ -11,10 +11,11 @@
 from abc import ABC
 from abc import abstractmethod
 from itertools import islice
-from typing import Any, Dict, TypeVar
+from typing import Any, Dict, Iterable, TypeVar
 
 from tqdm import tqdm
 
+from nncf.common.engine import Engine
 from nncf.common.factory import EngineFactory
 from nncf.common.factory import ModelTransformerFactory
 from nncf.common.graph.transformations.layout import TransformationLayout
@@ -48,16 +49,49 @@ class StatisticsAggregator(ABC):
         merged_statistics = self._get_merged_statistic_points(self.statistic_points, model)
         transformation_layout = self._get_transformation_layout_extra_outputs(merged_statistics)
         model_with_outputs = model_transformer.transform(transformation_layout)
-        engine = EngineFactory.create(model_with_outputs)
+        engine = self._create_engine(model_with_outputs)
+        self._collect_statistics(engine, merged_statistics)
 
-        for input_data in tqdm(
-            islice(self.dataset.get_inference_data(), self.stat_subset_size),
-            total=self.stat_subset_size,
-            desc="Statistics collection",
-        ):
+    def _collect_statistics(self, engine: Engine, statistic_points: StatisticPointsContainer) -> None:
+        """
+        Collects statistics on the subset of the dataset for the merged statistic points.
+
+        :param engine: Engine to infer the model with extra outputs.
+        :param statistic_points: StatisticPointsContainer instance with the merged statistic points.
+        """
+        dataset = islice(self.dataset.get_inference_data(), self.stat_subset_size)
+        self._collect_statistics_on_dataset(engine, dataset, self.stat_subset_size, statistic_points)
+
+    def _collect_statistics_on_dataset(
+        self,
+        engine: Engine,
+        dataset: Iterable[Any],
+        total: int,
+        statistic_points: StatisticPointsContainer,
+        show_progress: bool = True,
+    ) -> None:
+        """
+        Infers the model with extra outputs on the data items and registers the statistics.
+
+        :param engine: Engine to infer the model with extra outputs.
+        :param dataset: Data items to infer.
+        :param total: Number of the data items.
+        :param statistic_points: StatisticPointsContainer instance with the statistic points.
+        :param show_progress: Whether to show the progress bar.
+        """
+        for input_data in tqdm(dataset, total=total, desc="Statistics collection", disable=not show_progress):
             outputs = engine.infer(input_data)
             processed_outputs = self._process_outputs(outputs)
-            self._register_statistics(processed_outputs, merged_statistics)
+            self._register_statistics(processed_outputs, statistic_points)
+
+    def _create_engine(self, model: TModel) -> Engine:
+        """
+        Creates the engine to infer the model with extra outputs.
+
+        :param model: Backend-specific model with extra outputs.
+        :return: Engine to infer the model.
+        """
+        return EngineFactory.create(model)
 
     def register_statistic_points(self, statistic_points: StatisticPointsContainer) -> None:
         """
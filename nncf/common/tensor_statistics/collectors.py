@@ -19,6 +19,8 @@ import numpy as np
 from nncf.common.tensor import NNCFTensor
 from nncf.common.tensor import TensorElementsType
 from nncf.common.tensor import TensorType
+from nncf.common.tensor_statistics.histogram import DEFAULT_NUM_HISTOGRAM_BINS
+from nncf.common.tensor_statistics.histogram import PerChannelHistogram
 from nncf.common.tensor_statistics.reduction import get_per_channel_history
 
 ReductionShape = Tuple[int]
@@ -44,6 +46,10 @@ class TensorStatisticCollectorBase(ABC):
     def num_samples(self) -> int:
         return self._num_samples
 
+    @num_samples.setter
+    def num_samples(self, num_samples: Optional[int]) -> None:
+        self._num_samples = num_samples
+
     def register_input(self, x: TensorType) -> TensorType:
         """Registers input tensor"""
         if not self._enabled:
@@ -89,6 +95,37 @@ class TensorStatisticCollectorBase(ABC):
         return self._collected_samples
 
 
+class MergeableTensorStatisticCollector(TensorStatisticCollectorBase):
+    """
+    Base class for collectors whose statistics collected on different parts of a dataset could be merged,
+    e.g. to combine the statistics collected by several processes on consecutive parts of the dataset.
+    """
+
+    def merge(self, other: "MergeableTensorStatisticCollector") -> None:
+        """
+        Merges the statistics collected by the other collector of the same type into this collector.
+        The statistics of the other collector are considered to be collected after the statistics of this one.
+
+        :param other: Collector of the same type and with the same parameters as this one.
+        """
+        if type(other) is not type(self):
+            raise RuntimeError(f"Collector {other} could not be merged into a collector of a different type {self}")
+        if other.collected_samples() == 0:
+            return
+        self._merge(other)
+        self._collected_samples += other.collected_samples()
+        if self._num_samples is not None:
+            self._collected_samples = min(self._collected_samples, self._num_samples)
+
+    @abstractmethod
+    def _merge(self, other: "MergeableTensorStatisticCollector") -> None:
+        """
+        Merges the statistics of the other non-empty collector of the same type into this collector.
+
+        :param other: Collector of the same type and with the same parameters as this one.
+        """
+
+
 class StatisticsNotCollectedError(Exception):
     """Raised when the statistics are not collected but requested."""
 
@@ -289,6 +326,26 @@ class NNCFCollectorTensorProcessor(ABC):
         :return: Reduced NNCFTensor.
         """
 
+    @staticmethod
+    @abstractmethod
+    def to_numpy(x: NNCFTensor) -> np.ndarray:
+        """
+        Converts NNCFTensor to a numpy array located on the host.
+
+        :param x: NNCFTensor to convert.
+        :return: Numpy array with the values of the NNCFTensor.
+        """
+
+    @staticmethod
+    @abstractmethod
+    def from_numpy(x: np.ndarray) -> NNCFTensor:
+        """
+        Converts a numpy array to NNCFTensor.
+
+        :param x: Numpy array to convert.
+        :return: NNCFTensor with the values of the numpy array.
+        """
+
     @classmethod
     @abstractmethod
     def no_outliers_map(cls, x: NNCFTensor, fn: MaskedReduceFN, axis: int = 0, alpha: float = 0.01) -> NNCFTensor:
@@ -306,7 +363,7 @@ class NNCFCollectorTensorProcessor(ABC):
         """
 
 
-class MinMaxStatisticCollector(OnlineTensorStatisticCollector):
+class MinMaxStatisticCollector(OnlineTensorStatisticCollector, MergeableTensorStatisticCollector):
     """Collector estimates min of minimum values and max of maximum values."""
 
     def __init__(self, use_abs_max: bool, reduction_shape: ReductionShape, num_samples: int = None):
@@ -338,12 +395,20 @@ class MinMaxStatisticCollector(OnlineTensorStatisticCollector):
         else:
             self._max_values = self._tensor_processor.max(max_reduced, self._max_values)
 
+    def _merge(self, other: "MinMaxStatisticCollector") -> None:
+        if self._collected_samples == 0:
+            self._min_values = other._min_values
+            self._max_values = other._max_values
+        else:
+            self._min_values = self._tensor_processor.min(other._min_values, self._min_values)
+            self._max_values = self._tensor_processor.max(other._max_values, self._max_values)
+
     def _reset(self):
         self._min_values = None
         self._max_values = None
 
 
-class MinMaxOfflineStatisticCollectorBase(OfflineTensorStatisticCollector):
+class MinMaxOfflineStatisticCollectorBase(OfflineTensorStatisticCollector, MergeableTensorStatisticCollector):
     """
     Base class for collectors that aggregate statistics
     from minimum and maximum values of tensors.
@@ -391,6 +456,10 @@ class MinMaxOfflineStatisticCollectorBase(OfflineTensorStatisticCollector):
     def _max_aggregate(self):
         pass
 
+    def _merge(self, other: "MinMaxOfflineStatisticCollectorBase") -> None:
+        self._all_min_values.extend(other._all_min_values)
+        self._all_max_values.extend(other._all_max_values)
+
     def _reset(self):
         self._all_min_values.clear()
         self._all_max_values.clear()
@@ -442,7 +511,7 @@ class MeanMinMaxStatisticCollector(MinMaxOfflineStatisticCollectorBase):
         return self._tensor_processor.mean(stacked_max, axis=0)
 
 
-class MeanStatisticCollector(OfflineTensorStatisticCollector):
+class MeanStatisticCollector(OfflineTensorStatisticCollector, MergeableTensorStatisticCollector):
     """
     Collector that aggregates statistics as mean along a pre-assigned axis.
     """
@@ -474,6 +543,10 @@ class MeanStatisticCollector(OfflineTensorStatisticCollector):
             self._all_values.append(self._tensor_processor.mean_per_channel(x, self._reduction_shape))
         self._all_shapes.append(x.shape)
 
+    def _merge(self, other: "MeanStatisticCollector") -> None:
+        self._all_values.extend(other._all_values)
+        self._all_shapes.extend(other._all_shapes)
+
     def _reset(self):
         self._all_values.clear()
         self._all_shapes.clear()
@@ -486,7 +559,7 @@ class MeanStatisticCollector(OfflineTensorStatisticCollector):
         return self._all_shapes[0]
 
 
-class BatchStatisticCollector(OfflineTensorStatisticCollector):
+class BatchStatisticCollector(OfflineTensorStatisticCollector, MergeableTensorStatisticCollector):
     """
     Collects tensor samples, where each tensor is averaged along the batch axis (and only that axis).
     Each sample stays available for usage in further stages of the algorithm.
@@ -509,6 +582,11 @@ class BatchStatisticCollector(OfflineTensorStatisticCollector):
     def _register_input_common(self, x: NNCFTensor):
         self._all_values.append(self._tensor_processor.batch_mean(x).tensor)
 
+    def _merge(self, other: "BatchStatisticCollector") -> None:
+        self._all_values.extend(other._all_values)
+        if self._num_samples is not None:
+            self._all_values = self._all_values[: self._num_samples]
+
     def _reset(self):
         self._all_values.clear()
 
@@ -554,6 +632,75 @@ class PercentileStatisticCollector(OfflineTensorStatisticCollector):
         return percentile_vs_values_dict
 
 
+class HistogramStatisticCollectorBase(OnlineTensorStatisticCollector):
+    """
+    Base class for collectors that estimate statistics of all data history by the per-channel histograms
+    of the observed values, so the memory consumption does not depend on the number of collected samples.
+    """
+
+    def __init__(
+        self,
+        reduction_shape: Optional[ReductionShape] = None,
+        num_samples: int = None,
+        num_bins: int = DEFAULT_NUM_HISTOGRAM_BINS,
+    ):
+        super().__init__(reduction_shape, num_samples)
+        self._num_bins = num_bins
+        self._histogram = None
+
+    def _register_input_common(self, per_channel_values: np.ndarray, mask: Optional[np.ndarray] = None):
+        """
+        :param per_channel_values: Observed values of shape [channel_count, N].
+        :param mask: Mask of the values to register, all the values are registered if the mask is None.
+        """
+        if self._histogram is None:
+            self._histogram = PerChannelHistogram(per_channel_values.shape[0], self._num_bins)
+        self._histogram.update(per_channel_values, mask)
+
+    def _reset(self):
+        self._histogram = None
+
+
+class HistogramMedianMADStatisticCollector(HistogramStatisticCollectorBase):
+    """
+    Collector estimates median and median absolute deviation (MAD) by the per-channel histograms.
+    """
+
+    def _register_input_common(self, per_channel_values: np.ndarray, mask: Optional[np.ndarray] = None):
+        # For post-RELU quantizers exact zeros may prevail and lead to zero mean and MAD - discard them
+        non_zero_mask = per_channel_values != 0
+        if mask is not None:
+            non_zero_mask &= mask
+        super()._register_input_common(per_channel_values, non_zero_mask)
+
+    def _prepare_statistics(self):
+        numpy_median = self._histogram.quantile(0.5)
+        numpy_mad = self._histogram.median_absolute_deviation(numpy_median)
+        return numpy_median, numpy_mad
+
+
+class HistogramPercentileStatisticCollector(HistogramStatisticCollectorBase):
+    """
+    Collector estimates percentile values of all data history by the per-channel histograms.
+    """
+
+    def __init__(
+        self,
+        percentiles_to_collect: List[float],
+        reduction_shape: Optional[ReductionShape] = None,
+        num_samples: int = None,
+        num_bins: int = DEFAULT_NUM_HISTOGRAM_BINS,
+    ):
+        super().__init__(reduction_shape, num_samples, num_bins)
+        self._percentiles_to_collect = percentiles_to_collect
+
+    def _prepare_statistics(self):
+        percentile_vs_values_dict = {}
+        for pc in self._percentiles_to_collect:
+            percentile_vs_values_dict[pc] = self._histogram.quantile(pc / 100)
+        return percentile_vs_values_dict
+
+
 class MeanPercentileStatisticCollector(OfflineTensorStatisticCollector):
     """
     Collector estimates percentile values per step and then averages the results.
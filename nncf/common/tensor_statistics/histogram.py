@@ -0,0 +1,212 @@
+# Copyright (c) 2023 Intel Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, Optional
+
+import numpy as np
+
+DEFAULT_NUM_HISTOGRAM_BINS = 2048
+
+
+class PerChannelHistogram:
+    """
+    Histograms of the values of each channel with the fixed number of bins of equal width.
+
+    The range of the histogram of each channel is adapted to the registered values: when the new values do not fit
+    into the current range, the range is extended by merging each group of the adjacent bins into a single bin, so
+    the bin borders stay aligned and the bin counts are not redistributed approximately. The memory consumption
+    does not depend on the number of registered values, and the estimation error of the quantiles does not exceed
+    the width of a single bin.
+    """
+
+    def __init__(self, num_channels: int, num_bins: int = DEFAULT_NUM_HISTOGRAM_BINS):
+        """
+        :param num_channels: Number of channels.
+        :param num_bins: Number of the histogram bins per channel.
+        """
+        self._num_channels = num_channels
+        self._num_bins = num_bins
+        self._counts = np.zeros((num_channels, num_bins), dtype=np.float64)
+        self._lower = np.zeros(num_channels, dtype=np.float64)
+        self._bin_width = np.ones(num_channels, dtype=np.float64)
+        self._is_initialized = np.zeros(num_channels, dtype=bool)
+
+    @property
+    def num_bins(self) -> int:
+        return self._num_bins
+
+    def update(self, per_channel_values: np.ndarray, mask: Optional[np.ndarray] = None) -> None:
+        """
+        Registers the values in the histograms.
+
+        :param per_channel_values: Values of shape [num_channels, N].
+        :param mask: Boolean mask of the same shape as the values, only the values with True mask are registered.
+            All the values are registered if the mask is None.
+        """
+        values = per_channel_values.astype(np.float64)
+        weights = np.ones(values.shape) if mask is None else mask.astype(np.float64)
+        self._update(values, weights)
+
+    def merge(self, other: "PerChannelHistogram") -> None:
+        """
+        Registers the values of the other histogram with the same number of channels in this histogram.
+        The channels that have no registered values in this histogram are copied as is, otherwise the counts
+        of the other histogram are registered at the bin centers.
+
+        :param other: Histogram to merge.
+        """
+        if other._num_channels != self._num_channels:
+            raise ValueError(
+                f"Histogram with {other._num_channels} channels could not be merged "
+                f"into the histogram with {self._num_channels} channels"
+            )
+        copied = other._is_initialized & ~self._is_initialized
+        if other._num_bins == self._num_bins:
+            self._counts[copied] = other._counts[copied]
+            self._lower[copied] = other._lower[copied]
+            self._bin_width[copied] = other._bin_width[copied]
+            self._is_initialized |= copied
+        else:
+            copied[:] = False
+        bin_centers = other._lower[:, None] + other._bin_width[:, None] * (np.arange(other._num_bins) + 0.5)
+        self._update(bin_centers, np.where(copied[:, None], 0.0, other._counts))
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        :return: Arrays that define the histograms.
+        """
+        return {
+            "counts": self._counts,
+            "lower": self._lower,
+            "bin_width": self._bin_width,
+            "is_initialized": self._is_initialized,
+        }
+
+    def load_state(self, state: Dict[str, np.ndarray]) -> None:
+        """
+        Loads the histograms returned by `get_state`.
+
+        :param state: Arrays that define the histograms.
+        """
+        self._counts = np.array(state["counts"], dtype=np.float64)
+        self._num_channels, self._num_bins = self._counts.shape
+        self._lower = np.array(state["lower"], dtype=np.float64)
+        self._bin_width = np.array(state["bin_width"], dtype=np.float64)
+        self._is_initialized = np.array(state["is_initialized"], dtype=bool)
+
+    def _update(self, values: np.ndarray, weights: np.ndarray) -> None:
+        mask = weights > 0
+        has_values = mask.any(axis=1)
+        if not has_values.any():
+            return
+        values_min = np.where(mask, values, np.inf).min(axis=1)
+        values_max = np.where(mask, values, -np.inf).max(axis=1)
+
+        self._init_new_channels(has_values & ~self._is_initialized, values_min, values_max)
+        self._extend_ranges(has_values & self._is_initialized, values_min, values_max)
+        self._is_initialized |= has_values
+
+        bin_indices = np.floor((values - self._lower[:, None]) / self._bin_width[:, None])
+        bin_indices = np.clip(np.nan_to_num(bin_indices), 0, self._num_bins - 1).astype(np.int64)
+        flat_indices = bin_indices + self._num_bins * np.arange(self._num_channels)[:, None]
+        self._counts += np.bincount(
+            flat_indices.ravel(), weights=weights.ravel(), minlength=self._counts.size
+        ).reshape(self._counts.shape)
+
+    def quantile(self, q: float) -> np.ndarray:
+        """
+        Estimates the quantile of the registered values of each channel by the linear interpolation
+        inside the bin the quantile falls into.
+
+        :param q: Quantile to compute, which must be between 0 and 1 inclusive.
+        :return: Quantiles of shape [num_channels], NaN for the channels without the registered values.
+        """
+        bin_edges = self._lower[:, None] + self._bin_width[:, None] * np.arange(self._num_bins)
+        return self._weighted_quantile(bin_edges, self._bin_width[:, None], self._counts, q)
+
+    def median_absolute_deviation(self, median: np.ndarray) -> np.ndarray:
+        """
+        Estimates the median absolute deviation of the registered values of each channel from the given median.
+        All the values of a bin are assumed to be located at the bin center.
+
+        :param median: Medians of shape [num_channels].
+        :return: Median absolute deviations of shape [num_channels], NaN for the channels without
+            the registered values.
+        """
+        bin_centers = self._lower[:, None] + self._bin_width[:, None] * (np.arange(self._num_bins) + 0.5)
+        deviations = np.abs(bin_centers - median[:, None])
+        order = np.argsort(deviations, axis=1)
+        sorted_deviations = np.take_along_axis(deviations, order, axis=1)
+        sorted_counts = np.take_along_axis(self._counts, order, axis=1)
+        return self._weighted_quantile(sorted_deviations, 0.0, sorted_counts, 0.5)
+
+    def _init_new_channels(self, channels: np.ndarray, values_min: np.ndarray, values_max: np.ndarray) -> None:
+        self._lower[channels] = values_min[channels]
+        bin_width = (values_max[channels] - values_min[channels]) / self._num_bins
+        # A non-zero width is required to extend the range of the channels with the constant values later
+        min_width = np.finfo(np.float32).eps * np.maximum(np.abs(values_min[channels]), 1.0)
+        self._bin_width[channels] = np.maximum(bin_width, min_width)
+
+    def _extend_ranges(self, channels: np.ndarray, values_min: np.ndarray, values_max: np.ndarray) -> None:
+        upper = self._lower + self._bin_width * self._num_bins
+        channels = channels & ((values_min < self._lower) | (values_max >= upper))
+        if not channels.any():
+            return
+        # Indices of the current bins that bound the registered and the new values
+        is_nonempty = self._counts > 0
+        first_bin = np.argmax(is_nonempty, axis=1)
+        last_bin = self._num_bins - 1 - np.argmax(is_nonempty[:, ::-1], axis=1)
+        with np.errstate(invalid="ignore"):
+            values_first_bin = np.floor((values_min - self._lower) / self._bin_width)
+            values_last_bin = np.floor((values_max - self._lower) / self._bin_width)
+        first_bin = np.where(channels, np.minimum(first_bin, values_first_bin), 0)
+        last_bin = np.where(channels, np.maximum(last_bin, values_last_bin), 0)
+        first_bin = first_bin.astype(np.int64)
+        last_bin = last_bin.astype(np.int64)
+        # Number of the current bins to merge into a single new bin
+        merge_factor = np.where(channels, -(-(last_bin - first_bin + 1) // self._num_bins), 1)
+
+        new_bin_indices = (np.arange(self._num_bins) - first_bin[:, None]) // merge_factor[:, None]
+        new_bin_indices = np.clip(new_bin_indices, 0, self._num_bins - 1)
+        flat_indices = new_bin_indices + self._num_bins * np.arange(self._num_channels)[:, None]
+        self._counts = np.bincount(
+            flat_indices.ravel(), weights=self._counts.ravel(), minlength=self._counts.size
+        ).reshape(self._counts.shape)
+        self._lower = self._lower + first_bin * self._bin_width
+        self._bin_width = self._bin_width * merge_factor
+
+    @staticmethod
+    def _weighted_quantile(
+        bin_starts: np.ndarray, bin_widths: np.ndarray, counts: np.ndarray, q: float
+    ) -> np.ndarray:
+        total_counts = counts.sum(axis=1)
+        cumulative_counts = np.cumsum(counts, axis=1)
+        bin_widths = np.broadcast_to(bin_widths, bin_starts.shape)
+
+        def get_sorted_value(index: np.ndarray) -> np.ndarray:
+            bin_indices = (cumulative_counts <= index[:, None]).sum(axis=1)
+            bin_indices = np.minimum(bin_indices, counts.shape[1] - 1)[:, None]
+            bin_counts = np.take_along_axis(counts, bin_indices, axis=1)[:, 0]
+            preceding_counts = np.take_along_axis(cumulative_counts, bin_indices, axis=1)[:, 0] - bin_counts
+            # The values of a bin are assumed to be evenly distributed inside the bin
+            fraction = np.clip((index - preceding_counts + 0.5) / np.maximum(bin_counts, 1), 0.0, 1.0)
+            bin_start = np.take_along_axis(bin_starts, bin_indices, axis=1)[:, 0]
+            bin_width = np.take_along_axis(bin_widths, bin_indices, axis=1)[:, 0]
+            return bin_start + fraction * bin_width
+
+        # The quantile is interpolated between the adjacent sorted values like in np.quantile
+        max_index = np.maximum(total_counts - 1, 0)
+        index = q * max_index
+        lower_index = np.floor(index)
+        lower_value = get_sorted_value(lower_index)
+        upper_value = get_sorted_value(np.minimum(lower_index + 1, max_index))
+        quantile = lower_value + (index - lower_index) * (upper_value - lower_value)
+        return np.where(total_counts > 0, quantile, np.nan)
@@ -37,6 +37,16 @@ def split_into_channels(input_: np.ndarray, scale_shape: List[int]) -> List[np.n
     return ret_list
 
 
+def get_per_channel_values(input_: np.ndarray, scale_shape: List[int]) -> np.ndarray:
+    """
+    :param input_: Input tensor.
+    :param scale_shape: Shape of the statistics to collect.
+    :return: Values of the input tensor of shape [channel_count, N].
+    """
+    channel_count, channel_dim_idx = get_channel_count_and_dim_idx(scale_shape)
+    return np.moveaxis(input_, channel_dim_idx, 0).reshape(channel_count, -1)
+
+
 def get_per_channel_history(raw_input_history: deque, scale_shape: List[int], discard_zeros=False) -> List:
     channel_count, _ = get_channel_count_and_dim_idx(scale_shape)
     per_channel_history = [None for i in range(channel_count)]
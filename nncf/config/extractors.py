@@ -178,6 +178,8 @@ def get_bn_adapt_algo_kwargs(nncf_config: NNCFConfig, params: Dict[str, Any]) ->
         "num_bn_adaptation_samples": num_bn_adaptation_samples,
         "data_loader": args.data_loader,
         "device": args.device,
+        "cache_batches": params.get("cache_batches", False),
+        "bn_only_forward": params.get("bn_only_forward", False),
     }
     return params
 
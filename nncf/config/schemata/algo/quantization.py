@@ -27,6 +27,7 @@ from nncf.config.schemata.defaults import AUTOQ_WARMUP_ITER_NUMBER
 from nncf.config.schemata.defaults import HAWQ_DUMP_INIT_PRECISION_DATA
 from nncf.config.schemata.defaults import HAWQ_ITER_NUMBER
 from nncf.config.schemata.defaults import HAWQ_NUM_DATA_POINTS
+from nncf.config.schemata.defaults import HAWQ_NUM_PROBES
 from nncf.config.schemata.defaults import HAWQ_TOLERANCE
 from nncf.config.schemata.defaults import LR_POLY_DURATION_EPOCHS
 from nncf.config.schemata.defaults import MAX_PERCENTILE
@@ -152,6 +153,13 @@ BASIC_RANGE_INIT_CONFIG_PROPERTIES = {
                     "value for the quantizer input maximum.",
                     default=MAX_PERCENTILE,
                 ),
+                "num_histogram_bins": with_attributes(
+                    NUMBER,
+                    description="For 'threesigma' and 'percentile' types - if specified, the statistics are "
+                    "estimated in bounded memory by the per-channel histograms of the observed values "
+                    "with the specified number of bins instead of storing all the observed values. "
+                    "The estimation error does not exceed the width of a single histogram bin.",
+                ),
             },
         },
     },
@@ -253,6 +261,20 @@ PRECISION_INITIALIZER_SCHEMA = {
             "from the previous iteration and the current one.",
             default=HAWQ_TOLERANCE,
         ),
+        "num_probes": with_attributes(
+            NUMBER,
+            description="Number of random vectors evaluated on each iteration of Hutchinson algorithm. "
+            "The gradients are computed once per data batch for all of them, which reduces the number of "
+            "forward and backward passes needed for the estimation to converge.",
+            default=HAWQ_NUM_PROBES,
+        ),
+        "confidence_level": with_attributes(
+            NUMBER,
+            description="If specified, Hutchinson algorithm is stopped once the half-width of the confidence "
+            "interval of the average Hessian trace at this level (e.g. 0.95) is less than `tolerance` "
+            "relative to the average trace, instead of comparing the average traces of the consecutive "
+            "iterations.",
+        ),
         "compression_ratio": with_attributes(
             NUMBER,
             description="For the `hawq` mode:\n"
@@ -327,6 +349,19 @@ PRECISION_INITIALIZER_SCHEMA = {
             default=HAWQ_DUMP_INIT_PRECISION_DATA,
         ),
         "bitwidth_assignment_mode": BITWIDTH_ASSIGNMENT_MODE_SCHEMA,
+        "search_algorithm": {
+            "type": "string",
+            "enum": ["exhaustive", "dynamic_programming"],
+            "default": "exhaustive",
+            "description": "For the `hawq` mode:\n"
+            "The algorithm of search for the weight bitwidths. The 'exhaustive' algorithm evaluates all bitwidth "
+            "sequences that do not decrease with the average Hessian traces of the layers. The "
+            "'dynamic_programming' one finds the bitwidths with the minimal HAWQ metric among all bitwidth "
+            "sequences satisfying the compression ratio. It keeps only the Pareto-optimal partial solutions, so "
+            "it's usually much faster than the exhaustive one and preferable for large models and for more than 2 "
+            "candidate bitwidths, though its time depends on the number of distinct bit complexities and is not "
+            "polynomial in the worst case.",
+        },
     },
     "additionalProperties": False,
 }
@@ -9,6 +9,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from nncf.config.definitions import ONLINE_DOCS_ROOT
+from nncf.config.schemata.basic import BOOLEAN
 from nncf.config.schemata.basic import NUMBER
 from nncf.config.schemata.basic import with_attributes
 from nncf.config.schemata.defaults import NUM_BN_ADAPTATION_SAMPLES
@@ -31,7 +32,22 @@ BATCHNORM_ADAPTATION_SCHEMA = {
             "be a closest multiple of the batch "
             "size. Set this to 0 to disable BN adaptation.",
             default=NUM_BN_ADAPTATION_SAMPLES,
-        )
+        ),
+        "cache_batches": with_attributes(
+            BOOLEAN,
+            description="If set to True, the batches for the BatchNorm statistics adaptation are loaded "
+            "from the data loader once and are kept in the memory of the initialization device. "
+            "The same batches are used when the adaptation is repeated, e.g. for each evaluated "
+            "subnetwork in BootstrapNAS or on each compression level change in magnitude sparsity "
+            "and filter pruning.",
+            default=False,
+        ),
+        "bn_only_forward": with_attributes(
+            BOOLEAN,
+            description="If set to True, the forward pass of the model during the BatchNorm statistics "
+            "adaptation is stopped after the last BatchNorm layer. Supported only for PyTorch.",
+            default=False,
+        ),
     },
     "additionalProperties": False,
 }
@@ -20,6 +20,7 @@ PRECISION_INIT_BITWIDTHS = [2, 4, 8]
 HAWQ_NUM_DATA_POINTS = 100
 HAWQ_ITER_NUMBER = 200
 HAWQ_TOLERANCE = 1e-4
+HAWQ_NUM_PROBES = 1
 HAWQ_COMPRESSION_RATIO = 1.5
 HAWQ_DUMP_INIT_PRECISION_DATA = False
 
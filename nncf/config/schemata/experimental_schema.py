@@ -294,6 +294,17 @@ BOOTSTRAP_NAS_SEARCH_SCHEMA = {
             description="Defines the reference accuracy from the pre-trained model used "
             "to generate the super-network.",
         ),
+        "num_workers": with_attributes(
+            NUMBER,
+            description="Defines the number of subnetworks whose accuracy is evaluated concurrently "
+            "on the replicas of the super-network. Each replica holds a copy of the super-network weights.",
+        ),
+        "efficiency_lookup_table": with_attributes(
+            BOOLEAN,
+            description="If set to True, the efficiency of the subnetworks is approximated by the sum of "
+            "the costs of the elastic values of each design variable and of the pairs of design variables "
+            "that change the same layer, which are measured once around the maximum subnetwork before the search.",
+        ),
     },
     "additionalProperties": False,
 }
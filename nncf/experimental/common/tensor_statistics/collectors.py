@@ -9,16 +9,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 from abc import ABC
 from abc import abstractmethod
 from collections import defaultdict
 from collections import deque
 from typing import Any, Dict, List, Optional, Set, Tuple, TypeVar, Union
 
+import numpy as np
+
 from nncf.common.tensor import TensorType
 from nncf.common.tensor_statistics.collectors import NNCFCollectorTensorProcessor
 from nncf.common.tensor_statistics.collectors import NNCFTensor
 from nncf.common.tensor_statistics.collectors import ReductionShape
+from nncf.common.tensor_statistics.histogram import DEFAULT_NUM_HISTOGRAM_BINS
+from nncf.common.tensor_statistics.histogram import PerChannelHistogram
 from nncf.common.tensor_statistics.statistics import TensorStatistic
 from nncf.quantization.advanced_parameters import AggregatorType
 
@@ -131,8 +136,20 @@ class TensorAggregatorBase:
     def num_samples(self) -> int:
         return self._num_samples
 
+    @num_samples.setter
+    def num_samples(self, num_samples: Optional[int]) -> None:
+        self._num_samples = num_samples
+
+    @property
+    def is_full(self) -> bool:
+        """
+        :return: True if the aggregator has already collected the maximum number of samples
+            and skips the registration of the new ones.
+        """
+        return self._num_samples is not None and self._collected_samples >= self._num_samples
+
     def register_reduced_input(self, x: TensorType):
-        if self._num_samples is not None and self._collected_samples >= self._num_samples:
+        if self.is_full:
             return
         self._register_reduced_input_impl(x)
         self._collected_samples += 1
@@ -153,6 +170,87 @@ class TensorAggregatorBase:
         :retunr: Aggregated result.
         """
 
+    def merge(self, other: "TensorAggregatorBase") -> None:
+        """
+        Merges the tensors registered in the other aggregator into this aggregator, e.g. to combine the statistics
+        collected by several processes on different parts of a dataset. The number of the collected samples
+        never exceeds num_samples after the merge.
+
+        :param other: Aggregator equal to this one.
+        """
+        if self != other:
+            raise RuntimeError(f"Aggregator {other} could not be merged into a different aggregator {self}")
+        if other._collected_samples == 0:
+            return
+        self._merge_impl(other)
+        self._collected_samples += other._collected_samples
+        if self._num_samples is not None:
+            self._collected_samples = min(self._collected_samples, self._num_samples)
+
+    @abstractmethod
+    def _merge_impl(self, other: "TensorAggregatorBase") -> None:
+        """
+        Merges the non-empty container of the other aggregator into the container of this aggregator.
+
+        :param other: Aggregator equal to this one.
+        """
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the aggregator that consists of numpy arrays and Python numbers only.
+        The state could be loaded to an equal aggregator, e.g. to resume the statistics collection
+        or to merge the statistics collected in another process.
+
+        :return: State of the aggregator.
+        """
+        state = {"collected_samples": self._collected_samples}
+        if self._collected_samples > 0:
+            state.update(self._get_container_state())
+        return state
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """
+        Loads the state returned by `get_state` of an equal aggregator.
+        The tensors registered in this aggregator before are discarded.
+
+        :param state: State of the aggregator.
+        """
+        self.reset()
+        self._collected_samples = int(state["collected_samples"])
+        if self._collected_samples > 0:
+            self._load_container_state(state)
+
+    def serialize(self) -> bytes:
+        """
+        :return: State of the aggregator in the binary numpy .npz format.
+        """
+        buffer = io.BytesIO()
+        np.savez(buffer, **self.get_state())
+        return buffer.getvalue()
+
+    def deserialize(self, data: bytes) -> None:
+        """
+        Loads the state of an equal aggregator returned by `serialize`.
+
+        :param data: State of the aggregator in the binary numpy .npz format.
+        """
+        with np.load(io.BytesIO(data), allow_pickle=False) as state:
+            self.load_state({key: state[key] for key in state.files})
+
+    @abstractmethod
+    def _get_container_state(self) -> Dict[str, np.ndarray]:
+        """
+        :return: Numpy arrays that define the non-empty container.
+        """
+
+    @abstractmethod
+    def _load_container_state(self, state: Dict[str, np.ndarray]) -> None:
+        """
+        Restores the container from the numpy arrays returned by `_get_container_state`.
+
+        :param state: Numpy arrays that define the container.
+        """
+
     def reset(self):
         self._collected_samples = 0
         self._container = []
@@ -258,9 +356,15 @@ class TensorCollector:
         if not self._enabled:
             return
 
+        # Reducers whose outputs are not required by any aggregator anymore are skipped
+        required_reducer_hashes = {
+            reducer_hash for (reducer_hash, _, _), aggregator in self._aggregators.items() if not aggregator.is_full
+        }
         reduced_inputs = {}
         for reducer in self._reducers:
             reducer_hash = hash(reducer)
+            if reducer_hash not in required_reducer_hashes:
+                continue
             input_ = inputs[reducer_hash]
             if any([tensor.is_empty() for tensor in input_]):
                 continue
@@ -338,6 +442,38 @@ class TensorCollector:
         for aggregator in self._aggregators.values():
             aggregator.reset()
 
+    def merge(self, other: "TensorCollector") -> None:
+        """
+        Merges the statistics collected by the other tensor collector with the same statistic branches
+        into this tensor collector. Aggregators are matched by the order of the statistic branches registration.
+
+        :param other: TensorCollector instance to merge.
+        """
+        if len(self._aggregators) != len(other.aggregators):
+            raise RuntimeError("Tensor collectors with different statistic branches could not be merged")
+        for aggregator, other_aggregator in zip(self._aggregators.values(), other.aggregators.values()):
+            aggregator.merge(other_aggregator)
+
+    def get_state(self) -> List[Dict[str, Any]]:
+        """
+        Returns the states of the aggregators in the order of the statistic branches registration.
+
+        :return: States of the aggregators.
+        """
+        return [aggregator.get_state() for aggregator in self._aggregators.values()]
+
+    def load_state(self, state: List[Dict[str, Any]]) -> None:
+        """
+        Loads the states of the aggregators returned by `get_state` of the tensor collector
+        with the same statistic branches.
+
+        :param state: States of the aggregators.
+        """
+        if len(self._aggregators) != len(state):
+            raise RuntimeError("State of a tensor collector with different statistic branches could not be loaded")
+        for aggregator, aggregator_state in zip(self._aggregators.values(), state):
+            aggregator.load_state(aggregator_state)
+
     @staticmethod
     def get_tensor_collector_inputs(
         outputs: Dict[str, NNCFTensor], output_info: List[Tuple[int, List[str]]]
@@ -491,12 +627,30 @@ class MeanPerChReducer(TensorReducerBase):
 
 
 class NoopAggregator(TensorAggregatorBase):
-    def __init__(self, num_samples: Optional[int]):
-        super().__init__(None, num_samples)
+    def __init__(self, tensor_processor: NNCFCollectorTensorProcessor, num_samples: Optional[int]):
+        super().__init__(tensor_processor, num_samples)
 
     def _register_reduced_input_impl(self, x: TensorType) -> None:
         self._container.append(x.tensor)
 
+    def _merge_impl(self, other: TensorAggregatorBase) -> None:
+        self._container.extend(other._container)
+        if self._num_samples is not None:
+            self._container = self._container[: self._num_samples]
+
+    def _get_container_state(self) -> Dict[str, np.ndarray]:
+        # The registered tensors could have different shapes, so they are stored separately
+        return {
+            f"container_{idx}": self._tensor_processor.to_numpy(NNCFTensor(tensor))
+            for idx, tensor in enumerate(self._container)
+        }
+
+    def _load_container_state(self, state: Dict[str, np.ndarray]) -> None:
+        idx = 0
+        while f"container_{idx}" in state:
+            self._container.append(self._tensor_processor.from_numpy(state[f"container_{idx}"]).tensor)
+            idx += 1
+
     def aggregate(self):
         return self._container
 
@@ -506,10 +660,20 @@ class ShapeAggregator(TensorAggregatorBase):
         super().__init__(None, 1)
 
     def _register_reduced_input_impl(self, x: TensorType) -> None:
-        self._container = x
+        self._container = x.shape
+
+    def _merge_impl(self, other: TensorAggregatorBase) -> None:
+        if self._collected_samples == 0:
+            self._container = other._container
+
+    def _get_container_state(self) -> Dict[str, np.ndarray]:
+        return {"container": np.array(self._container, dtype=np.int64)}
+
+    def _load_container_state(self, state: Dict[str, np.ndarray]) -> None:
+        self._container = tuple(int(dim) for dim in state["container"])
 
     def aggregate(self):
-        return self._container.shape
+        return self._container
 
 
 class MinAggregator(TensorAggregatorBase):
@@ -519,6 +683,18 @@ class MinAggregator(TensorAggregatorBase):
         else:
             self._container = self._tensor_processor.min(x, self._container)
 
+    def _merge_impl(self, other: TensorAggregatorBase) -> None:
+        if self._collected_samples == 0:
+            self._container = other._container
+        else:
+            self._container = self._tensor_processor.min(other._container, self._container)
+
+    def _get_container_state(self) -> Dict[str, np.ndarray]:
+        return {"container": self._tensor_processor.to_numpy(self._container)}
+
+    def _load_container_state(self, state: Dict[str, np.ndarray]) -> None:
+        self._container = self._tensor_processor.from_numpy(state["container"])
+
     def aggregate(self):
         return self._container.tensor
 
@@ -530,6 +706,18 @@ class MaxAggregator(TensorAggregatorBase):
         else:
             self._container = self._tensor_processor.max(x, self._container)
 
+    def _merge_impl(self, other: TensorAggregatorBase) -> None:
+        if self._collected_samples == 0:
+            self._container = other._container
+        else:
+            self._container = self._tensor_processor.max(other._container, self._container)
+
+    def _get_container_state(self) -> Dict[str, np.ndarray]:
+        return {"container": self._tensor_processor.to_numpy(self._container)}
+
+    def _load_container_state(self, state: Dict[str, np.ndarray]) -> None:
+        self._container = self._tensor_processor.from_numpy(state["container"])
+
     def aggregate(self):
         return self._container.tensor
 
@@ -549,14 +737,76 @@ class OfflineAggregatorBase(TensorAggregatorBase):
         else:
             self._container.append(x)
 
+    def _merge_impl(self, other: TensorAggregatorBase) -> None:
+        self._container.extend(other._container)
+
+    def _get_container_state(self) -> Dict[str, np.ndarray]:
+        return {"container": self._tensor_processor.to_numpy(self._tensor_processor.stack(self._container))}
+
+    def _load_container_state(self, state: Dict[str, np.ndarray]) -> None:
+        self._container.extend(self._tensor_processor.unstack(self._tensor_processor.from_numpy(state["container"])))
+
+    def reset(self):
+        super().reset()
+        self._container = deque(maxlen=self._window_size)
+
     def _aggregate(self, fn):
         stacked_val = self._tensor_processor.stack(self._container)
         return fn(stacked_val, axis=0, keepdims=False).tensor
 
 
 class MeanAggregator(OfflineAggregatorBase):
+    """
+    Aggregates the mean of the registered tensors. When the window size is not specified, only the sum
+    and the number of the registered tensors are stored instead of the tensors themselves.
+    """
+
+    def __init__(
+        self, tensor_processor, use_per_sample_stats: bool = False, num_samples: Optional[int] = None, window_size=None
+    ):
+        super().__init__(tensor_processor, use_per_sample_stats, num_samples, window_size)
+        self._sum = None
+        self._count = 0
+
+    def _register_reduced_input_impl(self, x: TensorType) -> None:
+        if self._window_size is not None:
+            super()._register_reduced_input_impl(x)
+        elif self._use_per_sample_stats and len(x.shape) > 0:
+            num_values = x.shape[0]
+            self._add(self._tensor_processor.mean(x, axis=0).tensor * num_values, num_values)
+        else:
+            self._add(x.tensor, 1)
+
+    def _add(self, values_sum: TensorType, count: int) -> None:
+        self._sum = values_sum if self._count == 0 else self._sum + values_sum
+        self._count += count
+
+    def _merge_impl(self, other: TensorAggregatorBase) -> None:
+        if self._window_size is not None:
+            super()._merge_impl(other)
+        else:
+            self._add(other._sum, other._count)
+
+    def _get_container_state(self) -> Dict[str, np.ndarray]:
+        if self._window_size is not None:
+            return super()._get_container_state()
+        return {"sum": self._tensor_processor.to_numpy(NNCFTensor(self._sum)), "count": self._count}
+
+    def _load_container_state(self, state: Dict[str, np.ndarray]) -> None:
+        if self._window_size is not None:
+            super()._load_container_state(state)
+        else:
+            self._add(self._tensor_processor.from_numpy(state["sum"]).tensor, int(state["count"]))
+
+    def reset(self):
+        super().reset()
+        self._sum = None
+        self._count = 0
+
     def aggregate(self):
-        return self._aggregate(self._tensor_processor.mean)
+        if self._window_size is not None:
+            return self._aggregate(self._tensor_processor.mean)
+        return self._sum / self._count
 
 
 class MedianAggregator(OfflineAggregatorBase):
@@ -564,6 +814,77 @@ class MedianAggregator(OfflineAggregatorBase):
         return self._aggregate(self._tensor_processor.median)
 
 
+class HistogramMedianAggregator(TensorAggregatorBase):
+    """
+    Estimates the median of the registered tensors by the histograms of the values of each tensor element.
+    Unlike MedianAggregator, the registered tensors are not stored, so the memory consumption does not depend
+    on the number of the registered tensors, and the histograms are merged with bounded loss of accuracy.
+    The estimation error is of the order of the histogram bin width.
+    """
+
+    def __init__(
+        self,
+        tensor_processor,
+        use_per_sample_stats: bool = False,
+        num_samples: Optional[int] = None,
+        num_bins: int = DEFAULT_NUM_HISTOGRAM_BINS,
+    ):
+        super().__init__(tensor_processor, num_samples)
+        self._use_per_sample_stats = use_per_sample_stats
+        self._num_bins = num_bins
+        self._shape = None
+        self._dtype = None
+
+    def _register_reduced_input_impl(self, x: TensorType) -> None:
+        values = self._tensor_processor.to_numpy(x)
+        if self._use_per_sample_stats and values.ndim > 0:
+            shape = values.shape[1:]
+            per_element_values = values.reshape(values.shape[0], -1).T
+        else:
+            shape = values.shape
+            per_element_values = values.reshape(-1, 1)
+        if self._shape is None:
+            self._init_histogram(shape, values.dtype)
+        self._container.update(per_element_values)
+
+    def _init_histogram(self, shape: Tuple[int, ...], dtype: np.dtype) -> None:
+        self._shape = tuple(shape)
+        self._dtype = dtype
+        self._container = PerChannelHistogram(int(np.prod(shape)), self._num_bins)
+
+    def _merge_impl(self, other: TensorAggregatorBase) -> None:
+        if self._shape is None:
+            self._init_histogram(other._shape, other._dtype)
+        self._container.merge(other._container)
+
+    def _get_container_state(self) -> Dict[str, np.ndarray]:
+        state = {f"histogram_{key}": value for key, value in self._container.get_state().items()}
+        state["shape"] = np.array(self._shape, dtype=np.int64)
+        state["dtype"] = np.array(self._dtype.str)
+        return state
+
+    def _load_container_state(self, state: Dict[str, np.ndarray]) -> None:
+        self._init_histogram(tuple(int(dim) for dim in state["shape"]), np.dtype(str(state["dtype"])))
+        prefix = "histogram_"
+        histogram_state = {key[len(prefix) :]: value for key, value in state.items() if key.startswith(prefix)}
+        self._container.load_state(histogram_state)
+
+    def reset(self):
+        super().reset()
+        self._shape = None
+        self._dtype = None
+
+    def aggregate(self):
+        median = self._container.quantile(0.5).reshape(self._shape).astype(self._dtype)
+        return self._tensor_processor.from_numpy(median).tensor
+
+    def __eq__(self, __o: object) -> bool:
+        return super().__eq__(__o) and self._num_bins == __o._num_bins
+
+    def __hash__(self) -> int:
+        return hash((self.__class__.__name__, self._num_bins))
+
+
 class NoOutliersAggregatorBase(OfflineAggregatorBase):
     def __init__(
         self,
@@ -305,3 +305,27 @@ class MultiElasticityHandler(ElasticityHandler):
                 sample[handler_id] = self.depth_search_space[x[index_pos]]
                 index_pos += 1
         return sample
+
+    def get_pymoo_from_config(self, config: SubnetConfig) -> List[int]:
+        """
+        Encodes the configuration of the sub-network as values of the design variables, i.e. it is an inverse of
+        `get_config_from_pymoo`.
+
+        :param config: elasticity configuration for the enabled elasticity dimensions.
+        :return: indexes of the elastic values in the search space for each design variable.
+        """
+        active_handlers = {dim: self._handlers[dim] for dim in self._handlers if self._is_handler_enabled_map[dim]}
+        x = []
+        for handler_id, _ in active_handlers.items():
+            if handler_id is ElasticityDim.KERNEL:
+                x += [
+                    self.kernel_search_space[j].index(kernel_size) for j, kernel_size in enumerate(config[handler_id])
+                ]
+            elif handler_id is ElasticityDim.WIDTH:
+                x += [
+                    self.width_search_space[key].index(config[handler_id][key])
+                    for key in range(len(self.width_search_space))
+                ]
+            elif handler_id is ElasticityDim.DEPTH:
+                x.append(self.depth_search_space.index(config[handler_id]))
+        return x
@@ -0,0 +1,190 @@
+# Copyright (c) 2023 Intel Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from itertools import combinations
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import numpy as np
+
+from nncf.common.logging import nncf_logger
+from nncf.experimental.torch.nas.bootstrapNAS.elasticity.multi_elasticity_handler import MultiElasticityHandler
+
+
+class EfficiencyLookupTable:
+    """
+    Precomputed costs of the elastic values of the design variables, e.g. MACs or latency measured on a target
+    device. The table is built around the reference sub-network, by default the maximum one. It holds the change
+    of the cost when a single design variable takes the corresponding value and, for each pair of the design
+    variables that change the same layer, the interaction of their values, i.e. the change of the cost when both
+    variables take the values minus the single changes. The cost of a sub-network is approximated by the sum of
+    these changes, so the whole population of the search algorithm is evaluated at once without activating
+    the sub-networks.
+
+    The approximation is exact for the costs that are sums of terms each depending on at most two design variables.
+    This is the case for MACs of the sub-networks with elastic width, where a layer contributes the product of its
+    input and output widths. The cost of a layer that depends on more variables, e.g. on the kernel size together
+    with both widths or on the depth of the block containing it, is approximated by the pairwise terms.
+    """
+
+    def __init__(
+        self,
+        reference_value: float,
+        deltas: np.ndarray,
+        pairs: Optional[np.ndarray] = None,
+        interactions: Optional[np.ndarray] = None,
+    ):
+        """
+        Initializes the lookup table.
+
+        :param reference_value: Cost of the reference sub-network.
+        :param deltas: Array of shape (number of design variables, maximum number of elastic values) with
+            the changes of the cost relative to the reference sub-network.
+        :param pairs: Array of shape (number of pairs, 2) with the indices of the interacting design variables.
+        :param interactions: Array of shape (number of pairs, maximum number of elastic values,
+            maximum number of elastic values) with the interactions of the values of the pairs.
+        """
+        self._reference_value = reference_value
+        self._deltas = deltas
+        num_values = deltas.shape[1]
+        self._pairs = np.zeros((0, 2), dtype=np.int64) if pairs is None else pairs
+        self._interactions = np.zeros((0, num_values, num_values)) if interactions is None else interactions
+
+    @property
+    def reference_value(self) -> float:
+        return self._reference_value
+
+    @property
+    def deltas(self) -> np.ndarray:
+        return self._deltas
+
+    @property
+    def pairs(self) -> np.ndarray:
+        return self._pairs
+
+    @property
+    def interactions(self) -> np.ndarray:
+        return self._interactions
+
+    @classmethod
+    def build(
+        cls,
+        multi_elasticity_handler: MultiElasticityHandler,
+        measure_fn: Callable[[], float],
+        reference_x: Optional[List[int]] = None,
+    ) -> "EfficiencyLookupTable":
+        """
+        Builds the lookup table by measuring the cost of the sub-networks that differ from the reference one
+        in a single design variable and in each pair of the design variables that change the same layer.
+        The maximum sub-network is activated at the end.
+
+        :param multi_elasticity_handler: Interface for handling the elasticity of the super-network.
+        :param measure_fn: Function that measures the cost of the active sub-network.
+        :param reference_x: Values of the design variables for the reference sub-network.
+            The maximum sub-network is used by default.
+        :return: Lookup table with the measured costs.
+        """
+        num_vars, vars_upper = multi_elasticity_handler.get_design_vars_info()
+        if reference_x is None:
+            reference_x = multi_elasticity_handler.get_pymoo_from_config(
+                multi_elasticity_handler.get_maximum_config()
+            )
+
+        def activate(x: List[int]) -> None:
+            multi_elasticity_handler.activate_subnet_for_config(multi_elasticity_handler.get_config_from_pymoo(x))
+
+        def measure(x: List[int]) -> float:
+            activate(x)
+            return measure_fn()
+
+        nncf_logger.info(f"Building efficiency lookup table for {sum(vars_upper) + 1} sub-networks.")
+        reference_value = measure(reference_x)
+        reference_layer_params = _get_active_layer_params(multi_elasticity_handler)
+        deltas = np.zeros((num_vars, max(vars_upper) + 1))
+        changed_layers = []
+        for var_idx in range(num_vars):
+            var_changed_layers = set()
+            for value in range(vars_upper[var_idx] + 1):
+                if value == reference_x[var_idx]:
+                    continue
+                x = list(reference_x)
+                x[var_idx] = value
+                deltas[var_idx, value] = measure(x) - reference_value
+                var_changed_layers.update(
+                    _get_changed_layers(_get_active_layer_params(multi_elasticity_handler), reference_layer_params)
+                )
+            changed_layers.append(var_changed_layers)
+
+        pairs = [
+            (i, j) for i, j in combinations(range(num_vars), 2) if not changed_layers[i].isdisjoint(changed_layers[j])
+        ]
+        nncf_logger.info(
+            f"Adding interactions of {len(pairs)} pairs of design variables to efficiency lookup table for "
+            f"{sum(vars_upper[i] * vars_upper[j] for i, j in pairs)} sub-networks."
+        )
+        interactions = np.zeros((len(pairs), deltas.shape[1], deltas.shape[1]))
+        for pair_idx, (i, j) in enumerate(pairs):
+            for value_i in range(vars_upper[i] + 1):
+                for value_j in range(vars_upper[j] + 1):
+                    if value_i == reference_x[i] or value_j == reference_x[j]:
+                        continue
+                    x = list(reference_x)
+                    x[i], x[j] = value_i, value_j
+                    interactions[pair_idx, value_i, value_j] = (
+                        measure(x) - reference_value - deltas[i, value_i] - deltas[j, value_j]
+                    )
+        multi_elasticity_handler.activate_maximum_subnet()
+        return cls(reference_value, deltas, np.array(pairs, dtype=np.int64).reshape(-1, 2), interactions)
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        """
+        Approximates the cost of the sub-networks.
+
+        :param x: Values of the design variables, an array of shape (number of sub-networks, number of
+            design variables) or (number of design variables,) for a single sub-network.
+        :return: Cost of each sub-network.
+        """
+        x = np.asarray(x, dtype=np.int64)
+        first_order = self._deltas[np.arange(self._deltas.shape[0]), x].sum(axis=-1)
+        second_order = self._interactions[
+            np.arange(self._pairs.shape[0]), x[..., self._pairs[:, 0]], x[..., self._pairs[:, 1]]
+        ].sum(axis=-1)
+        return self._reference_value + first_order + second_order
+
+
+def _get_active_layer_params(multi_elasticity_handler: MultiElasticityHandler) -> List[Dict[str, Any]]:
+    """
+    Collects the parameters of the layers in the active sub-network that are controlled by the elasticity:
+    the input and output widths, the kernel sizes and whether the layers are skipped.
+
+    :param multi_elasticity_handler: Interface for handling the elasticity of the super-network.
+    :return: Mappings of the layer names to the values of the parameters, one mapping for each parameter.
+    """
+    layer_params = []
+    if multi_elasticity_handler.width_handler is not None:
+        layer_params.extend(multi_elasticity_handler.width_handler.get_active_in_out_width_values())
+    if multi_elasticity_handler.kernel_handler is not None:
+        layer_params.append(multi_elasticity_handler.kernel_handler.get_active_kernel_sizes_per_node())
+    if multi_elasticity_handler.depth_handler is not None:
+        layer_params.append(dict.fromkeys(multi_elasticity_handler.depth_handler.get_names_of_skipped_nodes(), True))
+    return layer_params
+
+
+def _get_changed_layers(layer_params: List[Dict[str, Any]], reference_layer_params: List[Dict[str, Any]]) -> Set[str]:
+    """
+    :param layer_params: Parameters of the layers returned by `_get_active_layer_params`.
+    :param reference_layer_params: Parameters of the layers in the reference sub-network.
+    :return: Names of the layers whose parameters differ from the reference ones.
+    """
+    changed_layers = set()
+    for params, reference_params in zip(layer_params, reference_layer_params):
+        changed_layers.update(
+            name for name in params.keys() | reference_params.keys() if params.get(name) != reference_params.get(name)
+        )
+    return changed_layers
@@ -0,0 +1,104 @@
+# Copyright (c) 2023 Intel Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from typing import List, NoReturn, Optional
+
+from nncf.common.initialization.batchnorm_adaptation import BatchnormAdaptationAlgorithm
+from nncf.experimental.torch.nas.bootstrapNAS.elasticity.elasticity_controller import ElasticityController
+from nncf.experimental.torch.nas.bootstrapNAS.elasticity.multi_elasticity_handler import SubnetConfig
+from nncf.experimental.torch.nas.bootstrapNAS.search.evaluator import AccValFnType
+from nncf.experimental.torch.nas.bootstrapNAS.search.evaluator import AccuracyEvaluator
+from nncf.experimental.torch.nas.bootstrapNAS.search.evaluator import DataLoaderType
+from nncf.torch.batchnorm_adaptation import get_batchnorm_statistics
+from nncf.torch.batchnorm_adaptation import set_batchnorm_statistics
+from nncf.torch.nncf_network import NNCFNetwork
+
+
+class ParallelAccuracyEvaluator:
+    """
+    Evaluates the accuracy of several sub-networks concurrently. Each worker owns a replica of the super-network
+    together with its own elasticity controller, so the sub-networks are activated, adapted and validated on the
+    replicas independently of each other and of the original super-network.
+
+    The workers are threads: the replicas share the same validation function and data loader, which are
+    usually not picklable, while the PyTorch kernels release the GIL, as for `torch.nn.DataParallel`.
+    """
+
+    def __init__(
+        self,
+        model: NNCFNetwork,
+        elasticity_ctrl: ElasticityController,
+        eval_func: AccValFnType,
+        val_loader: DataLoaderType,
+        num_workers: int,
+        bn_adaptation: Optional[BatchnormAdaptationAlgorithm] = None,
+    ):
+        """
+        Initializes the parallel accuracy evaluator.
+
+        :param model: Super-network to replicate.
+        :param elasticity_ctrl: Interface to manage the elasticity of the super-network.
+        :param eval_func: Function used to validate a sub-network.
+        :param val_loader: Data loader used by the validation function.
+        :param num_workers: Number of the super-network replicas evaluated concurrently.
+        :param bn_adaptation: Batch-norm adaptation algorithm to run on a replica before the validation
+            of a sub-network or None if the adaptation is disabled. Each replica runs its own copy of the algorithm
+            starting from the batch-norm statistics of the super-network, as the sequential search does.
+        """
+        self._replicas = queue.Queue()
+        for _ in range(num_workers):
+            # The model and the controller are copied at once so that the copy of the controller
+            # manages the elasticity of the copy of the model
+            replica_model, replica_ctrl = deepcopy((model, elasticity_ctrl))
+            replica_bn_adaptation = None
+            if bn_adaptation is not None:
+                replica_bn_adaptation = (bn_adaptation.copy(), get_batchnorm_statistics(replica_model))
+            self._replicas.put(
+                (
+                    replica_model,
+                    replica_ctrl,
+                    AccuracyEvaluator(replica_model, eval_func, val_loader),
+                    replica_bn_adaptation,
+                )
+            )
+        self._executor = ThreadPoolExecutor(max_workers=num_workers)
+
+    def evaluate(self, configs: List[SubnetConfig]) -> List[float]:
+        """
+        Evaluates the accuracy of the sub-networks.
+
+        :param configs: Configurations of the sub-networks to evaluate.
+        :return: Values of the accuracy evaluator for the sub-networks in the same order as the configurations.
+        """
+        futures = [self._executor.submit(self._evaluate_subnet, config) for config in configs]
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> NoReturn:
+        """
+        Stops the workers and releases the replicas of the super-network.
+        """
+        self._executor.shutdown()
+        self._replicas = queue.Queue()
+
+    def _evaluate_subnet(self, config: SubnetConfig) -> float:
+        replica = self._replicas.get()
+        model, elasticity_ctrl, accuracy_evaluator, bn_adaptation = replica
+        try:
+            elasticity_ctrl.multi_elasticity_handler.activate_subnet_for_config(config)
+            if bn_adaptation is not None:
+                bn_adaptation_algo, bn_statistics = bn_adaptation
+                set_batchnorm_statistics(model, bn_statistics)
+                bn_adaptation_algo.run(model)
+            return accuracy_evaluator.evaluate_subnet()
+        finally:
+            self._replicas.put(replica)
@@ -39,6 +39,10 @@ from nncf.experimental.torch.nas.bootstrapNAS.search.evaluator import MACsEvalua
 from nncf.experimental.torch.nas.bootstrapNAS.search.evaluator_handler import AccuracyEvaluatorHandler
 from nncf.experimental.torch.nas.bootstrapNAS.search.evaluator_handler import BaseEvaluatorHandler
 from nncf.experimental.torch.nas.bootstrapNAS.search.evaluator_handler import EfficiencyEvaluatorHandler
+from nncf.experimental.torch.nas.bootstrapNAS.search.lookup_table import EfficiencyLookupTable
+from nncf.experimental.torch.nas.bootstrapNAS.search.parallel_evaluator import ParallelAccuracyEvaluator
+from nncf.torch.batchnorm_adaptation import get_batchnorm_statistics
+from nncf.torch.batchnorm_adaptation import set_batchnorm_statistics
 from nncf.torch.nncf_network import NNCFNetwork
 
 DataLoaderType = TypeVar("DataLoaderType")
@@ -67,6 +71,8 @@ class SearchParams:
         mutation_eta: float,
         acc_delta: float,
         ref_acc: float,
+        num_workers: int = 1,
+        efficiency_lookup_table: bool = False,
     ):
         """
         Initializes storage class for search parameters.
@@ -81,6 +87,11 @@ class SearchParams:
         :param mutation_eta: Mutation eta
         :param acc_delta: Tolerated accuracy delta to select a single sub-network from Pareto front.
         :param ref_acc: Accuracy of input model or reference.
+        :param num_workers: Number of sub-networks whose accuracy is evaluated concurrently
+            on the replicas of the super-network.
+        :param efficiency_lookup_table: Whether to approximate the efficiency of sub-networks by the sum of
+            the precomputed costs of the elastic values of each design variable and of each pair of the design
+            variables that change the same layer.
         """
         self.num_constraints = num_constraints
         self.population = population
@@ -94,6 +105,8 @@ class SearchParams:
         self.mutation_eta = mutation_eta
         self.acc_delta = acc_delta
         self.ref_acc = ref_acc
+        self.num_workers = num_workers
+        self.efficiency_lookup_table = efficiency_lookup_table
 
     @classmethod
     def from_dict(cls, search_config: Dict[str, Any]) -> "SearchParams":
@@ -113,6 +126,8 @@ class SearchParams:
         mutation_eta = search_config.get("mutation_eta", 3.0)
         acc_delta = search_config.get("acc_delta", 1)
         ref_acc = search_config.get("ref_acc", -1)
+        num_workers = search_config.get("num_workers", 1)
+        efficiency_lookup_table = search_config.get("efficiency_lookup_table", False)
 
         return cls(
             num_evals,
@@ -125,6 +140,8 @@ class SearchParams:
             mutation_eta,
             acc_delta,
             ref_acc,
+            num_workers,
+            efficiency_lookup_table,
         )
 
 
@@ -229,8 +246,11 @@ class SearchAlgorithm(BaseSearchAlgorithm):
         bn_adapt_params = search_config.get("batchnorm_adaptation", {})
         bn_adapt_algo_kwargs = get_bn_adapt_algo_kwargs(nncf_config, bn_adapt_params)
         self.bn_adaptation = BatchnormAdaptationAlgorithm(**bn_adapt_algo_kwargs) if bn_adapt_algo_kwargs else None
+        self._bn_statistics = None
 
         self._problem = None
+        self._parallel_accuracy_evaluator = None
+        self._efficiency_lookup_table = None
         self.checkpoint_save_dir = None
         self.type_var = np.int
 
@@ -340,7 +360,6 @@ class SearchAlgorithm(BaseSearchAlgorithm):
         self.num_obj = 2
         if efficiency_evaluator is not None:
             self._use_default_evaluators = False
-            self._efficiency_evaluator_handler = EfficiencyEvaluatorHandler(efficiency_evaluator, self._elasticity_ctrl)
         else:
             self._use_default_evaluators = True
 
@@ -348,39 +367,70 @@ class SearchAlgorithm(BaseSearchAlgorithm):
                 flops, _ = self._elasticity_ctrl.multi_elasticity_handler.count_flops_and_weights_for_active_subnet()
                 return flops / 2000000  # MACs
 
-            self._efficiency_evaluator_handler = EfficiencyEvaluatorHandler(
-                MACsEvaluator(get_macs_for_active_subnet), self._elasticity_ctrl
+            efficiency_evaluator = MACsEvaluator(get_macs_for_active_subnet)
+        if self.search_params.efficiency_lookup_table:
+            self._efficiency_lookup_table = EfficiencyLookupTable.build(
+                self._elasticity_ctrl.multi_elasticity_handler, efficiency_evaluator.evaluate_subnet
             )
+        self._efficiency_evaluator_handler = EfficiencyEvaluatorHandler(efficiency_evaluator, self._elasticity_ctrl)
         self._evaluator_handlers.append(self._efficiency_evaluator_handler)
         self._evaluator_handlers.append(self._accuracy_evaluator_handler)
         self.maximal_vals = [evaluator_handler.current_value for evaluator_handler in self._evaluator_handlers]
 
+        if self.search_params.num_workers > 1:
+            # The replicas adapt the sub-networks in an arbitrary order, so the adaptation starts from
+            # the statistics of the super-network to not depend on the sub-networks adapted before
+            if self.bn_adaptation is not None:
+                self._bn_statistics = get_batchnorm_statistics(self._model)
+            self._parallel_accuracy_evaluator = ParallelAccuracyEvaluator(
+                self._model,
+                self._elasticity_ctrl,
+                validate_fn,
+                val_loader,
+                self.search_params.num_workers,
+                self.bn_adaptation,
+            )
         self._problem = SearchProblem(self)
-        self._result = minimize(
-            self._problem,
-            self._algorithm,
-            ("n_gen", int(self.search_params.num_evals / self.search_params.population)),
-            seed=self.search_params.seed,
-            # save_history=True,
-            verbose=self._verbose,
-        )
+        try:
+            self._result = minimize(
+                self._problem,
+                self._algorithm,
+                ("n_gen", int(self.search_params.num_evals / self.search_params.population)),
+                seed=self.search_params.seed,
+                # save_history=True,
+                verbose=self._verbose,
+            )
+        finally:
+            if self._parallel_accuracy_evaluator is not None:
+                self._parallel_accuracy_evaluator.shutdown()
+                self._parallel_accuracy_evaluator = None
 
         if self.best_config is not None:
             self._elasticity_ctrl.multi_elasticity_handler.activate_subnet_for_config(self.best_config)
-            if self.bn_adaptation is not None:
-                self.bn_adaptation.run(self._model)
+            self.adapt_batchnorm_statistics()
             ret_vals = self.best_vals
         else:
             nncf_logger.warning("Couldn't find a subnet that satisfies the requirements. Returning maximum subnet.")
             self._elasticity_ctrl.multi_elasticity_handler.activate_maximum_subnet()
-            if self.bn_adaptation is not None:
-                self.bn_adaptation.run(self._model)
+            self.adapt_batchnorm_statistics()
             self.best_config = self._elasticity_ctrl.multi_elasticity_handler.get_active_config()
             self.best_vals = [None, None]
             ret_vals = self.maximal_vals
 
         return self._elasticity_ctrl, self.best_config, [abs(elem) for elem in ret_vals if elem is not None]
 
+    def adapt_batchnorm_statistics(self) -> None:
+        """
+        Adapts the batch-norm statistics for the active sub-network if the adaptation is enabled.
+        If the sub-networks are evaluated concurrently, the adaptation starts from the statistics
+        of the super-network taken at the beginning of the search, as it does on the replicas.
+        """
+        if self.bn_adaptation is None:
+            return
+        if self._bn_statistics is not None:
+            set_batchnorm_statistics(self._model, self._bn_statistics)
+        self.bn_adaptation.run(self._model)
+
     @skip_if_dependency_unavailable(dependencies=["matplotlib.pyplot"])
     def visualize_search_progression(self, filename="search_progression") -> NoReturn:
         """
@@ -458,6 +508,14 @@ class SearchAlgorithm(BaseSearchAlgorithm):
     def accuracy_evaluator_handler(self):
         return self._accuracy_evaluator_handler
 
+    @property
+    def parallel_accuracy_evaluator(self) -> Optional[ParallelAccuracyEvaluator]:
+        return self._parallel_accuracy_evaluator
+
+    @property
+    def efficiency_lookup_table(self) -> Optional[EfficiencyLookupTable]:
+        return self._efficiency_lookup_table
+
 
 class SearchProblem(Problem):
     """
@@ -499,16 +557,17 @@ class SearchProblem(Problem):
         :param kargs:
         :return:
         """
+        if self._search.efficiency_lookup_table is not None:
+            self._add_efficiency_from_lookup_table_to_cache(x)
+
+        if self._search.parallel_accuracy_evaluator is not None:
+            self._evaluate_in_parallel(x, out)
+            return
+
         evaluators_arr = [[] for i in range(len(self._search.evaluator_handlers))]
 
         for _, x_i in enumerate(x):
-            sample = self._elasticity_handler.get_config_from_pymoo(x_i)
-            self._elasticity_handler.activate_subnet_for_config(sample)
-            if sample != self._elasticity_handler.get_active_config():
-                nncf_logger.debug("Requested configuration was invalid")
-                nncf_logger.debug(f"Requested: {sample}")
-                nncf_logger.debug(f"Provided: {self._elasticity_handler.get_active_config()}")
-                self._search.bad_requests.append((sample, self._elasticity_handler.get_active_config()))
+            sample = self._activate_subnet(x_i)
 
             result = [sample]
 
@@ -517,10 +576,12 @@ class SearchProblem(Problem):
             for evaluator_handler in self._evaluator_handlers:
                 in_cache, value = evaluator_handler.retrieve_from_cache(tuple(x_i))
                 if not in_cache:
-                    if not bn_adaption_executed and self._search.bn_adaptation is not None:
-                        self._search.bn_adaptation.run(self._model)
+                    if not bn_adaption_executed:
+                        self._search.adapt_batchnorm_statistics()
                         bn_adaption_executed = True
                     value = evaluator_handler.evaluate_and_add_to_cache_from_pymoo(tuple(x_i))
+                else:
+                    evaluator_handler.evaluator.current_value = value
                 evaluators_arr[eval_idx].append(value)
                 eval_idx += 1
 
@@ -533,6 +594,82 @@ class SearchProblem(Problem):
         self._iter += 1
         out["F"] = np.column_stack(list(evaluators_arr))
 
+    def _evaluate_in_parallel(self, x: List[float], out: Dict[str, Any]) -> NoReturn:
+        """
+        Evaluates a population of sub-networks. The efficiency is evaluated sequentially on the super-network,
+        so that the measurements, e.g. latency, are not affected by the concurrent evaluations, and then
+        the accuracy of the sub-networks missing in the cache is evaluated concurrently on the replicas
+        of the super-network.
+
+        :param x: set of sub-networks to evaluate.
+        :param out: measurements obtained by evaluating sub-networks.
+        :return:
+        """
+        samples = []
+        for x_i in x:
+            sample = self._activate_subnet(x_i)
+            in_cache, _ = self._efficiency_evaluator_handler.retrieve_from_cache(tuple(x_i))
+            if not in_cache:
+                self._efficiency_evaluator_handler.evaluate_and_add_to_cache_from_pymoo(tuple(x_i))
+            samples.append(sample)
+
+        accuracy_evaluator = self._accuracy_evaluator_handler.evaluator
+        configs_to_evaluate = {}
+        for x_i, sample in zip(x, samples):
+            in_cache, _ = accuracy_evaluator.retrieve_from_cache(tuple(x_i))
+            if not in_cache:
+                configs_to_evaluate[tuple(x_i)] = sample
+        accuracy_values = self._search.parallel_accuracy_evaluator.evaluate(list(configs_to_evaluate.values()))
+        for pymoo_repr, value in zip(configs_to_evaluate, accuracy_values):
+            accuracy_evaluator.add_to_cache(pymoo_repr, value)
+
+        evaluators_arr = [[] for i in range(len(self._search.evaluator_handlers))]
+        for x_i, sample in zip(x, samples):
+            result = [sample]
+            for eval_idx, evaluator_handler in enumerate(self._evaluator_handlers):
+                _, value = evaluator_handler.retrieve_from_cache(tuple(x_i))
+                evaluator_handler.evaluator.current_value = value
+                evaluators_arr[eval_idx].append(value)
+                result.append(evaluator_handler.name)
+                result.append(value)
+
+            self._save_checkpoint_best_subnetwork(sample)
+            self._search_records.append(result)
+
+        self._iter += 1
+        out["F"] = np.column_stack(list(evaluators_arr))
+
+    def _add_efficiency_from_lookup_table_to_cache(self, x: List[float]) -> NoReturn:
+        """
+        Approximates the efficiency of the whole population of sub-networks by the lookup table and adds
+        the values missing in the cache of the efficiency evaluator.
+
+        :param x: set of sub-networks to evaluate.
+        :return:
+        """
+        efficiency_evaluator = self._efficiency_evaluator_handler.evaluator
+        efficiency_values = self._search.efficiency_lookup_table.evaluate(x)
+        for x_i, value in zip(x, efficiency_values):
+            in_cache, _ = efficiency_evaluator.retrieve_from_cache(tuple(x_i))
+            if not in_cache:
+                efficiency_evaluator.add_to_cache(tuple(x_i), float(value))
+
+    def _activate_subnet(self, x_i: List[float]) -> SubnetConfig:
+        """
+        Activates the sub-network in the super-network.
+
+        :param x_i: Pymoo representation of the sub-network.
+        :return: Requested configuration of the sub-network.
+        """
+        sample = self._elasticity_handler.get_config_from_pymoo(x_i)
+        self._elasticity_handler.activate_subnet_for_config(sample)
+        if sample != self._elasticity_handler.get_active_config():
+            nncf_logger.debug("Requested configuration was invalid")
+            nncf_logger.debug(f"Requested: {sample}")
+            nncf_logger.debug(f"Provided: {self._elasticity_handler.get_active_config()}")
+            self._search.bad_requests.append((sample, self._elasticity_handler.get_active_config()))
+        return sample
+
     def _save_checkpoint_best_subnetwork(self, config: SubnetConfig) -> NoReturn:
         """
         Saves information of current best sub-network discovered by the search algorithm.
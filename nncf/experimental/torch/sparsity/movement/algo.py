@@ -24,6 +24,7 @@ from nncf.common.logging import nncf_logger
 from nncf.common.scopes import matches_any
 from nncf.common.sparsity.statistics import MovementSparsityStatistics
 from nncf.common.statistics import NNCFStatistics
+from nncf.common.utils.backend import copy_model
 from nncf.config.extractors import extract_algo_specific_config
 from nncf.experimental.torch.sparsity.movement.layers import MovementSparsifier
 from nncf.experimental.torch.sparsity.movement.layers import SparseConfig
@@ -213,6 +214,53 @@ class MovementSparsityController(BaseSparsityAlgoController):
         for minfo in self.sparsified_module_info:
             minfo.operand.requires_grad_(False)
 
+    def strip_model(self, model: NNCFNetwork, do_copy: bool = False) -> NNCFNetwork:
+        """
+        Applies the binary masks to the weights and biases of the sparsified layers and removes the movement
+        sparsity operations from the model. The shapes of the layers are kept, use `compact_model` to remove
+        the structurally pruned heads and channels.
+
+        :param model: The compressed model.
+        :param do_copy: Modify copy of the model, defaults to False.
+        :return: The stripped model.
+        """
+        if do_copy:
+            model = copy_model(model)
+
+        for minfo in self.sparsified_module_info:
+            nncf_module = model.nncf.get_containing_module(minfo.module_node_name)
+            for key in list(nncf_module.pre_ops.keys()):
+                op = nncf_module.get_pre_op(key)
+                if isinstance(op.operand, MovementSparsifier):
+                    nncf_module.weight.data = op.operand.apply_binary_mask(nncf_module.weight.data)
+                    if op.operand.prune_bias:
+                        nncf_module.bias.data = op.operand.apply_binary_mask(nncf_module.bias.data, is_bias=True)
+                    nncf_module.remove_pre_forward_operation(key)
+        return model
+
+    def compact_model(self, model: NNCFNetwork, do_copy: bool = False) -> NNCFNetwork:
+        """
+        Strips the movement sparsity from the model and physically removes the pruned attention heads and
+        feed-forward channels from the linear layers. Requires the structured masking to be enabled and
+        the binary masks to be frozen.
+
+        The layers with other compression operations, e.g. weight quantizers whose scales follow the output
+        channels, are not compacted, so the structures pruned in them are kept as zeros. The compressed graph
+        of the model is rebuilt to reflect the new shapes of the layers.
+
+        :param model: The compressed model.
+        :param do_copy: Modify copy of the model, defaults to False.
+        :return: The stripped and compacted model.
+        """
+        if not self._scheduler.enable_structured_masking:
+            raise RuntimeError("Movement sparsity can compact the model only if structured masking is enabled.")
+        if not all(minfo.operand.frozen for minfo in self.sparsified_module_info):
+            raise RuntimeError("Movement sparsity can compact the model only after the binary masks are frozen.")
+        model = self.strip_model(model, do_copy)
+        if self._structured_mask_handler.compact_modules(model):
+            model.nncf.rebuild_graph()
+        return model
+
     def statistics(self, quickly_collected_only=False) -> NNCFStatistics:
         collector = PTSparseModelStatisticsCollector(self.model, self.sparsified_module_info, supports_sparse_bias=True)
         model_statistics = collector.collect()
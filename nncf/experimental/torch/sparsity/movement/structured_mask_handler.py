@@ -10,11 +10,12 @@
 # limitations under the License.
 from functools import reduce
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import torch
 import torch.nn.functional as F
+from torch import nn
 
 from nncf.common.graph.graph import NNCFNodeName
 from nncf.common.graph.layer_attributes import LinearLayerAttributes
@@ -31,6 +32,9 @@ from nncf.torch.sparsity.base_algo import SparseModuleInfo
 
 SUPPORTED_NNCF_MODULES = [NNCFLinear]
 EXPECTED_NODE_LAYER_ATTRS = [LinearLayerAttributes]
+# Attributes of the self-attention modules in HuggingFace's transformers, e.g. in BERT, MobileBERT, Swin and ViT,
+# that define the number of heads used to reshape the outputs of query, key and value projections.
+SELF_ATTENTION_HEAD_ATTRIBUTES = ["num_attention_heads", "attention_head_size", "all_head_size"]
 
 
 class StructuredMaskContextStatistics:
@@ -238,6 +242,24 @@ class StructuredMaskContext:
             module_node_name=self.module_node_name,
         )
 
+    def get_kept_block_mask(self) -> torch.Tensor:
+        """
+        Gets the blocks along the pruned dimension, i.e. the heads or channels, that have at least one
+        non-pruned element in the binary masks of the operand.
+
+        :return: 1D boolean mask of the preserved blocks.
+        """
+        weight_binary_mask = self.sparsifier_operand.weight_ctx.binary_mask
+        if self.prune_by_row:
+            preserved = weight_binary_mask.amax(dim=1)
+            if self.sparsifier_operand.prune_bias:
+                preserved = preserved.logical_or(self.sparsifier_operand.bias_ctx.binary_mask)
+            block_size = self.grid_size[0]
+        else:
+            preserved = weight_binary_mask.amax(dim=0)
+            block_size = self.grid_size[1]
+        return F.max_pool1d(preserved.float().unsqueeze(0), kernel_size=block_size).squeeze(0).bool()
+
     def _resolve_grid_size(self, grid_size) -> Tuple[int, int]:
         a, b = grid_size
         return (a if a > 0 else self.operand_mask_shape[0], b if b > 0 else self.operand_mask_shape[1])
@@ -346,6 +368,63 @@ class StructuredMaskHandler:
             for ctx in group.structured_mask_contexts:
                 ctx.populate_dependent_structured_mask_to_operand()
 
+    @torch.no_grad()
+    def compact_modules(self, model: NNCFNetwork) -> bool:
+        """
+        Physically removes the pruned heads and channels from the linear layers in each context group, so that
+        the model runs smaller dense matrix multiplications instead of the masked ones. The binary masks should be
+        frozen and already applied to the weights of `model`, which is either the compressed model or its copy,
+        and the movement sparsity operations should be removed from it.
+
+        The groups are kept intact if any of their layers has other compression operations, e.g. quantizers,
+        since their parameters follow the shapes of the layers. The heads are removed only from the self-attention
+        modules that store the number of heads in `SELF_ATTENTION_HEAD_ATTRIBUTES`, the other groups with
+        the pruned heads are kept intact as well.
+
+        :param model: The model with the same structure as the compressed model of the handler.
+        :return: Whether any layer was compacted.
+        """
+        is_compacted = False
+        module_vs_name_map = {module: name for name, module in model.named_modules()}
+        for group in self._structured_mask_ctx_groups:
+            ctxes = group.structured_mask_contexts
+            kept_block_mask = reduce(torch.logical_or, [ctx.get_kept_block_mask() for ctx in ctxes])
+            if kept_block_mask.all():
+                continue
+
+            modules = [model.nncf.get_containing_module(ctx.module_node_name) for ctx in ctxes]
+            if any(module.pre_ops or module.post_ops for module in modules):
+                nncf_logger.warning(
+                    f"Pruned structures are not removed from the structured mask context group {group.group_id}, "
+                    f"since its layers have other compression operations."
+                )
+                continue
+
+            row_prune_ctxes = [ctx for ctx in ctxes if ctx.prune_by_row]
+            block_size = row_prune_ctxes[0].grid_size[0] if row_prune_ctxes else ctxes[0].grid_size[1]
+            attention_module = None
+            if block_size > 1:
+                attention_module = self._get_self_attention_module(
+                    model, module_vs_name_map, row_prune_ctxes, block_size
+                )
+                if attention_module is None:
+                    nncf_logger.warning(
+                        f"Pruned heads are not removed from the structured mask context group {group.group_id}, "
+                        f"since the number of heads is not defined by {SELF_ATTENTION_HEAD_ATTRIBUTES} attributes."
+                    )
+                    continue
+
+            kept_block_ids = kept_block_mask.nonzero().view(-1)
+            block_offsets = torch.arange(block_size, device=kept_block_ids.device)
+            kept_ids = (kept_block_ids.unsqueeze(1) * block_size + block_offsets).view(-1)
+            for ctx, module in zip(ctxes, modules):
+                self._compact_linear(module, kept_ids, ctx.prune_by_row)
+            if attention_module is not None:
+                attention_module.num_attention_heads = len(kept_block_ids)
+                attention_module.all_head_size = len(kept_block_ids) * attention_module.attention_head_size
+            is_compacted = True
+        return is_compacted
+
     def report_structured_sparsity(
         self,
         save_dir: str,
@@ -384,6 +463,39 @@ class StructuredMaskHandler:
                 entry_list.append(entry)
         return pd.DataFrame(entry_list)
 
+    @staticmethod
+    def _get_self_attention_module(
+        model: NNCFNetwork,
+        module_vs_name_map: Dict[nn.Module, str],
+        row_prune_ctxes: List[StructuredMaskContext],
+        head_size: int,
+    ) -> Optional[nn.Module]:
+        parent_modules = set()
+        for ctx in row_prune_ctxes:
+            module_name = module_vs_name_map[model.nncf.get_containing_module(ctx.module_node_name)]
+            parent_modules.add(model.get_submodule(module_name.rpartition(".")[0]))
+        if len(parent_modules) != 1:
+            return None
+        attention_module = parent_modules.pop()
+        if not all(hasattr(attention_module, attr) for attr in SELF_ATTENTION_HEAD_ATTRIBUTES):
+            return None
+        if attention_module.attention_head_size != head_size:
+            return None
+        return attention_module
+
+    @staticmethod
+    def _compact_linear(module: nn.Linear, kept_ids: torch.Tensor, prune_by_row: bool):
+        weight = module.weight
+        if prune_by_row:
+            module.weight = nn.Parameter(weight[kept_ids].clone(), requires_grad=weight.requires_grad)
+            if module.bias is not None:
+                bias = module.bias
+                module.bias = nn.Parameter(bias[kept_ids].clone(), requires_grad=bias.requires_grad)
+            module.out_features = len(kept_ids)
+        else:
+            module.weight = nn.Parameter(weight[:, kept_ids].clone(), requires_grad=weight.requires_grad)
+            module.in_features = len(kept_ids)
+
     @staticmethod
     def _create_structured_mask_context_groups(
         nncf_network: NNCFNetwork, sparsified_module_info_list: List[SparseModuleInfo]
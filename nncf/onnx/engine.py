@@ -9,27 +9,82 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict
+from typing import Dict, List, Optional
 
 import numpy as np
 import onnxruntime as rt
 
 from nncf.common.engine import Engine
 
+ONNX_RUNTIME_TYPE_TO_NUMPY_DTYPE = {
+    "tensor(float)": np.float32,
+    "tensor(float16)": np.float16,
+    "tensor(double)": np.float64,
+    "tensor(int8)": np.int8,
+    "tensor(uint8)": np.uint8,
+    "tensor(int16)": np.int16,
+    "tensor(uint16)": np.uint16,
+    "tensor(int32)": np.int32,
+    "tensor(uint32)": np.uint32,
+    "tensor(int64)": np.int64,
+    "tensor(uint64)": np.uint64,
+    "tensor(bool)": np.bool_,
+}
+
 
 class ONNXEngine(Engine):
     """
     Engine for ONNX backend using ONNXRuntime to infer the model.
     """
 
-    def __init__(self, model, **rt_session_options):
+    def __init__(self, model, use_io_binding: bool = False, **rt_session_options):
+        """
+        :param model: ONNX model to infer.
+        :param use_io_binding: Whether to infer the model via IOBinding. The inputs are converted to the input
+            types and bound without copying when they are C-contiguous arrays of the input types. The model is
+            inferred via the InferenceSession if some of the inputs have unsupported types. If all outputs
+            of the model have static shapes, the outputs are written into the buffers that are allocated once
+            and reused by each inference, so the returned outputs are valid only until the next call of `infer`.
+        :param rt_session_options: Options of the ONNXRuntime InferenceSession.
+        """
         self.input_names = set()
         rt_session_options["providers"] = ["CPUExecutionProvider"]
         serialized_model = model.SerializeToString()
         self.sess = rt.InferenceSession(serialized_model, **rt_session_options)
 
+        self._input_dtypes = {}
         for inp in self.sess.get_inputs():
             self.input_names.add(inp.name)
+            self._input_dtypes[inp.name] = ONNX_RUNTIME_TYPE_TO_NUMPY_DTYPE.get(inp.type)
+
+        self._output_names = [output.name for output in self.sess.get_outputs()]
+        self._io_binding = None
+        self._output_buffers = None
+        # IOBinding does not convert the inputs, so the models with unsupported input types are inferred
+        # via the InferenceSession
+        if use_io_binding and all(dtype is not None for dtype in self._input_dtypes.values()):
+            self._io_binding = self.sess.io_binding()
+            self._output_buffers = self._allocate_output_buffers()
+            if self._output_buffers is None:
+                for name in self._output_names:
+                    self._io_binding.bind_output(name, "cpu")
+            else:
+                for name, buffer in zip(self._output_names, self._output_buffers):
+                    self._io_binding.bind_output(name, "cpu", 0, buffer.dtype, buffer.shape, buffer.ctypes.data)
+
+    def _allocate_output_buffers(self) -> Optional[List[np.ndarray]]:
+        """
+        Allocates the buffers for the outputs of the model.
+
+        :return: Buffers for the outputs or None if some of the outputs have dynamic shapes or unsupported types.
+        """
+        buffers = []
+        for output in self.sess.get_outputs():
+            dtype = ONNX_RUNTIME_TYPE_TO_NUMPY_DTYPE.get(output.type)
+            if dtype is None or not all(isinstance(dim, int) for dim in output.shape):
+                return None
+            buffers.append(np.empty(output.shape, dtype=dtype))
+        return buffers
 
     def infer(self, input_data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
         """
@@ -38,7 +93,34 @@ class ONNXEngine(Engine):
         :param input_data: inputs for the model
         :return output_data: models outputs
         """
+        if self._io_binding is not None:
+            return self._infer_with_io_binding(input_data)
+
         output_tensors = self.sess.run([], {k: v for k, v in input_data.items() if k in self.input_names})
         model_outputs = self.sess.get_outputs()
 
         return {output.name: tensor for tensor, output in zip(output_tensors, model_outputs)}
+
+    def _infer_with_io_binding(self, input_data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Runs model on the provided input via ONNXRuntime IOBinding.
+
+        :param input_data: inputs for the model
+        :return output_data: models outputs
+        """
+        # The arrays are kept alive until the end of the inference, because they are bound without copying
+        input_arrays = {
+            k: np.ascontiguousarray(v, dtype=self._input_dtypes[k])
+            for k, v in input_data.items()
+            if k in self.input_names
+        }
+        self._io_binding.clear_binding_inputs()
+        for name, array in input_arrays.items():
+            self._io_binding.bind_cpu_input(name, array)
+        self.sess.run_with_iobinding(self._io_binding)
+
+        if self._output_buffers is not None:
+            output_tensors = self._output_buffers
+        else:
+            output_tensors = self._io_binding.copy_outputs_to_cpu()
+        return dict(zip(self._output_names, output_tensors))
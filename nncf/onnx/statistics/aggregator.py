@@ -9,17 +9,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict
+import multiprocessing
+import os
+import traceback
+from itertools import islice
+from multiprocessing.connection import Connection
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 import onnx
+import onnxruntime as rt
 
+from nncf.common.factory import ModelTransformerFactory
 from nncf.common.factory import NNCFGraphFactory
 from nncf.common.factory import TModel
 from nncf.common.graph.transformations.commands import TargetType
 from nncf.common.graph.transformations.layout import TransformationLayout
+from nncf.common.logging import nncf_logger
 from nncf.common.tensor_statistics.aggregator import StatisticsAggregator
+from nncf.common.tensor_statistics.collectors import MergeableTensorStatisticCollector
 from nncf.common.tensor_statistics.statistic_point import StatisticPointsContainer
+from nncf.data.dataset import Dataset
+from nncf.experimental.common.tensor_statistics.collectors import TensorAggregatorBase
+from nncf.experimental.common.tensor_statistics.collectors import TensorCollector
+from nncf.onnx.engine import ONNXEngine
 from nncf.onnx.graph.node_utils import get_input_edge
 from nncf.onnx.graph.node_utils import get_input_edges_mapping
 from nncf.onnx.graph.onnx_graph import ONNXGraph
@@ -27,13 +40,208 @@ from nncf.onnx.graph.transformations.commands import ONNXOutputInsertionCommand
 from nncf.onnx.tensor import ONNXNNCFTensor
 
 
+MergeableCollector = Union[MergeableTensorStatisticCollector, TensorAggregatorBase]
+
+
 class ONNXStatisticsAggregator(StatisticsAggregator):
+    """
+    Collects statistics for the ONNX models. When the number of workers is more than one, the dataset is split
+    into consecutive parts, and the statistics are collected on each part by a separate worker process
+    with its own InferenceSession. The statistics of the workers are merged in the order of the parts,
+    so they are the same as the statistics collected by the single process.
+    """
+
+    def __init__(self, dataset: Dataset, num_workers: int = 1, num_threads_per_worker: Optional[int] = None):
+        """
+        :param dataset: Dataset for the statistics collection.
+        :param num_workers: Number of the worker processes to collect statistics.
+            The statistics are collected in the current process if it is 1.
+        :param num_threads_per_worker: Number of the intra-op threads of the InferenceSession of each worker.
+            The CPU cores are evenly distributed between the workers if it is None.
+        """
+        super().__init__(dataset)
+        self._num_workers = num_workers
+        self._num_threads_per_worker = num_threads_per_worker
+
     def collect_statistics(self, model: onnx.ModelProto) -> None:
         self._nncf_graph = NNCFGraphFactory.create(model)
         self.input_edges_mapping = get_input_edges_mapping(self._nncf_graph)
         self._onnx_graph = ONNXGraph(model)
         self._registered_weights = set()
-        super().collect_statistics(model)
+        num_workers = min(self._num_workers, self.stat_subset_size)
+        if num_workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            nncf_logger.warning(
+                "Statistics are collected in the current process, "
+                "because worker processes could not be forked on this platform."
+            )
+            num_workers = 1
+        merged_statistics = self._get_merged_statistic_points(self.statistic_points, model)
+        collectors = self._get_collectors(merged_statistics) if num_workers > 1 else None
+        if num_workers > 1 and collectors is None:
+            nncf_logger.warning(
+                "Statistics are collected in the current process, "
+                "because some statistic collectors could not be merged across worker processes."
+            )
+        if collectors is None:
+            super().collect_statistics(model)
+        else:
+            self._collect_statistics_in_workers(model, merged_statistics, collectors, num_workers)
+
+    def _collect_statistics_in_workers(
+        self,
+        model: onnx.ModelProto,
+        statistic_points: StatisticPointsContainer,
+        collectors: List[MergeableCollector],
+        num_workers: int,
+    ) -> None:
+        """
+        Collects statistics by the worker processes on the consecutive parts of the dataset
+        and merges the statistics of the workers into the registered statistic collectors.
+
+        :param model: ONNX model to collect statistics.
+        :param statistic_points: StatisticPointsContainer instance with the merged statistic points.
+        :param collectors: Statistic collectors of the statistic points.
+        :param num_workers: Number of the worker processes.
+        """
+        transformation_layout = self._get_transformation_layout_extra_outputs(statistic_points)
+        model_with_outputs = ModelTransformerFactory.create(model).transform(transformation_layout)
+
+        # The workers are forked to share the dataset, the model and the statistic points without pickling them,
+        # only the collected statistics are sent back to the parent process
+        context = multiprocessing.get_context("fork")
+        part_size = -(-self.stat_subset_size // num_workers)
+        workers, connections = [], []
+        for rank in range(num_workers):
+            start = rank * part_size
+            stop = min(start + part_size, self.stat_subset_size)
+            receiver, sender = context.Pipe(duplex=False)
+            worker = context.Process(
+                target=self._collect_statistics_in_worker,
+                args=(model_with_outputs, statistic_points, collectors, start, stop, num_workers, sender),
+                daemon=True,
+            )
+            worker.start()
+            sender.close()
+            workers.append(worker)
+            connections.append(receiver)
+
+        all_collectors = []
+        try:
+            for rank, connection in enumerate(connections):
+                try:
+                    result = connection.recv()
+                except EOFError as error:
+                    raise RuntimeError(f"Statistics collection worker {rank} exited unexpectedly") from error
+                if isinstance(result, str):
+                    raise RuntimeError(f"Statistics collection failed in worker {rank}:\n{result}")
+                all_collectors.append(result)
+        finally:
+            for worker in workers:
+                if len(all_collectors) < num_workers:
+                    worker.terminate()
+                worker.join()
+
+        for idx, collector in enumerate(collectors):
+            collector.reset()
+            for worker_collectors in all_collectors:
+                collector.merge(worker_collectors[idx])
+
+    def _collect_statistics_in_worker(
+        self,
+        model: onnx.ModelProto,
+        statistic_points: StatisticPointsContainer,
+        collectors: List[MergeableCollector],
+        start: int,
+        stop: int,
+        num_workers: int,
+        connection: Connection,
+    ) -> None:
+        """
+        Collects statistics on the data items of the dataset from start to stop and sends the collectors
+        to the parent process, or the traceback if the statistics collection failed.
+
+        :param model: ONNX model with extra outputs.
+        :param statistic_points: StatisticPointsContainer instance with the statistic points.
+        :param collectors: Statistic collectors of the statistic points.
+        :param start: Index of the first data item.
+        :param stop: Index after the last data item.
+        :param num_workers: Number of the worker processes.
+        :param connection: Connection to send the result to the parent process.
+        """
+        try:
+            # The number of samples of each collector is limited to the samples
+            # that the collector would take from this part of the dataset
+            for collector in collectors:
+                if collector.num_samples is not None:
+                    collector.num_samples = max(0, min(collector.num_samples, stop) - start)
+            sess_options = self._create_worker_session_options(num_workers)
+            engine = ONNXEngine(model, self._can_reuse_outputs(), sess_options=sess_options)
+            # islice is used instead of the indices, because the dataset could be shorter than the subset size
+            dataset = islice(self.dataset.get_inference_data(), start, stop)
+            self._collect_statistics_on_dataset(engine, dataset, stop - start, statistic_points, start == 0)
+            connection.send(collectors)
+        except Exception:  # pylint: disable=broad-except
+            connection.send(traceback.format_exc())
+        finally:
+            connection.close()
+
+    def _create_engine(self, model: onnx.ModelProto) -> ONNXEngine:
+        return ONNXEngine(model, use_io_binding=self._can_reuse_outputs())
+
+    def _can_reuse_outputs(self) -> bool:
+        """
+        Checks whether the model outputs could be overwritten by the next inference after the statistics
+        registration. The ONNX statistic collectors reduce the outputs to the new arrays, while TensorCollector
+        could keep the outputs as is, e.g. via NoopReducer.
+
+        :return: True if the outputs are not kept by the statistic collectors.
+        """
+        for _statistic_points in self.statistic_points.values():
+            for statistic_point in _statistic_points:
+                for tensor_collectors in statistic_point.algorithm_to_tensor_collectors.values():
+                    if any(isinstance(tensor_collector, TensorCollector) for tensor_collector in tensor_collectors):
+                        return False
+        return True
+
+    def _create_worker_session_options(self, num_workers: int) -> rt.SessionOptions:
+        """
+        Creates the InferenceSession options of a worker, so the workers do not oversubscribe the CPU cores.
+
+        :param num_workers: Number of the worker processes.
+        :return: InferenceSession options.
+        """
+        num_threads = self._num_threads_per_worker
+        if num_threads is None:
+            num_threads = max(1, (os.cpu_count() or 1) // num_workers)
+        sess_options = rt.SessionOptions()
+        sess_options.intra_op_num_threads = num_threads
+        sess_options.inter_op_num_threads = 1
+        sess_options.execution_mode = rt.ExecutionMode.ORT_SEQUENTIAL
+        return sess_options
+
+    @staticmethod
+    def _get_collectors(statistic_points: StatisticPointsContainer) -> Optional[List[MergeableCollector]]:
+        """
+        Returns the unique mergeable statistic collectors of the statistic points in the order of the statistic
+        points registration. The aggregators are returned instead of the TensorCollector instances.
+
+        :param statistic_points: StatisticPointsContainer instance with the statistic points.
+        :return: Statistic collectors of the statistic points or None if some of the statistic collectors
+            could not be merged.
+        """
+        collectors = {}
+        for _statistic_points in statistic_points.values():
+            for statistic_point in _statistic_points:
+                for tensor_collectors in statistic_point.algorithm_to_tensor_collectors.values():
+                    for tensor_collector in tensor_collectors:
+                        if isinstance(tensor_collector, TensorCollector):
+                            for aggregator in tensor_collector.aggregators.values():
+                                collectors[id(aggregator)] = aggregator
+                        elif isinstance(tensor_collector, MergeableTensorStatisticCollector):
+                            collectors[id(tensor_collector)] = tensor_collector
+                        else:
+                            return None
+        return list(collectors.values())
 
     def _register_statistics(
         self, outputs: Dict[str, ONNXNNCFTensor], statistic_points: StatisticPointsContainer
@@ -106,6 +106,14 @@ class ONNXNNCFCollectorTensorProcessor(NNCFCollectorTensorProcessor):
     def unstack(x: NNCFTensor, axis: int = 0) -> List[NNCFTensor]:
         return [ONNXNNCFTensor(np.squeeze(e, axis)) for e in np.split(x.tensor, x.tensor.shape[axis], axis=axis)]
 
+    @staticmethod
+    def to_numpy(x: NNCFTensor) -> np.ndarray:
+        return x.tensor
+
+    @staticmethod
+    def from_numpy(x: np.ndarray) -> NNCFTensor:
+        return ONNXNNCFTensor(x)
+
     @staticmethod
     def sum(tensor: NNCFTensor) -> TensorElementsType:
         return np.sum(tensor.tensor)
@@ -27,7 +27,13 @@ class OVNativeEngine(Engine):
     to infer the model.
     """
 
-    def __init__(self, model: ov.Model, target_device: TargetDevice = TargetDevice.CPU):
+    def __init__(self, model: ov.Model, target_device: TargetDevice = TargetDevice.CPU, share_outputs: bool = False):
+        """
+        :param model: OpenVINO model to infer.
+        :param target_device: Device to infer the model.
+        :param share_outputs: Whether to return the views over the output tensors of the infer request
+            instead of the copies. The views are overwritten by the next call of `infer`.
+        """
         if target_device == TargetDevice.ANY:
             target_device = TargetDevice.CPU
 
@@ -38,6 +44,10 @@ class OVNativeEngine(Engine):
         for model_input in model.inputs:
             self.input_tensor_names.update(model_input.get_names())
 
+        self._share_outputs = share_outputs
+        self._infer_request = self.compiled_model.create_infer_request()
+        self._output_tensor_names = [output.get_names() for output in self.compiled_model.outputs]
+
     def _check_input_data_format(
         self, input_data: Union[np.ndarray, List[np.ndarray], Tuple[np.ndarray], Dict[str, np.ndarray]]
     ) -> None:
@@ -67,10 +77,16 @@ class OVNativeEngine(Engine):
         :return output_data: Model's output.
         """
         self._check_input_data_format(input_data)
-        model_outputs = self.compiled_model(input_data)
+        # The inputs share memory with the infer request, so the inference is waited for before returning.
+        # Unlike `infer` of the infer request, `start_async` does not copy the outputs.
+        self._infer_request.start_async(input_data, shared_memory=True)
+        self._infer_request.wait()
 
         output_data = {}
-        for tensor, value in model_outputs.items():
-            for tensor_name in tensor.get_names():
+        for idx, tensor_names in enumerate(self._output_tensor_names):
+            value = self._infer_request.get_output_tensor(idx).data
+            if not self._share_outputs:
+                value = value.copy()
+            for tensor_name in tensor_names:
                 output_data[tensor_name] = value
         return output_data
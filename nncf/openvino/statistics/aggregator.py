@@ -21,7 +21,9 @@ from nncf.common.tensor_statistics.aggregator import StatisticsAggregator
 from nncf.common.tensor_statistics.statistic_point import StatisticPoint
 from nncf.common.tensor_statistics.statistic_point import StatisticPointsContainer
 from nncf.experimental.common.tensor_statistics.collectors import MergedTensorCollector
+from nncf.experimental.common.tensor_statistics.collectors import NoopReducer
 from nncf.experimental.common.tensor_statistics.collectors import TensorCollector
+from nncf.openvino.engine import OVNativeEngine
 from nncf.openvino.graph.nncf_graph_builder import GraphConverter
 from nncf.openvino.graph.transformations.commands import OVInplaceFnInsertionCommand
 from nncf.openvino.graph.transformations.commands import OVOutputInsertionCommand
@@ -33,6 +35,25 @@ class OVStatisticsAggregator(StatisticsAggregator):
         self._name_to_node_mapping = {op.get_friendly_name(): op for op in model.get_ops()}
         super().collect_statistics(model)
 
+    def _create_engine(self, model: ov.Model) -> OVNativeEngine:
+        return OVNativeEngine(model, share_outputs=self._can_reuse_outputs())
+
+    def _can_reuse_outputs(self) -> bool:
+        """
+        Checks whether the model outputs could be overwritten by the next inference after the statistics
+        registration. The out-of-place reducers reduce the outputs to the new arrays, while NoopReducer and
+        the inplace reducers pass the outputs to the aggregators as is, so the aggregators could keep them.
+
+        :return: True if the outputs are not kept by the statistic collectors.
+        """
+        for _, _, tensor_collector in self.statistic_points.get_tensor_collectors():
+            if not isinstance(tensor_collector, TensorCollector):
+                return False
+            for reducer in tensor_collector.reducers:
+                if reducer.inplace or isinstance(reducer, NoopReducer):
+                    return False
+        return True
+
     def _register_statistics(
         self, outputs: Dict[str, OVNNCFTensor], statistic_points: StatisticPointsContainer
     ) -> None:
@@ -135,6 +135,14 @@ class OVNNCFCollectorTensorProcessor(NNCFCollectorTensorProcessor):
     def unstack(x: NNCFTensor, axis: int = 0) -> List[NNCFTensor]:
         return [OVNNCFTensor(np.squeeze(e, axis)) for e in np.split(x.tensor, x.tensor.shape[axis], axis=axis)]
 
+    @staticmethod
+    def to_numpy(x: NNCFTensor) -> np.ndarray:
+        return x.tensor
+
+    @staticmethod
+    def from_numpy(x: np.ndarray) -> NNCFTensor:
+        return OVNNCFTensor(x)
+
     @staticmethod
     def sum(tensor: NNCFTensor) -> TensorElementsType:
         return np.sum(tensor.tensor)
@@ -270,7 +278,7 @@ def get_mean_batch_stat_collector(num_samples, inplace=True):
     # after migration on openvino-dev=2023.0
     inplace = False
     reducer = OVBatchMeanReducer(inplace=inplace)
-    aggregator = NoopAggregator(num_samples)
+    aggregator = NoopAggregator(OVNNCFCollectorTensorProcessor, num_samples)
 
     collector = TensorCollector(OVBatchTensorStatistic)
     collector.register_statistic_branch(OVBatchTensorStatistic.VALUES_STATS, reducer, aggregator)
@@ -9,7 +9,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple
 
 import numpy as np
 import torch
@@ -28,6 +28,7 @@ from nncf.common.quantization.initialization.range import RangeInitConfig
 from nncf.common.quantization.structs import QuantizationMode
 from nncf.common.quantization.structs import QuantizerConfig
 from nncf.common.utils.backend import BackendType
+from nncf.experimental.common.tensor_statistics.collectors import TensorCollector
 from nncf.parameters import ModelType
 from nncf.parameters import TargetDevice
 from nncf.quantization.advanced_parameters import AggregatorType
@@ -50,8 +51,6 @@ from nncf.torch.quantization.layers import AsymmetricQuantizer
 from nncf.torch.quantization.layers import BaseQuantizer
 from nncf.torch.quantization.layers import PTQuantizerSpec
 from nncf.torch.quantization.layers import get_scale_shape
-from nncf.torch.tensor_statistics.collectors import PTMeanMinMaxStatisticCollector
-from nncf.torch.tensor_statistics.collectors import PTMinMaxStatisticCollector
 from nncf.torch.tensor_statistics.statistics import PTMinMaxTensorStatistic
 
 
@@ -155,7 +154,7 @@ class PTMinMaxAlgoBackend(MinMaxAlgoBackend):
         quantizer_config: QuantizerConfig,
         inplace: bool,
         num_samples: int = None,
-    ) -> Union[PTMinMaxStatisticCollector, PTMeanMinMaxStatisticCollector]:
+    ) -> TensorCollector:
         if (
             range_estimator_params.min.statistics_type == StatisticsType.MIN
             and range_estimator_params.min.aggregator_type == AggregatorType.MIN
@@ -247,12 +246,12 @@ class PTMinMaxAlgoBackend(MinMaxAlgoBackend):
         target_point: PTTargetPoint,
         quantizer_config: QuantizerConfig,
         num_samples: int = None,
-    ) -> PTMeanMinMaxStatisticCollector:
+    ) -> TensorCollector:
         collector_params, scale_shape = PTMinMaxAlgoBackend._default_collector_params_and_scale_shape(
             nncf_graph, target_point, quantizer_config
         )
         init_config = RangeInitConfig(collector_name, num_samples)
-        return StatCollectorGenerator.generate_stat_collector_for_range_init_config(
+        return StatCollectorGenerator.generate_tensor_collector_for_range_init_config(
             init_config, scale_shape, collector_params, num_samples
         )
 
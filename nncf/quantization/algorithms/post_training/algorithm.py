@@ -81,6 +81,7 @@ class PostTrainingQuantization(Algorithm):
 
         if advanced_parameters is None:
             advanced_parameters = AdvancedQuantizationParameters()
+        self._backend_params = advanced_parameters.backend_params
 
         min_max_quantization = MinMaxQuantization(
             preset=preset,
@@ -153,17 +154,25 @@ class PostTrainingQuantization(Algorithm):
         :return: backnd-specific StatisticsAggregator
         """
         if backend == BackendType.ONNX:
+            from nncf.onnx.quantization.backend_parameters import BackendParameters
             from nncf.onnx.statistics.aggregator import ONNXStatisticsAggregator
 
-            return ONNXStatisticsAggregator(dataset)
+            return ONNXStatisticsAggregator(
+                dataset,
+                num_workers=self._backend_params.get(BackendParameters.STAT_WORKERS_NUMBER, 1),
+                num_threads_per_worker=self._backend_params.get(BackendParameters.STAT_WORKER_THREADS_NUMBER),
+            )
         if backend == BackendType.OPENVINO:
             from nncf.openvino.statistics.aggregator import OVStatisticsAggregator
 
             return OVStatisticsAggregator(dataset)
         if backend == BackendType.TORCH:
+            from nncf.torch.quantization.backend_parameters import BackendParameters
             from nncf.torch.statistics.aggregator import PTStatisticsAggregator
 
-            return PTStatisticsAggregator(dataset)
+            return PTStatisticsAggregator(
+                dataset, distributed=self._backend_params.get(BackendParameters.DISTRIBUTED_STATISTICS, False)
+            )
         return None
 
     def _apply(
@@ -47,6 +47,10 @@ class TFBatchnormAdaptationAlgorithmImpl(BatchnormAdaptationAlgorithmImpl):
     Implementation of the batch-norm statistics adaptation algorithm for the TensorFlow backend.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_batches = None
+
     def run(self, model: tf.keras.Model) -> None:
         """
         Runs the batch-norm statistics adaptation algorithm.
@@ -59,9 +63,16 @@ class TFBatchnormAdaptationAlgorithmImpl(BatchnormAdaptationAlgorithmImpl):
                 "does not support switch of devices. Model initial device "
                 "is used by default for batchnorm adaptation."
             )
+        if self._bn_only_forward:
+            raise ValueError("TF implementation of batchnorm adaptation algorithm does not support BN-only forward.")
+        batches = islice(self._data_loader, self._num_bn_adaptation_steps)
+        if self._cache_batches:
+            if self._cached_batches is None:
+                self._cached_batches = [x for x, _ in batches]
+            batches = ((x, None) for x in self._cached_batches)
         with BNTrainingStateSwitcher(model):
             for x, _ in ProgressBar(
-                islice(self._data_loader, self._num_bn_adaptation_steps),
+                batches,
                 total=self._num_bn_adaptation_steps,
                 desc="BatchNorm statistics adaptation",
             ):
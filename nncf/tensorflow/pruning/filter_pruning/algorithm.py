@@ -33,6 +33,8 @@ from nncf.common.pruning.statistics import PrunedModelStatistics
 from nncf.common.pruning.statistics import PrunedModelTheoreticalBorderline
 from nncf.common.pruning.utils import get_prunable_layers_in_out_channels
 from nncf.common.pruning.utils import get_rounded_pruned_element_number
+from nncf.common.pruning.weights_flops_calculator import IncrementalWeightsFlopsCounter
+from nncf.common.pruning.weights_flops_calculator import UniformPruningFlopsTable
 from nncf.common.pruning.weights_flops_calculator import WeightsFlopsCalculator
 from nncf.common.schedulers import StubCompressionScheduler
 from nncf.common.statistics import NNCFStatistics
@@ -141,6 +143,9 @@ class FilterPruningController(BasePruningAlgoController):
 
         self._pruned_layers_num = len(self._pruned_layer_groups_info.get_all_nodes())
         self._prunable_layers_num = len(self._original_graph.get_nodes_by_types(self._prunable_types))
+        self._uniform_pruning_flops_table = UniformPruningFlopsTable(
+            self._calculate_flops_and_weights_in_uniformly_pruned_model
+        )
         (
             self._min_possible_flops,
             self._min_possible_params,
@@ -393,6 +398,15 @@ class FilterPruningController(BasePruningAlgoController):
 
         # 2.
         tmp_in_channels, tmp_out_channels = get_prunable_layers_in_out_channels(self._original_graph)
+        flops_counter = IncrementalWeightsFlopsCounter(
+            self._weights_flops_calc,
+            self._original_graph,
+            self._output_shapes,
+            self._pruned_layer_groups_info,
+            self._next_nodes,
+            tmp_in_channels,
+            tmp_out_channels,
+        )
         sorted_importances = sorted(zip(filter_importances, group_indexes, filter_indexes), key=lambda x: x[0])
         for _, group_id, filter_index in sorted_importances:
             if self._pruning_quotas[group_id] == 0:
@@ -410,12 +424,7 @@ class FilterPruningController(BasePruningAlgoController):
                 output_channels=tmp_out_channels,
             )
 
-            flops, params_num = self._weights_flops_calc.count_flops_and_weights(
-                graph=self._original_graph,
-                output_shapes=self._output_shapes,
-                input_channels=tmp_in_channels,
-                output_channels=tmp_out_channels,
-            )
+            flops, params_num = flops_counter.recount_group(group_id)
             if flops <= target_flops:
                 # 3. Add masks to the graph and propagate them
                 for group in self._pruned_layer_groups_info.get_all_clusters():
@@ -450,21 +459,11 @@ class FilterPruningController(BasePruningAlgoController):
                         layer.ops_weights[op_name]["mask"].assign(broadcasted_mask)
 
     def _find_uniform_pruning_level_for_target_flops(self, target_flops_pruning_level):
-        error = 0.01
         target_flops = self.full_flops * (1 - target_flops_pruning_level)
-        left, right = 0.0, 1.0
-        while abs(right - left) > error:
-            middle = (left + right) / 2
-            flops, params_num = self._calculate_flops_and_weights_in_uniformly_pruned_model(middle)
-            if flops < target_flops:
-                right = middle
-            else:
-                left = middle
-        flops, params_num = self._calculate_flops_and_weights_in_uniformly_pruned_model(right)
-        if flops <= target_flops:
-            self.current_flops = flops
-            self.current_params_num = params_num
-            return right
+        search_result = self._uniform_pruning_flops_table.find_pruning_level(target_flops)
+        if search_result is not None:
+            pruning_level, self.current_flops, self.current_params_num = search_result
+            return pruning_level
         raise RuntimeError(
             f"Unable to prune the model to get the required " f"pruning level in flops = {target_flops_pruning_level}"
         )
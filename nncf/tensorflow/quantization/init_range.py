@@ -32,6 +32,8 @@ from nncf.tensorflow.layers.data_layout import get_channel_axis
 from nncf.tensorflow.layers.operation import InputType
 from nncf.tensorflow.layers.wrapper import NNCFWrapper
 from nncf.tensorflow.quantization.layers import FakeQuantize
+from nncf.tensorflow.tensor_statistics.collectors import TFHistogramMedianMADStatisticCollector
+from nncf.tensorflow.tensor_statistics.collectors import TFHistogramPercentileStatisticCollector
 from nncf.tensorflow.tensor_statistics.collectors import TFMeanMinMaxStatisticCollector
 from nncf.tensorflow.tensor_statistics.collectors import TFMeanPercentileStatisticCollector
 from nncf.tensorflow.tensor_statistics.collectors import TFMedianMADStatisticCollector
@@ -127,11 +129,18 @@ class RangeInitializer:
                 reduction_shape,
                 num_samples,
             )
+        num_histogram_bins = init_config.init_type_specific_params.get("num_histogram_bins")
         if range_type == "threesigma":
+            if num_histogram_bins is not None:
+                return TFHistogramMedianMADStatisticCollector(reduction_shape, num_samples, num_histogram_bins)
             return TFMedianMADStatisticCollector(reduction_shape, num_samples)
         if range_type == "percentile":
             min_percentile = init_config.init_type_specific_params.get("min_percentile", MIN_PERCENTILE)
             max_percentile = init_config.init_type_specific_params.get("max_percentile", MAX_PERCENTILE)
+            if num_histogram_bins is not None:
+                return TFHistogramPercentileStatisticCollector(
+                    [min_percentile, max_percentile], reduction_shape, num_samples, num_histogram_bins
+                )
             return TFPercentileStatisticCollector([min_percentile, max_percentile], reduction_shape, num_samples)
         if range_type == "mean_percentile":
             min_percentile = init_config.init_type_specific_params.get("min_percentile", MIN_PERCENTILE)
@@ -16,6 +16,8 @@ import tensorflow as tf
 
 from nncf.common.tensor import NNCFTensor
 from nncf.common.tensor import TensorElementsType
+from nncf.common.tensor_statistics.collectors import HistogramMedianMADStatisticCollector
+from nncf.common.tensor_statistics.collectors import HistogramPercentileStatisticCollector
 from nncf.common.tensor_statistics.collectors import MeanMinMaxStatisticCollector
 from nncf.common.tensor_statistics.collectors import MeanPercentileStatisticCollector
 from nncf.common.tensor_statistics.collectors import MedianMADStatisticCollector
@@ -23,6 +25,7 @@ from nncf.common.tensor_statistics.collectors import MinMaxStatisticCollector
 from nncf.common.tensor_statistics.collectors import MixedMinMaxStatisticCollector
 from nncf.common.tensor_statistics.collectors import NNCFCollectorTensorProcessor
 from nncf.common.tensor_statistics.collectors import PercentileStatisticCollector
+from nncf.common.tensor_statistics.reduction import get_per_channel_values
 from nncf.common.tensor_statistics.reduction import np_percentile_reduce_like
 from nncf.tensorflow.tensor import TFNNCFTensor
 from nncf.tensorflow.tensor_statistics.reduction import convert_rs_to_pt_type
@@ -85,6 +88,14 @@ class TFNNCFCollectorTensorProcessor(NNCFCollectorTensorProcessor):
         tensor_list = tf.unstack(tensor, axis=axis)
         return [TFNNCFTensor(t) for t in tensor_list]
 
+    @staticmethod
+    def to_numpy(x: NNCFTensor) -> np.ndarray:
+        return x.tensor.numpy()
+
+    @staticmethod
+    def from_numpy(x: np.ndarray) -> NNCFTensor:
+        return TFNNCFTensor(tf.convert_to_tensor(x))
+
     @staticmethod
     def sum(tensor: NNCFTensor) -> TensorElementsType:
         return tf.reduce_sum(tensor.tensor).numpy()
@@ -166,6 +177,32 @@ class TFPercentileStatisticCollector(PercentileStatisticCollector):
         return TFPercentileTensorStatistic(percentile_vs_values_dict)
 
 
+class TFHistogramMedianMADStatisticCollector(HistogramMedianMADStatisticCollector):
+    def _register_input(self, x: tf.Tensor):
+        x_np = x.numpy()
+        scale_shape = convert_rs_to_pt_type(x_np.shape, self._reduction_shape)
+        self._register_input_common(get_per_channel_values(x_np, list(scale_shape)))
+
+    def _get_statistics(self) -> TFMedianMADTensorStatistic:
+        numpy_median, numpy_mad = self._prepare_statistics()
+        median_tensor = tf.convert_to_tensor(numpy_median, dtype=tf.float32)
+        mad_tensor = tf.convert_to_tensor(numpy_mad, dtype=tf.float32)
+        return TFMedianMADTensorStatistic(median_tensor, mad_tensor)
+
+
+class TFHistogramPercentileStatisticCollector(HistogramPercentileStatisticCollector):
+    def _register_input(self, x: tf.Tensor):
+        x_np = x.numpy()
+        scale_shape = convert_rs_to_pt_type(x_np.shape, self._reduction_shape)
+        self._register_input_common(get_per_channel_values(x_np, list(scale_shape)))
+
+    def _get_statistics(self) -> TFPercentileTensorStatistic:
+        percentile_vs_values_dict = self._prepare_statistics()
+        for key, val in percentile_vs_values_dict.items():
+            percentile_vs_values_dict[key] = tf.convert_to_tensor(val, dtype=tf.float32)
+        return TFPercentileTensorStatistic(percentile_vs_values_dict)
+
+
 class TFMeanPercentileStatisticCollector(MeanPercentileStatisticCollector):
     def _register_input(self, x: tf.Tensor):
         x_np = x.numpy()
@@ -63,5 +63,8 @@ from nncf.torch.dynamic_graph.context import forward_nncf_trace
 from nncf.torch.dynamic_graph.patch_pytorch import patch_torch_operators
 
 from nncf.torch.extensions import force_build_cpu_extensions, force_build_cuda_extensions
+from nncf.torch.extensions import load_extensions_in_background
+from nncf.torch.quantization.quantize_functions import QuantizationKernelsType
+from nncf.torch.quantization.quantize_functions import set_quantization_kernels_type
 
 patch_torch_operators()
@@ -168,6 +168,9 @@ class QuantizationEnv:
         # Counter for number of evaluate_strategy calls
         self._n_eval = 0
 
+        # Scores of the evaluated policies, since the agent often revisits the same bitwidth assignments
+        self._quantized_score_per_policy = {}  # type: Dict[Tuple[int, ...], float]
+
         # Configure search space for precision according to target device
         if self.hw_cfg_type is None:
             self.model_bitwidth_space = params.bits
@@ -589,7 +592,13 @@ class QuantizationEnv:
                 f"[Q.Env] {str(self.qctrl.all_quantizations[find_qid_by_str(self.qctrl, qid)]):50} | {idx}"
             )
 
-        quantized_score = self._run_quantization_pipeline(finetune=self.finetune)
+        policy = tuple(int(bw) for bw in self.master_df["action"])
+        if policy in self._quantized_score_per_policy:
+            quantized_score = self._quantized_score_per_policy[policy]
+            nncf_logger.info(f"[Q.Env] Quantized Score: {quantized_score:.3f} (the policy was evaluated before)")
+        else:
+            quantized_score = self._run_quantization_pipeline(finetune=self.finetune)
+            self._quantized_score_per_policy[policy] = quantized_score
 
         current_model_size = self.model_size_calculator(self._get_quantizer_bitwidth())
         current_model_ratio = self.model_size_calculator.get_model_size_ratio(self._get_quantizer_bitwidth())
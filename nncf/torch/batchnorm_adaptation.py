@@ -9,8 +9,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Dict
+
+import torch
+
 from nncf.common.initialization.batchnorm_adaptation import BatchnormAdaptationAlgorithmImpl
+from nncf.torch.initialization import CachedInitializingDataLoader
 from nncf.torch.initialization import DataLoaderBNAdaptationRunner
+from nncf.torch.utils import get_model_device
 
 
 class PTBatchnormAdaptationAlgorithmImpl(BatchnormAdaptationAlgorithmImpl):
@@ -18,11 +24,52 @@ class PTBatchnormAdaptationAlgorithmImpl(BatchnormAdaptationAlgorithmImpl):
     Implementation of the batch-norm statistics adaptation algorithm for the PyTorch.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_data_loader = None
+
     def run(self, model) -> None:
         """
         Runs the batch-norm statistics adaptation algorithm.
 
         :param model: A model for which the algorithm will be applied.
         """
-        bn_adaptation_runner = DataLoaderBNAdaptationRunner(model, self._device)
-        bn_adaptation_runner.run(self._data_loader, self._num_bn_adaptation_steps)
+        data_loader = self._data_loader
+        if self._cache_batches:
+            if self._cached_data_loader is None:
+                device = self._device if self._device is not None else get_model_device(model)
+                self._cached_data_loader = CachedInitializingDataLoader(
+                    self._data_loader, self._num_bn_adaptation_steps, device
+                )
+            data_loader = self._cached_data_loader
+        bn_adaptation_runner = DataLoaderBNAdaptationRunner(model, self._device, self._bn_only_forward)
+        bn_adaptation_runner.run(data_loader, self._num_bn_adaptation_steps)
+
+
+def get_batchnorm_statistics(model: torch.nn.Module) -> Dict[str, Dict[str, torch.Tensor]]:
+    """
+    Returns the copies of the running statistics of the batch-norm layers of the model.
+
+    :param model: Model to get the statistics of.
+    :return: Buffers of the batch-norm layers by the names of the buffers and the layers.
+    """
+    return {
+        name: {buffer_name: buffer.clone() for buffer_name, buffer in module.named_buffers(recurse=False)}
+        for name, module in model.named_modules()
+        if isinstance(module, torch.nn.modules.batchnorm._BatchNorm)  # pylint: disable=protected-access
+    }
+
+
+def set_batchnorm_statistics(model: torch.nn.Module, statistics: Dict[str, Dict[str, torch.Tensor]]) -> None:
+    """
+    Sets the running statistics of the batch-norm layers of the model returned by `get_batchnorm_statistics`
+    for the same model or its copy.
+
+    :param model: Model to set the statistics to.
+    :param statistics: Buffers of the batch-norm layers by the names of the buffers and the layers.
+    """
+    modules = dict(model.named_modules())
+    with torch.no_grad():
+        for name, buffers in statistics.items():
+            for buffer_name, value in buffers.items():
+                getattr(modules[name], buffer_name).copy_(value)
@@ -101,7 +101,9 @@ class BinarizedFunctionsCUDALoader(ExtensionLoader):
             ) from e
 
 
-BinarizedFunctionsCPU = ExtensionNamespace(BinarizedFunctionsCPULoader())
+BinarizedFunctionsCPU = ExtensionNamespace(
+    BinarizedFunctionsCPULoader(), fallback_namespace=ReferenceBinarizedFunctions
+)
 
 if torch.cuda.is_available():
     BinarizedFunctionsCUDA = ExtensionNamespace(BinarizedFunctionsCUDALoader())
@@ -144,6 +144,11 @@ class TracingContext:
     def find_operator_node(
         self, tensor_metas: List[Optional[TensorMeta]], op_address: OperationAddress
     ) -> Optional[DynamicGraphNode]:
+        if not self._may_add_nodes:
+            # The graph cannot be modified while node additions are disabled, so it is safe to search it
+            # concurrently from any number of threads without touching the condition variable.
+            return self.graph.find_node(op_address, tensor_metas, self._input_comparators_per_scope)
+
         with self._threading.cond:
             self._n_instances_searching_graph += 1
 
@@ -182,6 +187,10 @@ class TracingContext:
         with self._threading.cond:
             while self._n_instances_searching_graph > 0:
                 self._threading.cond.wait()
+            # The node additions may have been disabled by another thread since the unsynchronized check above
+            # or while waiting, and then the graph may already be searched without synchronization.
+            if not self._may_add_nodes:
+                return None
             # Another thread may have added a node inside this block,
             # so we need to check again if a node is already added.
             node = self.graph.find_node(op_address, tensor_metas, self._input_comparators_per_scope)
@@ -312,11 +321,24 @@ class TracingContext:
     def enable_forwarding(self):
         self._is_forwarding = True
 
+    @property
+    def is_node_addition_enabled(self) -> bool:
+        return self._may_add_nodes
+
     def enable_node_additions(self):
-        self._may_add_nodes = True
+        with self._threading.cond:
+            self._may_add_nodes = True
 
     def disable_node_additions(self):
-        self._may_add_nodes = False
+        """
+        Disables adding new nodes to the dynamic graph. Since the graph is then effectively immutable, the subsequent
+        node lookups are done without synchronization between threads, which removes the contention in
+        multithreaded (e.g. DataParallel) execution of the model once the graph is built.
+        """
+        # Taking the condition ensures that a node addition that may be in progress in another thread is finished
+        # before the lock-free lookups start.
+        with self._threading.cond:
+            self._may_add_nodes = False
 
     def add_node_comparators(self, scopes_to_apply: List[str], node_input_comparator: "TensorMetaComparator" = None):
         self._input_comparators_per_scope.append((node_input_comparator, scopes_to_apply))
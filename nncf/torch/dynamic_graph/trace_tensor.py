@@ -55,6 +55,12 @@ class TracedTensor(torch.Tensor):
     relation between tensor producer and consumer operations.
     """
 
+    # Class-level defaults that are seen by the tensors turned into TracedTensors without metainformation
+    # (see `as_metaless_traced_tensor`). Such tensors are considered expired from the start, since
+    # they carry no producer information to be trusted during graph tracing.
+    tensor_meta = None
+    _nncf_expired = True
+
     @staticmethod
     def from_torch_tensor(tensor, tensor_meta: TensorMeta):
         tensor.tensor_meta = tensor_meta
@@ -63,6 +69,21 @@ class TracedTensor(torch.Tensor):
         tensor._nncf_expired = False
         return tensor
 
+    @staticmethod
+    def as_metaless_traced_tensor(tensor: torch.Tensor) -> "TracedTensor":
+        """
+        Turns the tensor into a TracedTensor without metainformation. Only the class of the tensor object is
+        switched, so that no per-tensor Python objects are allocated. Used when the dynamic graph is not being
+        traced and the tensor metainformation is not required, while the TracedTensor class is still needed
+        for the tensor methods to be intercepted by NNCF.
+
+        :param tensor: The tensor to be turned into a TracedTensor.
+        :return: The same tensor object as a TracedTensor.
+        """
+        if not isinstance(tensor, TracedTensor):
+            tensor.__class__ = TracedTensor
+        return tensor
+
     def nncf_expire(self):
         """
         Mark the traced tensor as "expired". The tensor's metainformation should
@@ -131,6 +152,19 @@ def trace_tensors(
     retains intermediate tensor values.
     :return: Same structure as `operator_output`, but with torch.Tensor entries turned into TracedTensors.
     """
+    if ctx is not None and not ctx.trace_dynamic_graph:
+        # Tensor metainformation is only consumed when the dynamic graph is traced, so in the steady state
+        # the outputs are only switched to the TracedTensor class without creating metas or registering weakrefs.
+        if isinstance(operator_output, (list, tuple)):
+            output_ = [
+                TracedTensor.as_metaless_traced_tensor(x) if isinstance(x, torch.Tensor) else x for x in operator_output
+            ]
+            return operator_output.__class__(output_)
+        if isinstance(operator_output, torch.Tensor):
+            return TracedTensor.as_metaless_traced_tensor(operator_output)
+        nncf_logger.debug(f"Could not find tensors to trace in operator output: {operator_output}")
+        return operator_output
+
     if isinstance(operator_output, (list, tuple)):
         output_ = []
         for i, x in enumerate(operator_output):
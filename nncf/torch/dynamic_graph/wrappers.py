@@ -37,7 +37,8 @@ def _warn_data_parallel():
     _warn_data_parallel.warned_once = True
     nncf_logger.warning(
         "You are using DataParallel, which may cause significant performance issues with dynamic graph "
-        "building. Consider using distributed training (DistributedDataParallel) instead."
+        "building. Consider using distributed training (DistributedDataParallel) instead, or disable the "
+        "dynamic graph building (NNCFNetwork.disable_dynamic_graph_building) once the graph is built."
     )
 
 
@@ -179,7 +180,7 @@ def _execute_op(
     elif ctx.trace_dynamic_graph:
         tensor_metas = make_tensor_metas(processed_input)
         node = ctx.find_operator_node(tensor_metas, op_address)
-        if node is None:
+        if node is None and ctx.is_node_addition_enabled:
             layer_attrs, ignored_algos = _collect_module_attrs_and_ignored_algorithms(ctx, op_name, args, kwargs)
             is_called_inside_nncf_module = isinstance(ctx.get_current_module(), _NNCFModuleMixin)
             node = ctx.maybe_add_node(
@@ -1,8 +1,12 @@
 import enum
+import hashlib
+import threading
+import weakref
 from abc import ABC
 from abc import abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable, Optional
 
 import torch
 from torch.utils.cpp_extension import _get_build_directory
@@ -20,8 +24,29 @@ class ExtensionsType(enum.Enum):
     CUDA = 1
 
 
+EXTENSIONS_SOURCES_DIR = Path(__file__).parent
+EXTENSIONS_SOURCES_SUFFIXES = (".cpp", ".cu", ".h", ".cuh")
+
+
+@lru_cache(maxsize=None)
+def get_extensions_sources_hash() -> str:
+    """
+    Returns a hash of the contents of the NNCF extension sources, so that the extensions built from different
+    sources are cached in different build directories.
+    """
+    hasher = hashlib.sha256()
+    for path in sorted(EXTENSIONS_SOURCES_DIR.rglob("*")):
+        if path.suffix not in EXTENSIONS_SOURCES_SUFFIXES:
+            continue
+        hasher.update(path.relative_to(EXTENSIONS_SOURCES_DIR).as_posix().encode())
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()[:16]
+
+
 def get_build_directory_for_extension(name: str) -> Path:
-    build_dir = Path(_get_build_directory("nncf/" + name, verbose=False)) / torch.__version__
+    build_dir = (
+        Path(_get_build_directory("nncf/" + name, verbose=False)) / torch.__version__ / get_extensions_sources_hash()
+    )
     if not build_dir.exists():
         nncf_logger.debug(f"Creating build directory: {str(build_dir)}")
         build_dir.mkdir(parents=True, exist_ok=True)
@@ -49,17 +74,51 @@ class ExtensionLoader(ABC):
         return str(get_build_directory_for_extension(cls.name()))
 
 
+_EXTENSION_NAMESPACES = weakref.WeakSet()  # type: weakref.WeakSet[ExtensionNamespace]
+
+
 class ExtensionNamespace:
     """
     Provides lazy loading of the underlying extension, i.e. on the first request of a function from the extension.
+    The extension may also be loaded in a background thread, in which case the functions are taken from
+    the fallback namespace (if any) until the loading is finished.
     """
 
-    def __init__(self, loader: ExtensionLoader):
+    def __init__(self, loader: ExtensionLoader, fallback_namespace: Optional[Any] = None):
         """
         :param loader: The extension loader.
+        :param fallback_namespace: An object providing the same functions as the extension, used while the extension
+          is being loaded in background.
         """
         self._loaded_namespace = None
         self._loader = loader
+        self._fallback_namespace = fallback_namespace
+        self._loading_thread = None  # type: Optional[threading.Thread]
+        self._lock = threading.Lock()
+        _EXTENSION_NAMESPACES.add(self)
+
+    def _load(self):
+        with extension_is_loading_info_log(self._loader.name()):
+            self._loaded_namespace = self._loader.load()
+
+    def _load_in_background(self):
+        try:
+            self._load()
+        except Exception as e:  # pylint:disable=broad-except
+            # Will be raised again by a synchronous loading attempt on the next `get` call
+            nncf_logger.debug(f"Background loading of {self._loader.name()} failed: {str(e)}")
+
+    def load_in_background(self):
+        """
+        Starts loading (and compiling, if necessary) the extension in a separate thread.
+        """
+        with self._lock:
+            if self._loaded_namespace is not None or self._loading_thread is not None:
+                return
+            self._loading_thread = threading.Thread(
+                target=self._load_in_background, name=f"nncf_{self._loader.name()}_loader", daemon=True
+            )
+            self._loading_thread.start()
 
     def get(self, fn_name: str) -> Callable:
         """
@@ -70,8 +129,15 @@ class ExtensionNamespace:
         :return: A callable object corresponding to the requested function.
         """
         if self._loaded_namespace is None:
-            with extension_is_loading_info_log(self._loader.name()):
-                self._loaded_namespace = self._loader.load()
+            loading_thread = self._loading_thread
+            if loading_thread is not None and loading_thread.is_alive() and self._fallback_namespace is not None:
+                return getattr(self._fallback_namespace, fn_name)
+            if loading_thread is not None:
+                loading_thread.join()
+            with self._lock:
+                # The background loading may have failed with an exception, which should then be raised here
+                if self._loaded_namespace is None:
+                    self._load()
         return getattr(self._loaded_namespace, fn_name)
 
 
@@ -92,6 +158,17 @@ def force_build_cuda_extensions():
     _force_build_extensions(ExtensionsType.CUDA)
 
 
+@api(canonical_alias="nncf.torch.load_extensions_in_background")
+def load_extensions_in_background():
+    """
+    Starts loading (and compiling, if not already built) the NNCF extensions in background threads, so that
+    the first model forward call does not wait for the compilation to finish. Until an extension is loaded,
+    the corresponding torch-native reference implementation is used, if available.
+    """
+    for namespace in _EXTENSION_NAMESPACES:
+        namespace.load_in_background()
+
+
 class CudaNotAvailableStub:
     def __getattr__(self, item):
         raise RuntimeError(
@@ -0,0 +1,61 @@
+# Copyright (c) 2023 Intel Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Builds the NNCF PyTorch extensions ahead of time, e.g. during a container image build, so that the compiled
+extensions are taken from the build cache instead of being compiled on the first model forward call:
+
+    python -m nncf.torch.extensions [--cpu-only]
+
+The cache location is controlled with the TORCH_EXTENSIONS_DIR environment variable.
+"""
+
+import argparse
+import sys
+from types import ModuleType
+
+import torch
+
+from nncf.common.logging import nncf_logger
+from nncf.torch.extensions import EXTENSIONS
+from nncf.torch.extensions import ExtensionsType
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Builds the NNCF PyTorch extensions ahead of time.")
+    parser.add_argument(
+        "--cpu-only",
+        action="store_true",
+        help="Build the CPU extensions only. By default, CUDA extensions are also built if CUDA is available.",
+    )
+    args = parser.parse_args(argv)
+
+    ext_types = [ExtensionsType.CPU]
+    if not args.cpu_only and torch.cuda.is_available():
+        ext_types.append(ExtensionsType.CUDA)
+
+    failed = []
+    for loader_cls in EXTENSIONS.registry_dict.values():
+        if loader_cls.extension_type() not in ext_types:
+            continue
+        nncf_logger.info(f"Building {loader_cls.name()} in {loader_cls.get_build_dir()}")
+        # The loaders of CPU extensions fall back to the reference implementations instead of raising
+        if not isinstance(loader_cls.load(), ModuleType):
+            failed.append(loader_cls.name())
+
+    if failed:
+        nncf_logger.error(f"Failed to build the extensions: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
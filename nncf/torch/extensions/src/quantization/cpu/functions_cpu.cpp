@@ -1,8 +1,257 @@
+#include <ATen/Parallel.h>
+#include <ATen/AccumulateType.h>
+#include <ATen/cpu/vec/vec.h>
+
 #include "common_cpu_funcs.h"
 #include "common_defs.h"
 
 namespace {
 
+// Number of consecutive input elements processed as a single work item by the fused kernels.
+constexpr int64_t FUSED_KERNEL_CHUNK_SIZE = 32768;
+
+// Describes the input as a [outer, channels, inner] contiguous layout, so that the elements
+// of each of the (outer * channels) blocks of `inner` elements share the same quantization parameters.
+struct ChannelLayout {
+    int64_t outer;
+    int64_t channels;
+    int64_t inner;
+    int64_t chunks_per_block;
+};
+
+bool get_channel_layout(const at::Tensor& input, const at::Tensor& input_range, ChannelLayout& layout) {
+    layout.outer = 1;
+    layout.channels = 1;
+    layout.inner = input.numel();
+    if (input_range.numel() != 1) {
+        if (input_range.dim() != input.dim()) {
+            return false;
+        }
+        int64_t channel_dim = -1;
+        for (int64_t dim_idx = 0; dim_idx < input.dim(); dim_idx++) {
+            if (input_range.size(dim_idx) == 1) {
+                continue;
+            }
+            if (channel_dim != -1 || input_range.size(dim_idx) != input.size(dim_idx)) {
+                // Only the quantization parameters varying along a single dimension are supported
+                return false;
+            }
+            channel_dim = dim_idx;
+        }
+        layout.outer = 1;
+        for (int64_t dim_idx = 0; dim_idx < channel_dim; dim_idx++) {
+            layout.outer *= input.size(dim_idx);
+        }
+        layout.channels = input.size(channel_dim);
+        layout.inner = 1;
+        for (int64_t dim_idx = channel_dim + 1; dim_idx < input.dim(); dim_idx++) {
+            layout.inner *= input.size(dim_idx);
+        }
+    }
+    layout.chunks_per_block = std::max<int64_t>(1, at::divup(layout.inner, FUSED_KERNEL_CHUNK_SIZE));
+    return true;
+}
+
+bool can_use_fused_kernels(const at::Tensor& input, const at::Tensor& input_range, ChannelLayout& layout) {
+    auto dtype = input.scalar_type();
+    if (dtype != at::kFloat && dtype != at::kDouble) {
+        return false;
+    }
+    if (input.numel() == 0) {
+        return false;
+    }
+    return get_channel_layout(input, input_range, layout);
+}
+
+// Quantization parameters of a single channel, precomputed once per work item.
+template <typename scalar_t>
+struct ChannelParams {
+    scalar_t low;
+    scalar_t high;
+    scalar_t scale;
+    scalar_t zero_point;
+    scalar_t reverted_range;
+
+    ChannelParams(scalar_t input_low, scalar_t input_range, scalar_t levels) {
+        low = input_low;
+        high = input_low + input_range;
+        scale = (levels - 1) / input_range;
+        // zero_point is referred as ZP in docs
+        zero_point = std::nearbyint(-input_low * scale);
+        reverted_range = 1 / input_range;
+    }
+};
+
+template <typename scalar_t>
+inline scalar_t quantize_scalar(scalar_t x, const ChannelParams<scalar_t>& p) {
+    scalar_t output = std::max(std::min(x, p.high), p.low);
+    output = std::nearbyint((output - p.low) * p.scale - p.zero_point);
+    return output / p.scale;
+}
+
+template <typename scalar_t>
+inline at::vec::Vectorized<scalar_t> quantize_vec(
+        const at::vec::Vectorized<scalar_t>& x,
+        const at::vec::Vectorized<scalar_t>& low,
+        const at::vec::Vectorized<scalar_t>& high,
+        const at::vec::Vectorized<scalar_t>& scale,
+        const at::vec::Vectorized<scalar_t>& zero_point) {
+    auto output = at::vec::maximum(at::vec::minimum(x, high), low);
+    output = ((output - low) * scale - zero_point).round();
+    return output / scale;
+}
+
+template <typename F>
+void parallel_for_each_chunk(const ChannelLayout& layout, const F& f) {
+    int64_t num_chunks = layout.outer * layout.channels * layout.chunks_per_block;
+    int64_t chunk_size = std::min(layout.inner, FUSED_KERNEL_CHUNK_SIZE);
+    int64_t grain_size = std::max<int64_t>(1, FUSED_KERNEL_CHUNK_SIZE / chunk_size);
+    at::parallel_for(0, num_chunks, grain_size, [&](int64_t begin, int64_t end) {
+        for (int64_t chunk_idx = begin; chunk_idx < end; chunk_idx++) {
+            int64_t block_idx = chunk_idx / layout.chunks_per_block;
+            int64_t offset_in_block = (chunk_idx % layout.chunks_per_block) * FUSED_KERNEL_CHUNK_SIZE;
+            int64_t channel_idx = block_idx % layout.channels;
+            int64_t offset = block_idx * layout.inner + offset_in_block;
+            int64_t count = std::min(FUSED_KERNEL_CHUNK_SIZE, layout.inner - offset_in_block);
+            f(chunk_idx, channel_idx, offset, count);
+        }
+    });
+}
+
+template <typename scalar_t>
+at::Tensor q_cpu_forward_fused(
+        const at::Tensor& input,
+        const at::Tensor& input_low,
+        const at::Tensor& input_range,
+        scalar_t levels,
+        const ChannelLayout& layout) {
+    using Vec = at::vec::Vectorized<scalar_t>;
+    auto input_c = input.contiguous();
+    auto input_low_c = input_low.contiguous();
+    auto input_range_c = input_range.contiguous();
+    auto output = at::empty_like(input_c, at::MemoryFormat::Contiguous);
+
+    const scalar_t* input_data = input_c.data_ptr<scalar_t>();
+    const scalar_t* input_low_data = input_low_c.data_ptr<scalar_t>();
+    const scalar_t* input_range_data = input_range_c.data_ptr<scalar_t>();
+    scalar_t* output_data = output.data_ptr<scalar_t>();
+
+    parallel_for_each_chunk(layout, [&](int64_t /*chunk_idx*/, int64_t channel_idx, int64_t offset, int64_t count) {
+        ChannelParams<scalar_t> p(input_low_data[channel_idx], input_range_data[channel_idx], levels);
+        const Vec low(p.low), high(p.high), scale(p.scale), zero_point(p.zero_point);
+        const scalar_t* x = input_data + offset;
+        scalar_t* y = output_data + offset;
+        int64_t i = 0;
+        for (; i + Vec::size() <= count; i += Vec::size()) {
+            quantize_vec(Vec::loadu(x + i), low, high, scale, zero_point).store(y + i);
+        }
+        for (; i < count; i++) {
+            y[i] = quantize_scalar(x[i], p);
+        }
+    });
+    return output;
+}
+
+template <typename scalar_t>
+std::vector<at::Tensor> q_cpu_backward_fused(
+        const at::Tensor& grad_output,
+        const at::Tensor& input,
+        const at::Tensor& input_low,
+        const at::Tensor& input_range,
+        scalar_t levels,
+        scalar_t levels_low,
+        scalar_t levels_high,
+        bool is_asymmetric,
+        const ChannelLayout& layout) {
+    using Vec = at::vec::Vectorized<scalar_t>;
+    using acc_t = at::acc_type<scalar_t, /*is_cuda=*/false>;
+    auto grad_output_c = grad_output.contiguous();
+    auto input_c = input.contiguous();
+    auto input_low_c = input_low.contiguous();
+    auto input_range_c = input_range.contiguous();
+    at::Tensor grad_input = at::empty_like(input_c, at::MemoryFormat::Contiguous);
+
+    // Per-chunk partial sums of the parameter gradients, reduced to the per-channel values afterwards
+    at::TensorOptions acc_options = input.options().dtype(c10::CppTypeToScalarType<acc_t>::value);
+    at::Tensor grad_range_partial = at::empty({layout.outer, layout.channels, layout.chunks_per_block}, acc_options);
+    at::Tensor grad_low_partial = at::empty({layout.outer, layout.channels, layout.chunks_per_block}, acc_options);
+
+    const scalar_t* grad_output_data = grad_output_c.data_ptr<scalar_t>();
+    const scalar_t* input_data = input_c.data_ptr<scalar_t>();
+    const scalar_t* input_low_data = input_low_c.data_ptr<scalar_t>();
+    const scalar_t* input_range_data = input_range_c.data_ptr<scalar_t>();
+    scalar_t* grad_input_data = grad_input.data_ptr<scalar_t>();
+    acc_t* grad_range_partial_data = grad_range_partial.data_ptr<acc_t>();
+    acc_t* grad_low_partial_data = grad_low_partial.data_ptr<acc_t>();
+    scalar_t alpha = levels_low / levels_high;
+
+    parallel_for_each_chunk(layout, [&](int64_t chunk_idx, int64_t channel_idx, int64_t offset, int64_t count) {
+        ChannelParams<scalar_t> p(input_low_data[channel_idx], input_range_data[channel_idx], levels);
+        const Vec low(p.low), high(p.high), scale(p.scale), zero_point(p.zero_point);
+        const Vec reverted_range(p.reverted_range), alpha_vec(alpha), ones(1), zeros(0);
+        const scalar_t* x = input_data + offset;
+        const scalar_t* g = grad_output_data + offset;
+        scalar_t* grad_x = grad_input_data + offset;
+
+        Vec grad_range_vec(0), grad_low_vec(0);
+        int64_t i = 0;
+        for (; i + Vec::size() <= count; i += Vec::size()) {
+            Vec x_vec = Vec::loadu(x + i);
+            Vec g_vec = Vec::loadu(g + i);
+            Vec output = quantize_vec(x_vec, low, high, scale, zero_point);
+            Vec mask_hi = x_vec > high;
+            Vec mask_lo = x_vec < low;
+            Vec outside_mask = mask_hi | mask_lo;
+
+            Vec err = (output - x_vec) * reverted_range;
+            err = Vec::blendv(err, ones, mask_hi);
+            err = Vec::blendv(err, alpha_vec, mask_lo);
+            grad_range_vec = grad_range_vec + err * g_vec;
+            grad_low_vec = grad_low_vec + Vec::blendv(zeros, g_vec, outside_mask);
+            Vec::blendv(g_vec, zeros, outside_mask).store(grad_x + i);
+        }
+
+        acc_t grad_range_sum = 0;
+        acc_t grad_low_sum = 0;
+        __at_align__ scalar_t buffer[Vec::size()];
+        grad_range_vec.store(buffer);
+        for (int64_t j = 0; j < Vec::size(); j++) {
+            grad_range_sum += buffer[j];
+        }
+        grad_low_vec.store(buffer);
+        for (int64_t j = 0; j < Vec::size(); j++) {
+            grad_low_sum += buffer[j];
+        }
+
+        for (; i < count; i++) {
+            scalar_t output = quantize_scalar(x[i], p);
+            if (x[i] > p.high) {
+                grad_range_sum += g[i];
+                grad_low_sum += g[i];
+                grad_x[i] = 0;
+            } else if (x[i] < p.low) {
+                grad_range_sum += alpha * g[i];
+                grad_low_sum += g[i];
+                grad_x[i] = 0;
+            } else {
+                grad_range_sum += (output - x[i]) * p.reverted_range * g[i];
+                grad_x[i] = g[i];
+            }
+        }
+        grad_range_partial_data[chunk_idx] = grad_range_sum;
+        grad_low_partial_data[chunk_idx] = grad_low_sum;
+    });
+
+    std::vector<int64_t> reduced_dims = {0, 2};
+    at::Tensor grad_input_range = grad_range_partial.sum(reduced_dims).to(input.scalar_type()).view(input_range.sizes());
+    if (is_asymmetric) {
+        at::Tensor grad_input_low = grad_low_partial.sum(reduced_dims).to(input.scalar_type()).view(input_low.sizes());
+        return {grad_input, grad_input_low, grad_input_range};
+    }
+    auto dummy_variable = torch::autograd::make_variable(at::empty(input_low.sizes()), true);
+    return {grad_input, dummy_variable, grad_input_range};
+}
+
 template <typename scalar_t>
 at::Tensor q_cpu_forward(
         at::Tensor input,
@@ -64,7 +313,16 @@ std::vector<at::Tensor> q_cpu_backward(
 
 #define CHECK_INPUT(x) CHECK_CPU(x)
 
-at::Tensor q_forward(
+void check_quantization_params(const at::Tensor& input_low, const at::Tensor& input_range) {
+    TORCH_CHECK(input_low.dim() == input_range.dim(), "input_low and input_range have different dimensionality");
+    int64_t scale_dim = input_range.dim();
+    for (int i = 0; i < scale_dim; i++)
+    {
+        TORCH_CHECK(input_low.size(i) == input_range.size(i), "input_low and input_range have different dimension sizes");
+    }
+}
+
+at::Tensor q_forward_generic(
         at::Tensor input,
         at::Tensor input_low,
         at::Tensor input_range,
@@ -72,12 +330,7 @@ at::Tensor q_forward(
     CHECK_INPUT(input);
     CHECK_INPUT(input_low);
     CHECK_INPUT(input_range);
-    TORCH_CHECK(input_low.dim() == input_range.dim(), "input_low and input_range have different dimensionality");
-    int64_t scale_dim = input_range.dim();
-    for (int i = 0; i < scale_dim; i++)
-    {
-        TORCH_CHECK(input_low.size(i) == input_range.size(i), "input_low and input_range have different dimension sizes");
-    }
+    check_quantization_params(input_low, input_range);
 
     at::Tensor output;
     AT_DISPATCH_FLOATING_TYPES_AND_HALF(input.type(), "q_cpu_forward", ([&] {
@@ -87,7 +340,7 @@ at::Tensor q_forward(
     return output;
 }
 
-std::vector<at::Tensor> q_backward(
+std::vector<at::Tensor> q_backward_generic(
         at::Tensor grad_output,
         at::Tensor input,
         at::Tensor input_low,
@@ -109,10 +362,63 @@ std::vector<at::Tensor> q_backward(
     return results;
 }
 
+at::Tensor q_forward(
+        at::Tensor input,
+        at::Tensor input_low,
+        at::Tensor input_range,
+        int levels) {
+    CHECK_INPUT(input);
+    CHECK_INPUT(input_low);
+    CHECK_INPUT(input_range);
+    check_quantization_params(input_low, input_range);
+
+    ChannelLayout layout;
+    if (!can_use_fused_kernels(input, input_range, layout) || input_range.scalar_type() != input.scalar_type()) {
+        return q_forward_generic(input, input_low, input_range, levels);
+    }
+
+    at::Tensor output;
+    AT_DISPATCH_FLOATING_TYPES(input.scalar_type(), "q_cpu_forward_fused", ([&] {
+      output = q_cpu_forward_fused<scalar_t>(input, input_low, input_range, levels, layout);
+    }));
+
+    return output;
+}
+
+std::vector<at::Tensor> q_backward(
+        at::Tensor grad_output,
+        at::Tensor input,
+        at::Tensor input_low,
+        at::Tensor input_range,
+        int levels,
+        int level_low,
+        int level_high,
+        bool is_asymmetric) {
+    CHECK_INPUT(grad_output);
+    CHECK_INPUT(input);
+    CHECK_INPUT(input_low);
+    CHECK_INPUT(input_range);
+
+    ChannelLayout layout;
+    if (!can_use_fused_kernels(input, input_range, layout) || input_range.scalar_type() != input.scalar_type()
+            || grad_output.scalar_type() != input.scalar_type() || grad_output.sizes() != input.sizes()) {
+        return q_backward_generic(grad_output, input, input_low, input_range, levels, level_low, level_high, is_asymmetric);
+    }
+
+    std::vector<at::Tensor> results;
+    AT_DISPATCH_FLOATING_TYPES(input.scalar_type(), "q_cpu_backward_fused", ([&] {
+        results = q_cpu_backward_fused<scalar_t>(grad_output, input, input_low, input_range, levels, level_low, level_high, is_asymmetric, layout);
+    }));
+
+    return results;
+}
+
 
 }  // namespace
 
 PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
   m.def("Quantize_forward", &q_forward, "Quantize forward");
   m.def("Quantize_backward", &q_backward, "Quantize backward");
+  m.def("Quantize_forward_generic", &q_forward_generic, "Quantize forward (non-fused ATen operations)");
+  m.def("Quantize_backward_generic", &q_backward_generic, "Quantize backward (non-fused ATen operations)");
 }
@@ -89,6 +89,40 @@ def wrap_dataloader_for_init(data_loader) -> PTInitializingDataLoader:
     return data_loader
 
 
+class CachedInitializingDataLoader(PTInitializingDataLoader):
+    """
+    Loads the first batches of the data loader once and keeps the model inputs on the given device,
+    so that the initialization can be repeated without data loading and host-to-device copies.
+    """
+
+    def __init__(self, data_loader: DataLoader, num_batches: Optional[int], device: torch.device):
+        """
+        :param data_loader: Data loader to load the batches from.
+        :param num_batches: Number of batches to keep. If `None`, all batches of the data loader are kept.
+        :param device: Device to keep the model inputs on.
+        """
+        data_loader = wrap_dataloader_for_init(data_loader)
+        super().__init__(data_loader)
+        to_device_fn = partial(torch.Tensor.to, device=device)
+        self._cached_inputs = []
+        for i, loaded_item in enumerate(data_loader):
+            if num_batches is not None and i >= num_batches:
+                break
+            self._cached_inputs.append(objwalk(data_loader.get_inputs(loaded_item), is_tensor, to_device_fn))
+
+    def __iter__(self):
+        return iter(self._cached_inputs)
+
+    def __len__(self):
+        return len(self._cached_inputs)
+
+    def get_inputs(self, dataloader_output: Tuple[Tuple, Dict]) -> Tuple[Tuple, Dict]:
+        return dataloader_output
+
+    def get_target(self, dataloader_output: Any) -> Any:
+        raise RuntimeError("Targets are not cached by CachedInitializingDataLoader")
+
+
 class PartialDataLoader:
     def __init__(self, regular_data_loader: DataLoader, iter_ratio=1.0):
         if iter_ratio < 0.0 or iter_ratio > 1.0:
@@ -167,12 +201,20 @@ class SimpleDataLoaderRunner(DataLoaderBaseRunner):
         pass
 
 
+class LastBatchnormReached(Exception):
+    """
+    Raised to stop the forward pass after the last batch-norm layer of the model.
+    """
+
+
 class DataLoaderBNAdaptationRunner(DataLoaderBaseRunner):
-    def __init__(self, model, init_device: str):
+    def __init__(self, model, init_device: str, bn_only_forward: bool = False):
         super().__init__(model, init_device)
         self.progressbar_description = "BatchNorm statistics adaptation"
         self.original_momenta_values = {}
         self.original_training_state = {}
+        self._bn_only_forward = bn_only_forward
+        self._last_bn_call = None
 
     @staticmethod
     def _apply_to_batchnorms(func):
@@ -215,7 +257,52 @@ class DataLoaderBNAdaptationRunner(DataLoaderBaseRunner):
                 if num_init_steps is not None and i >= num_init_steps:
                     break
                 args_kwargs_tuple = data_loader.get_inputs(loaded_item)
+                if self._bn_only_forward:
+                    self._infer_batch_until_last_batchnorm(args_kwargs_tuple, device)
+                else:
+                    self._infer_batch(args_kwargs_tuple, device)
+
+    def _infer_batch_until_last_batchnorm(self, args_kwargs_tuple, device):
+        """
+        Runs the forward pass only until the last batch-norm layer call. The first batch is passed through the whole
+        model to find the last called batch-norm layer, since the layers executed by the model may change between
+        the runs, e.g. for the sub-networks of the BootstrapNAS super-network.
+        """
+        if self._last_bn_call is None:
+            called_bns = []
+
+            def save_called_bn(module: torch.nn.Module, *unused):
+                called_bns.append(module)
+
+            bns = []
+            self.model.apply(self._apply_to_batchnorms(bns.append))
+            handles = [bn.register_forward_hook(save_called_bn) for bn in bns]
+            try:
                 self._infer_batch(args_kwargs_tuple, device)
+            finally:
+                for handle in handles:
+                    handle.remove()
+            if called_bns:
+                last_bn = called_bns[-1]
+                self._last_bn_call = (last_bn, called_bns.count(last_bn))
+            return
+
+        last_bn, num_last_bn_calls = self._last_bn_call
+        num_calls = 0
+
+        def stop_after_last_bn_call(*unused):
+            nonlocal num_calls
+            num_calls += 1
+            if num_calls == num_last_bn_calls:
+                raise LastBatchnormReached
+
+        handle = last_bn.register_forward_hook(stop_after_last_bn_call)
+        try:
+            self._infer_batch(args_kwargs_tuple, device)
+        except LastBatchnormReached:
+            pass
+        finally:
+            handle.remove()
 
     def _prepare_initialization(self):
         pass
@@ -36,6 +36,8 @@ from nncf.common.pruning.statistics import PrunedModelStatistics
 from nncf.common.pruning.statistics import PrunedModelTheoreticalBorderline
 from nncf.common.pruning.utils import get_prunable_layers_in_out_channels
 from nncf.common.pruning.utils import get_rounded_pruned_element_number
+from nncf.common.pruning.weights_flops_calculator import IncrementalWeightsFlopsCounter
+from nncf.common.pruning.weights_flops_calculator import UniformPruningFlopsTable
 from nncf.common.pruning.weights_flops_calculator import WeightsFlopsCalculator
 from nncf.common.schedulers import StubCompressionScheduler
 from nncf.common.statistics import NNCFStatistics
@@ -163,6 +165,9 @@ class FilterPruningController(BasePruningAlgoController):
         self.current_filters_num = self.full_filters_num
         self._pruned_layers_num = len(self.pruned_module_groups_info.get_all_nodes())
         self._prunable_layers_num = len(self._model.nncf.get_graph().get_nodes_by_types(self._prunable_types))
+        self._uniform_pruning_flops_table = UniformPruningFlopsTable(
+            self._calculate_flops_and_weights_in_uniformly_pruned_model
+        )
         (
             self._min_possible_flops,
             self._min_possible_params,
@@ -338,21 +343,11 @@ class FilterPruningController(BasePruningAlgoController):
         :param target_flops_pruning_level: target proportion of flops that should be pruned in the model
         :return: uniform pruning level for all layers
         """
-        error = 0.01
         target_flops = self.full_flops * (1 - target_flops_pruning_level)
-        left, right = 0.0, 1.0
-        while abs(right - left) > error:
-            middle = (left + right) / 2
-            flops, params_num = self._calculate_flops_and_weights_in_uniformly_pruned_model(middle)
-            if flops < target_flops:
-                right = middle
-            else:
-                left = middle
-        flops, params_num = self._calculate_flops_and_weights_in_uniformly_pruned_model(right)
-        if flops <= target_flops:
-            self.current_flops = flops
-            self.current_params_num = params_num
-            return right
+        search_result = self._uniform_pruning_flops_table.find_pruning_level(target_flops)
+        if search_result is not None:
+            pruning_level, self.current_flops, self.current_params_num = search_result
+            return pruning_level
         raise RuntimeError(
             "Can't prune the model to get the required "
             "pruning level in flops = {}".format(target_flops_pruning_level)
@@ -555,19 +550,26 @@ class FilterPruningController(BasePruningAlgoController):
 
         # 3. Sort all filter groups by importances and prune the least important filters
         # until target flops pruning level is achieved
-        sorted_importances = sorted(zip(importances, cluster_indexes, filter_indexes), key=lambda x: x[0])
-        cur_num = 0
+        sorted_idxs = torch.sort(importances, stable=True).indices.cpu()
+        sorted_cluster_indexes = cluster_indexes.cpu()[sorted_idxs].int().tolist()
+        sorted_filter_indexes = filter_indexes[sorted_idxs].tolist()
         tmp_in_channels, tmp_out_channels = get_prunable_layers_in_out_channels(self._graph)
         tmp_pruning_quotas = self.pruning_quotas.copy()
+        flops_counter = IncrementalWeightsFlopsCounter(
+            self._weights_flops_calc,
+            self._graph,
+            self._output_shapes,
+            self.pruned_module_groups_info,
+            self._next_nodes,
+            tmp_in_channels,
+            tmp_out_channels,
+        )
+        pruned_filter_indexes = {cluster_idx: [] for cluster_idx in tmp_pruning_quotas}
 
-        while cur_num < len(sorted_importances):
-            cluster_idx = int(sorted_importances[cur_num][1])
-            filter_idx = int(sorted_importances[cur_num][2])
-
+        for cluster_idx, filter_idx in zip(sorted_cluster_indexes, sorted_filter_indexes):
             if tmp_pruning_quotas[cluster_idx] > 0:
                 tmp_pruning_quotas[cluster_idx] -= 1
             else:
-                cur_num += 1
                 continue
 
             cluster = self.pruned_module_groups_info.get_cluster_by_id(cluster_idx)
@@ -578,23 +580,30 @@ class FilterPruningController(BasePruningAlgoController):
                 input_channels=tmp_in_channels,
                 output_channels=tmp_out_channels,
             )
+            pruned_filter_indexes[cluster_idx].append(filter_idx)
 
-            for node in cluster.elements:
-                node.operand.binary_filter_pruning_mask[filter_idx] = 0
-
-            flops, params_num = self._weights_flops_calc.count_flops_and_weights(
-                graph=self._graph,
-                output_shapes=self._output_shapes,
-                input_channels=tmp_in_channels,
-                output_channels=tmp_out_channels,
-            )
+            flops, params_num = flops_counter.recount_group(cluster_idx)
             if flops < target_flops:
+                self._zero_filters_in_masks(pruned_filter_indexes)
                 self.current_flops = flops
                 self.current_params_num = params_num
                 return
-            cur_num += 1
+        self._zero_filters_in_masks(pruned_filter_indexes)
         raise RuntimeError("Can't prune model to asked flops pruning level")
 
+    def _zero_filters_in_masks(self, pruned_filter_indexes: Dict[int, List[int]]) -> None:
+        """
+        Zeroes the given filters in the binary filter pruning masks of the pruned modules.
+
+        :param pruned_filter_indexes: Indexes of the filters to zero for each pruning cluster id.
+        """
+        for cluster_idx, filter_idxs in pruned_filter_indexes.items():
+            if not filter_idxs:
+                continue
+            cluster = self.pruned_module_groups_info.get_cluster_by_id(cluster_idx)
+            for node in cluster.elements:
+                node.operand.binary_filter_pruning_mask[filter_idxs] = 0
+
     def _propagate_masks(self):
         nncf_logger.debug("Propagating pruning masks")
         # 1. Propagate masks for all modules
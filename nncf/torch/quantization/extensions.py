@@ -10,7 +10,10 @@
 # limitations under the License.
 
 import os.path
+import re
 import subprocess
+import sys
+from typing import List
 
 import torch
 
@@ -34,12 +37,45 @@ CPU_EXT_SRC_LIST = [
     os.path.join(NNCF_PACKAGE_ROOT_DIR, "torch/extensions/src/common/cpu/tensor_funcs.cpp"),
 ]
 
+# OpenMP is required for at::parallel_for to actually run in parallel in the CPU kernels. Floating-point
+# contraction is disabled so that the fused kernels produce the same rounding results as the ATen operations.
+CPU_EXT_EXTRA_CFLAGS = ["/O2", "/openmp"] if sys.platform == "win32" else ["-O3", "-fopenmp", "-ffp-contract=off"]
+
+CPU_CAPABILITY_CFLAGS = {
+    "AVX2": ["-mavx2", "-mfma", "-DCPU_CAPABILITY=AVX2", "-DCPU_CAPABILITY_AVX2"],
+    "AVX512": [
+        "-mavx512f",
+        "-mavx512bw",
+        "-mavx512vl",
+        "-mavx512dq",
+        "-mfma",
+        "-DCPU_CAPABILITY=AVX512",
+        "-DCPU_CAPABILITY_AVX512",
+    ],
+}
+
 CUDA_EXT_SRC_LIST = [
     os.path.join(BASE_EXT_DIR, "cuda/functions_cuda.cpp"),
     os.path.join(BASE_EXT_DIR, "cuda/functions_cuda_impl.cu"),
 ]
 
 
+def get_cpu_capability_cflags() -> List[str]:
+    """
+    Returns the compiler flags that make the at::vec-based CPU kernels use the same vector instruction set
+    (AVX2/AVX512) as the one PyTorch has selected for its own CPU kernels on the current machine.
+    The flags are a part of the extension build arguments, so a change of the capability triggers a rebuild.
+
+    :return: A list of compiler flags, empty if no specific instruction set could be selected.
+    """
+    if sys.platform == "win32":
+        return []
+    match = re.search(r"CPU capability usage: (\w+)", torch.__config__.show())
+    if match is None:
+        return []
+    return CPU_CAPABILITY_CFLAGS.get(match.group(1), [])
+
+
 @EXTENSIONS.register()
 class QuantizedFunctionsCPULoader(ExtensionLoader):
     @classmethod
@@ -56,6 +92,7 @@ class QuantizedFunctionsCPULoader(ExtensionLoader):
             retval = torch.utils.cpp_extension.load(
                 cls.name(),
                 CPU_EXT_SRC_LIST,
+                extra_cflags=CPU_EXT_EXTRA_CFLAGS + get_cpu_capability_cflags(),
                 extra_include_paths=EXT_INCLUDE_DIRS,
                 build_directory=cls.get_build_dir(),
                 verbose=False,
@@ -101,7 +138,9 @@ class QuantizedFunctionsCUDALoader(ExtensionLoader):
         return "quantized_functions_cuda"
 
 
-QuantizedFunctionsCPU = ExtensionNamespace(QuantizedFunctionsCPULoader())
+QuantizedFunctionsCPU = ExtensionNamespace(
+    QuantizedFunctionsCPULoader(), fallback_namespace=ReferenceQuantizedFunctions
+)
 
 if torch.cuda.is_available():
     QuantizedFunctionsCUDA = ExtensionNamespace(QuantizedFunctionsCUDALoader())
@@ -9,7 +9,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from functools import partial
-from typing import Any, Callable, List, Union
+from statistics import NormalDist
+from typing import Any, Callable, List, Optional, Union
 
 import torch
 from torch import Tensor
@@ -123,45 +124,99 @@ class HessianTraceEstimator:
         )
         self._diff_eps = 1e-6
 
-    def get_average_traces(self, max_iter=500, tolerance=1e-5) -> Tensor:
+    def get_average_traces(
+        self, max_iter=500, tolerance=1e-5, num_probes: int = 1, confidence_level: Optional[float] = None
+    ) -> Tensor:
         """
         Estimates average hessian trace for each parameter
         :param max_iter: maximum number of iterations for Hutchinson algorithm
         :param tolerance: - minimum relative tolerance for stopping the algorithm.
         It's calculated  between mean average trace from previous iteration and current one.
+        :param num_probes: number of random vectors evaluated on each iteration. The gradients are computed
+        once per data batch for all of them.
+        :param confidence_level: if specified, the algorithm is stopped once the half-width of the confidence interval
+        of the mean average total trace at this level is less than `tolerance` relative to the mean, instead of
+        comparing the mean average traces of the consecutive iterations.
         :return: Tensor with average hessian trace per parameter
         """
         avg_total_trace = 0.0
-        avg_traces_per_iter = []  # type: List[Tensor]
-        mean_avg_traces_per_param = None
+        traces_stat = RunningMeanVariance()
+        total_trace_stat = RunningMeanVariance()
+        z_score = None if confidence_level is None else NormalDist().inv_cdf((1 + confidence_level) / 2)
 
         for i in range(max_iter):
-            avg_traces_per_iter.append(self._calc_avg_traces_per_param())
-
-            mean_avg_traces_per_param = self._get_mean(avg_traces_per_iter)
-            mean_avg_total_trace = torch.sum(mean_avg_traces_per_param)
-
-            diff_avg = abs(mean_avg_total_trace - avg_total_trace) / (avg_total_trace + self._diff_eps)
-            if diff_avg < tolerance:
-                return mean_avg_traces_per_param
+            for avg_traces_per_param in self._calc_avg_traces_per_param(num_probes):
+                traces_stat.update(avg_traces_per_param)
+                total_trace_stat.update(torch.sum(avg_traces_per_param))
+
+            mean_avg_total_trace = total_trace_stat.mean
+            if z_score is not None:
+                diff_avg = float("inf")
+                if total_trace_stat.count > 1:
+                    half_width = z_score * torch.sqrt(total_trace_stat.variance / total_trace_stat.count)
+                    diff_avg = half_width / (abs(mean_avg_total_trace) + self._diff_eps)
+                if diff_avg < tolerance:
+                    return traces_stat.mean
+            else:
+                diff_avg = abs(mean_avg_total_trace - avg_total_trace) / (avg_total_trace + self._diff_eps)
+                if diff_avg < tolerance:
+                    return traces_stat.mean
             avg_total_trace = mean_avg_total_trace
             nncf_logger.debug(f"{i}# difference_avg={diff_avg} avg_trace={avg_total_trace}")
 
-        return mean_avg_traces_per_param
+        return traces_stat.mean
 
-    def _calc_avg_traces_per_param(self) -> Tensor:
-        v = self._parameter_handler.sample_rademacher_like_params()
-        vhp = self._parameter_handler.sample_normal_like_params()
+    def _calc_avg_traces_per_param(self, num_probes: int = 1) -> List[Tensor]:
+        probes = []
+        for _ in range(num_probes):
+            v = self._parameter_handler.sample_rademacher_like_params()
+            vhp = self._parameter_handler.sample_normal_like_params()
+            probes.append((v, vhp))
         num_all_data = self._num_data_iter * self._batch_size
         for gradients in self._gradients_calculator:
-            vhp_curr = torch.autograd.grad(
-                gradients, self._parameter_handler.parameters, grad_outputs=v, only_inputs=True, retain_graph=False
-            )
-            vhp = [a + b * float(self._batch_size) + 0.0 for a, b in zip(vhp, vhp_curr)]
-        vhp = [a / float(num_all_data) for a in vhp]
-        avg_traces_per_param = torch.stack([torch.sum(a * b) / a.size().numel() for (a, b) in zip(vhp, v)])
-        return avg_traces_per_param
-
-    @staticmethod
-    def _get_mean(data: List[Tensor]) -> Tensor:
-        return torch.mean(torch.stack(data), dim=0)
+            for probe_idx, (v, vhp) in enumerate(probes):
+                vhp_curr = torch.autograd.grad(
+                    gradients,
+                    self._parameter_handler.parameters,
+                    grad_outputs=v,
+                    only_inputs=True,
+                    retain_graph=probe_idx < num_probes - 1,
+                )
+                vhp = [a + b * float(self._batch_size) + 0.0 for a, b in zip(vhp, vhp_curr)]
+                probes[probe_idx] = (v, vhp)
+        avg_traces_per_probe = []
+        for v, vhp in probes:
+            vhp = [a / float(num_all_data) for a in vhp]
+            avg_traces_per_probe.append(torch.stack([torch.sum(a * b) / a.size().numel() for (a, b) in zip(vhp, v)]))
+        return avg_traces_per_probe
+
+
+class RunningMeanVariance:
+    """
+    Accumulates the mean and the variance of the tensors of the same shape with Welford's algorithm,
+    without keeping the tensors themselves.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = None  # type: Optional[Tensor]
+        self._sum_of_squared_diffs = None  # type: Optional[Tensor]
+
+    def update(self, value: Tensor) -> None:
+        self.count += 1
+        if self.mean is None:
+            self.mean = value.clone()
+            self._sum_of_squared_diffs = torch.zeros_like(value)
+            return
+        delta = value - self.mean
+        self.mean = self.mean + delta / self.count
+        self._sum_of_squared_diffs = self._sum_of_squared_diffs + delta * (value - self.mean)
+
+    @property
+    def variance(self) -> Optional[Tensor]:
+        """
+        :return: Unbiased estimate of the variance, or None if less than 2 values were accumulated.
+        """
+        if self.count < 2:
+            return None
+        return self._sum_of_squared_diffs / (self.count - 1)
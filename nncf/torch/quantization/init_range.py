@@ -11,7 +11,8 @@
 
 from collections import OrderedDict
 from copy import deepcopy
-from typing import Callable, Dict, List, Tuple
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -30,6 +31,10 @@ from nncf.common.scopes import should_consider_scope
 from nncf.common.tensor_statistics.collectors import ReductionShape
 from nncf.common.tensor_statistics.collectors import TensorStatisticCollectorBase
 from nncf.config.schemata.algo.quantization import RANGE_INIT_TYPES_VS_DESCRIPTIONS
+from nncf.experimental.common.tensor_statistics.collectors import MaxAggregator
+from nncf.experimental.common.tensor_statistics.collectors import MeanAggregator
+from nncf.experimental.common.tensor_statistics.collectors import MinAggregator
+from nncf.experimental.common.tensor_statistics.collectors import TensorCollector
 from nncf.torch.graph.graph import PTNNCFGraph
 from nncf.torch.initialization import DataLoaderBaseRunner
 from nncf.torch.nncf_network import NNCFNetwork
@@ -37,16 +42,30 @@ from nncf.torch.quantization.layers import BaseQuantizer
 from nncf.torch.quantization.layers import SymmetricQuantizer
 from nncf.torch.quantization.layers import get_scale_shape
 from nncf.torch.quantization.translator import PTTargetPointTranslator
+from nncf.torch.tensor_statistics.algo import StatisticCollector
 from nncf.torch.tensor_statistics.algo import TensorStatisticObservationPoint
+from nncf.torch.tensor_statistics.collectors import PTAbsMaxReducer
+from nncf.torch.tensor_statistics.collectors import PTHistogramMedianMADStatisticCollector
+from nncf.torch.tensor_statistics.collectors import PTHistogramPercentileStatisticCollector
+from nncf.torch.tensor_statistics.collectors import PTMaxReducer
 from nncf.torch.tensor_statistics.collectors import PTMeanMinMaxStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMeanPercentileStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMedianMADStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMinMaxStatisticCollector
+from nncf.torch.tensor_statistics.collectors import PTMinReducer
 from nncf.torch.tensor_statistics.collectors import PTMixedMinMaxStatisticCollector
+from nncf.torch.tensor_statistics.collectors import PTNNCFCollectorTensorProcessor
 from nncf.torch.tensor_statistics.collectors import PTPercentileStatisticCollector
+from nncf.torch.tensor_statistics.collectors import PTQuantileReducer
+from nncf.torch.tensor_statistics.collectors import get_tensor_collector_hook
+from nncf.torch.tensor_statistics.statistics import PTMinMaxTensorStatistic
 from nncf.torch.tensor_statistics.statistics import pt_convert_stat_to_min_max_tensor_stat
 
 
+def _create_min_max_statistic(min_values, max_values, statistic_shape: ReductionShape) -> PTMinMaxTensorStatistic:
+    return PTMinMaxTensorStatistic(min_values.reshape(statistic_shape), max_values.reshape(statistic_shape))
+
+
 class PTRangeInitParams(RangeInitParams):
     def get_max_num_init_steps(self) -> int:
         steps = []
@@ -124,8 +143,8 @@ class StatCollectorGenerator:
     @staticmethod
     def generate_collectors_for_range_init_statistics_collection(
         target_model_graph: PTNNCFGraph, quantizer_setup: QuantizerSetupBase, range_init_params: PTRangeInitParams
-    ) -> Dict[TensorStatisticObservationPoint, Dict[ReductionShape, TensorStatisticCollectorBase]]:
-        retval = {}
+    ) -> Dict[TensorStatisticObservationPoint, Dict[ReductionShape, StatisticCollector]]:
+        retval = {}  # type: Dict[TensorStatisticObservationPoint, Dict[ReductionShape, StatisticCollector]]
         for qp in quantizer_setup.quantization_points.values():
             init_config = range_init_params.get_init_config_for_quantization_point(qp)
             is_weights = qp.is_weight_quantization_point()
@@ -144,7 +163,7 @@ class StatCollectorGenerator:
             retval[obs_p] = {}
             for scale_shape in obs_p.reduction_shapes:
                 collector_params = scale_shapes_vs_params[scale_shape]
-                collector = StatCollectorGenerator.generate_stat_collector_for_range_init_config(
+                collector = StatCollectorGenerator.generate_range_init_collector(
                     init_config, scale_shape, collector_params, num_samples_to_collect_override=num_batches
                 )
                 retval[obs_p][scale_shape] = collector
@@ -188,11 +207,18 @@ class StatCollectorGenerator:
                 reduction_shape,
                 num_samples,
             )
+        num_histogram_bins = init_config.init_type_specific_params.get("num_histogram_bins")
         if init_config.init_type == "threesigma":
+            if num_histogram_bins is not None:
+                return PTHistogramMedianMADStatisticCollector(reduction_shape, num_samples, num_histogram_bins)
             return PTMedianMADStatisticCollector(reduction_shape, num_samples)
         if init_config.init_type == "percentile":
             min_percentile = init_config.init_type_specific_params.get("min_percentile", 0.1)
             max_percentile = init_config.init_type_specific_params.get("max_percentile", 99.9)
+            if num_histogram_bins is not None:
+                return PTHistogramPercentileStatisticCollector(
+                    [min_percentile, max_percentile], reduction_shape, num_samples, num_histogram_bins
+                )
             return PTPercentileStatisticCollector([min_percentile, max_percentile], reduction_shape, num_samples)
         if init_config.init_type == "mean_percentile":
             min_percentile = init_config.init_type_specific_params.get("min_percentile", 0.1)
@@ -200,6 +226,107 @@ class StatCollectorGenerator:
             return PTMeanPercentileStatisticCollector([min_percentile, max_percentile], reduction_shape, num_samples)
         raise ValueError("Range init type not handled!")
 
+    @staticmethod
+    def generate_tensor_collector_for_range_init_config(
+        init_config: RangeInitConfig,
+        reduction_shape: ReductionShape,
+        collector_params: PTRangeInitCollectorParams,
+        num_samples_to_collect_override: int = None,
+    ) -> Optional[TensorCollector]:
+        """
+        Generates the tensor collector of the experimental statistics collection framework for the range init config.
+        The statistics of such collector are reduced and aggregated on the device of the collected tensors,
+        and the identical reducers of the collectors of the same tensor are applied only once
+        when the collectors are merged.
+
+        :param init_config: Range init config.
+        :param reduction_shape: Shape of the collected statistics, i.e. the scale shape of the quantizer.
+        :param collector_params: Parameters of the range init statistics collection.
+        :param num_samples_to_collect_override: Number of samples to collect instead of the one from the init config.
+        :return: TensorCollector instance collecting PTMinMaxTensorStatistic or None if the init type
+            is supported by the legacy collectors only: the ones that require the whole history of the collected
+            tensors and per-channel mean_percentile, whose legacy collector reduces the percentiles
+            dimension by dimension.
+        """
+        num_samples = init_config.num_init_samples
+        if num_samples_to_collect_override is not None:
+            num_samples = num_samples_to_collect_override
+        if init_config.init_type not in RANGE_INIT_TYPES_VS_DESCRIPTIONS:
+            raise RuntimeError("Unknown range init type: {}".format(init_config.init_type))
+        if init_config.init_type in ["threesigma", "percentile"]:
+            return None
+        if init_config.init_type == "mean_percentile" and collector_params.is_per_channel:
+            return None
+
+        tensor_processor = PTNNCFCollectorTensorProcessor()
+        if init_config.init_type == "mean_percentile":
+            min_percentile = init_config.init_type_specific_params.get("min_percentile", 0.1)
+            max_percentile = init_config.init_type_specific_params.get("max_percentile", 99.9)
+            reduction_axes = collector_params.convert_reduction_shape(per_sample_stats=False)
+            quantile_reducer = PTQuantileReducer(reduction_axes, [min_percentile / 100, max_percentile / 100])
+            branches = [
+                (quantile_reducer, 0, MeanAggregator(tensor_processor, num_samples=num_samples)),
+                (quantile_reducer, 1, MeanAggregator(tensor_processor, num_samples=num_samples)),
+            ]
+        else:
+            # Minimum and maximum of the per-sample statistics are equal to the ones of the per-batch statistics,
+            # so the per-sample reduction is used only for the averaged statistics
+            use_means_of_mins = init_config.init_type == "mean_min_max"
+            use_means_of_maxs = init_config.init_type == "mean_min_max"
+            per_sample_stats = False
+            if init_config.init_type == "mixed_min_max":
+                use_means_of_mins = collector_params.use_means_of_mins
+                use_means_of_maxs = collector_params.use_means_of_maxs
+                per_sample_stats = True
+            max_reducer_cls = PTAbsMaxReducer if collector_params.use_abs_max else PTMaxReducer
+
+            branches = []
+            for reducer_cls, use_means, aggregator_cls in [
+                (PTMinReducer, use_means_of_mins, MinAggregator),
+                (max_reducer_cls, use_means_of_maxs, MaxAggregator),
+            ]:
+                use_per_sample_stats = use_means and collector_params.use_per_sample_stats(per_sample_stats)
+                reducer = reducer_cls(collector_params.convert_reduction_shape(use_per_sample_stats))
+                if use_means:
+                    aggregator = MeanAggregator(tensor_processor, use_per_sample_stats, num_samples=num_samples)
+                else:
+                    aggregator = aggregator_cls(tensor_processor, num_samples=num_samples)
+                branches.append((reducer, 0, aggregator))
+
+        statistic_container = partial(_create_min_max_statistic, statistic_shape=reduction_shape)
+        collector = TensorCollector(statistic_container)
+        for container_key, (reducer, reducer_output_port_id, aggregator) in zip(
+            [PTMinMaxTensorStatistic.MIN_STAT, PTMinMaxTensorStatistic.MAX_STAT], branches
+        ):
+            collector.register_statistic_branch(container_key, reducer, aggregator, reducer_output_port_id)
+        return collector
+
+    @staticmethod
+    def generate_range_init_collector(
+        init_config: RangeInitConfig,
+        reduction_shape: ReductionShape,
+        collector_params: PTRangeInitCollectorParams,
+        num_samples_to_collect_override: int = None,
+    ) -> StatisticCollector:
+        """
+        Generates the tensor collector of the experimental statistics collection framework for the range init config
+        if the init type is supported by it and the legacy statistic collector otherwise.
+
+        :param init_config: Range init config.
+        :param reduction_shape: Shape of the collected statistics, i.e. the scale shape of the quantizer.
+        :param collector_params: Parameters of the range init statistics collection.
+        :param num_samples_to_collect_override: Number of samples to collect instead of the one from the init config.
+        :return: Collector of the statistics for the range initialization.
+        """
+        collector = StatCollectorGenerator.generate_tensor_collector_for_range_init_config(
+            init_config, reduction_shape, collector_params, num_samples_to_collect_override
+        )
+        if collector is None:
+            collector = StatCollectorGenerator.generate_stat_collector_for_range_init_config(
+                init_config, reduction_shape, collector_params, num_samples_to_collect_override
+            )
+        return collector
+
     @classmethod
     def get_all_scale_shapes_with_params(
         cls, qp: QuantizationPointBase, target_nncf_graph: PTNNCFGraph
@@ -245,13 +372,18 @@ class DataLoaderRangeInitializeRunner(DataLoaderBaseRunner):
 
         self.collectors_and_modules_to_init = (
             OrderedDict()
-        )  # type: Dict[str, Tuple[TensorStatisticCollectorBase, BaseQuantizer]]
+        )  # type: Dict[str, Tuple[StatisticCollector, BaseQuantizer]]
         self.hook_handles = []
         self.batch_size = batch_size
 
-    def _get_fwd_hook(self, collector: TensorStatisticCollectorBase) -> Callable:
+    def _get_fwd_hook(self, collector: StatisticCollector) -> Callable:
+        if isinstance(collector, TensorCollector):
+            register_input = get_tensor_collector_hook(collector)
+        else:
+            register_input = collector.register_input
+
         def fwd_hook(module, input_, output):
-            collector.register_input(input_[0])
+            register_input(input_[0])
 
         return fwd_hook
 
@@ -283,7 +415,7 @@ class DataLoaderRangeInitializeRunner(DataLoaderBaseRunner):
                 is_weights, mode, quantizer_module.per_channel, input_shape, channel_idx
             )
 
-            collector = StatCollectorGenerator.generate_stat_collector_for_range_init_config(
+            collector = StatCollectorGenerator.generate_range_init_collector(
                 init_config, tuple(quantizer_module.scale_shape), collector_params, num_samples_override
             )
 
@@ -50,9 +50,27 @@ class CompressionRatioCalculator:
         bits_complexity = 0
         for w_qp_id, w_qp in weight_qps:
             wq_num_bits = w_qp.qconfig.num_bits
-            a_qp_id = self._weight_qp_id_per_activation_qp_id[w_qp_id]
+            a_qp_id = self.get_activation_qp_id(w_qp_id)
             a_qp = quantization_points[a_qp_id]
             aq_num_bits = a_qp.qconfig.num_bits
-            num_bits = max(wq_num_bits, aq_num_bits)
-            bits_complexity += num_bits * self._flops_per_weight_qp_id[w_qp_id]
+            bits_complexity += self.get_bits_complexity(w_qp_id, wq_num_bits, aq_num_bits)
         return self.maximum_bits_complexity / bits_complexity
+
+    def get_activation_qp_id(self, weight_qp_id: QuantizationPointId) -> QuantizationPointId:
+        """
+        :param weight_qp_id: ID of the weight quantization point.
+        :return: ID of the activation quantization point for the input of the layer with the given weight quantization
+            point.
+        """
+        return self._weight_qp_id_per_activation_qp_id[weight_qp_id]
+
+    def get_bits_complexity(self, weight_qp_id: QuantizationPointId, wq_num_bits: int, aq_num_bits: int) -> float:
+        """
+        Calculates bit complexity of a single quantized layer.
+
+        :param weight_qp_id: ID of the weight quantization point of the layer.
+        :param wq_num_bits: Number of bits for the weight quantization of the layer.
+        :param aq_num_bits: Number of bits for the quantization of the layer input.
+        :return: bit complexity of the layer
+        """
+        return max(wq_num_bits, aq_num_bits) * self._flops_per_weight_qp_id[weight_qp_id]
@@ -16,8 +16,9 @@ from copy import deepcopy
 from enum import Enum
 from operator import itemgetter
 from pathlib import Path
-from typing import Any, Callable, Dict, List, NamedTuple, Set, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
+import networkx as nx
 import torch
 from torch import Tensor
 from torch import nn
@@ -36,6 +37,7 @@ from nncf.config.schemata.defaults import HAWQ_COMPRESSION_RATIO
 from nncf.config.schemata.defaults import HAWQ_DUMP_INIT_PRECISION_DATA
 from nncf.config.schemata.defaults import HAWQ_ITER_NUMBER
 from nncf.config.schemata.defaults import HAWQ_NUM_DATA_POINTS
+from nncf.config.schemata.defaults import HAWQ_NUM_PROBES
 from nncf.config.schemata.defaults import HAWQ_TOLERANCE
 from nncf.config.schemata.defaults import PRECISION_INIT_BITWIDTHS
 from nncf.torch.quantization.hessian_trace import HessianTraceEstimator
@@ -46,6 +48,8 @@ from nncf.torch.quantization.precision_init.base_init import BasePrecisionInitia
 from nncf.torch.quantization.precision_init.base_init import BasePrecisionInitParams
 from nncf.torch.quantization.precision_init.compression_ratio import CompressionRatioCalculator
 from nncf.torch.quantization.precision_init.hawq_debug import HAWQDebugger
+from nncf.torch.quantization.precision_init.knapsack import KnapsackOption
+from nncf.torch.quantization.precision_init.knapsack import solve_multiple_choice_knapsack
 from nncf.torch.quantization.precision_init.perturbations import PerturbationObserver
 from nncf.torch.quantization.precision_init.perturbations import Perturbations
 from nncf.torch.quantization.precision_init.traces_order import TracesOrder
@@ -60,6 +64,11 @@ class BitwidthAssignmentMode(Enum):
     LIBERAL = "liberal"
 
 
+class BitwidthSearchAlgorithm(Enum):
+    EXHAUSTIVE = "exhaustive"
+    DYNAMIC_PROGRAMMING = "dynamic_programming"
+
+
 class HAWQPrecisionInitParams(BasePrecisionInitParams):
     def __init__(
         self,
@@ -70,9 +79,12 @@ class HAWQPrecisionInitParams(BasePrecisionInitParams):
         num_data_points: int = None,
         iter_number: int = None,
         tolerance: float = None,
+        num_probes: int = None,
+        confidence_level: float = None,
         compression_ratio: float = None,
         dump_hawq_data: bool = None,
         bitwidth_assignment_mode: BitwidthAssignmentMode = None,
+        search_algorithm: BitwidthSearchAlgorithm = None,
     ):
         super().__init__(user_init_args)
         self.bitwidths = bitwidths
@@ -81,9 +93,12 @@ class HAWQPrecisionInitParams(BasePrecisionInitParams):
         self.num_data_points = num_data_points
         self.iter_number = iter_number
         self.tolerance = tolerance
+        self.num_probes = num_probes
+        self.confidence_level = confidence_level
         self.compression_ratio = compression_ratio
         self.dump_hawq_data = dump_hawq_data
         self.bitwidth_assignment_mode = bitwidth_assignment_mode
+        self.search_algorithm = search_algorithm
 
     @classmethod
     def from_config(
@@ -96,11 +111,16 @@ class HAWQPrecisionInitParams(BasePrecisionInitParams):
             num_data_points=hawq_init_config_dict.get("num_data_points", HAWQ_NUM_DATA_POINTS),
             iter_number=hawq_init_config_dict.get("iter_number", HAWQ_ITER_NUMBER),
             tolerance=hawq_init_config_dict.get("tolerance", HAWQ_TOLERANCE),
+            num_probes=hawq_init_config_dict.get("num_probes", HAWQ_NUM_PROBES),
+            confidence_level=hawq_init_config_dict.get("confidence_level", None),
             compression_ratio=hawq_init_config_dict.get("compression_ratio", HAWQ_COMPRESSION_RATIO),
             dump_hawq_data=hawq_init_config_dict.get("dump_init_precision_data", HAWQ_DUMP_INIT_PRECISION_DATA),
             bitwidth_assignment_mode=BitwidthAssignmentMode(
                 hawq_init_config_dict.get("bitwidth_assignment_mode", BitwidthAssignmentMode.LIBERAL.value)
             ),
+            search_algorithm=BitwidthSearchAlgorithm(
+                hawq_init_config_dict.get("search_algorithm", BitwidthSearchAlgorithm.EXHAUSTIVE.value)
+            ),
         )
 
 
@@ -151,7 +171,7 @@ class TraceOrderBitwidthMatcher:
         return [list(tup) for tup in deduped_tupled_sequence]
 
     @staticmethod
-    def _generate_covering_qconfig_sequences(observed_qconfs: List[Dict[QuantizerConfig, QuantizerConfig]]):
+    def generate_covering_qconfig_sequences(observed_qconfs: List[Dict[QuantizerConfig, QuantizerConfig]]):
         covering_qconfig_sequences = []  # type: List[CoveringQConfigSequenceForQuantNoiseCalculation]
         # For each index, put the largest qconf subset that only varies in bitwidth on top
         # so that the associated covering configurations would not require model regeneration
@@ -193,28 +213,42 @@ class TraceOrderBitwidthMatcher:
         for bitwidth_sequence in self._bitwidth_sequences:
             current_qconfig_sequence_in_trace_order = []  # type: QConfigSequenceForHAWQToEvaluate
             for trace_idx, bitwidth in enumerate(bitwidth_sequence):
-                if trace_idx in indices_for_bitwidth_adjustment_only:
-                    bitwidth_adjusted_default_qconfig = deepcopy(
-                        possible_qconfigs_sequence_in_trace_order[trace_idx][0]
-                    )
-                    bitwidth_adjusted_default_qconfig.num_bits = bitwidth
-                    qconfig = bitwidth_adjusted_default_qconfig
-                else:
-                    # TODO: do a selection based on strategy ("exhaustive" = add all available configurations,
-                    # "preset" = do a selection based on a certain preset, "first" = select first match (as below),
-                    # "custom" = use a custom selection function to be passed as arg to the HAWQ initializer
-                    # OR: do non-bitwidth disambiguation higher up the stack, make sure that the qconfig
-                    # space at this spot only has 1 qconfig option for each bitwidth.
-                    possible_qconfigs_for_current_trace_idx = possible_qconfigs_sequence_in_trace_order[trace_idx]
-                    first_closest_qconfig = self._select_first_closest_bitwidth_qconfig(
-                        possible_qconfigs_for_current_trace_idx, bitwidth
-                    )
-                    qconfig = deepcopy(first_closest_qconfig)
-
+                qconfig = self.get_qconfig_for_bitwidth(
+                    possible_qconfigs_sequence_in_trace_order[trace_idx],
+                    bitwidth,
+                    trace_idx in indices_for_bitwidth_adjustment_only,
+                )
                 current_qconfig_sequence_in_trace_order.append(qconfig)
                 observed_qconfs_in_retval[trace_idx][qconfig] = qconfig
             retval.append(current_qconfig_sequence_in_trace_order)
-        return self._deduplicate(retval), self._generate_covering_qconfig_sequences(observed_qconfs_in_retval)
+        return self._deduplicate(retval), self.generate_covering_qconfig_sequences(observed_qconfs_in_retval)
+
+    @staticmethod
+    def get_qconfig_for_bitwidth(
+        possible_qconfigs: List[QuantizerConfig], bitwidth: int, is_bitwidth_adjustment_only: bool
+    ) -> QuantizerConfig:
+        """
+        Selects the quantizer configuration for a weight quantizer given the target bitwidth.
+
+        :param possible_qconfigs: The quantizer configurations allowed for the weight quantizer.
+        :param bitwidth: The target bitwidth.
+        :param is_bitwidth_adjustment_only: Whether the bitwidth of the first allowed configuration should be set to
+            the target one instead of selecting the allowed configuration with the closest bitwidth.
+        :return: The selected quantizer configuration.
+        """
+        if is_bitwidth_adjustment_only:
+            bitwidth_adjusted_default_qconfig = deepcopy(possible_qconfigs[0])
+            bitwidth_adjusted_default_qconfig.num_bits = bitwidth
+            return bitwidth_adjusted_default_qconfig
+        # TODO: do a selection based on strategy ("exhaustive" = add all available configurations,
+        # "preset" = do a selection based on a certain preset, "first" = select first match (as below),
+        # "custom" = use a custom selection function to be passed as arg to the HAWQ initializer
+        # OR: do non-bitwidth disambiguation higher up the stack, make sure that the qconfig
+        # space at this spot only has 1 qconfig option for each bitwidth.
+        first_closest_qconfig = TraceOrderBitwidthMatcher._select_first_closest_bitwidth_qconfig(
+            possible_qconfigs, bitwidth
+        )
+        return deepcopy(first_closest_qconfig)
 
 
 class HAWQPrecisionInitializer(BasePrecisionInitializer):
@@ -239,7 +273,10 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
         self._num_data_points = params.num_data_points
         self._iter_number = params.iter_number
         self._tolerance = params.tolerance
+        self._num_probes = params.num_probes
+        self._confidence_level = params.confidence_level
         self._compression_ratio = params.compression_ratio
+        self._search_algorithm = params.search_algorithm
         self._bitwidths = (
             self._hw_precision_constraints.get_all_unique_bitwidths()
             if self._hw_precision_constraints
@@ -270,56 +307,71 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
             raise RuntimeError("Failed to calculate hessian traces!")
 
         traces_order = traces_per_layer.traces_order
-        (
-            weight_qconfig_sequences_in_trace_order,
-            covering_qconfig_sequences,
-        ) = self.get_qconfig_sequences_constrained_by_traces_order(traces_order)
-
-        weight_quantizer_ids_in_execution_order = list(self._weight_quantizations_by_execution_order.keys())
+        if self._search_algorithm == BitwidthSearchAlgorithm.DYNAMIC_PROGRAMMING:
+            search_result = self.search_qconfig_sequence_by_dynamic_programming(traces_per_layer)
+            if search_result is None:
+                return self._algo.get_quantizer_setup_for_current_state()
+            chosen_qconfig_sequence_in_traces_order, perturbations, weight_observers = search_result
+            weight_qconfig_sequences_in_trace_order = [chosen_qconfig_sequence_in_traces_order]
+            compression_ratio_per_qconfig = self.get_compression_ratio_per_qconfig_sequence(
+                weight_qconfig_sequences_in_trace_order, traces_order
+            )
+            metric_per_qconfig_sequence = self.calc_hawq_metric_per_qconfig_sequence(
+                weight_qconfig_sequences_in_trace_order, perturbations, traces_per_layer, self._init_device
+            )
+            qconfig_sequence_index = 0
+        else:
+            (
+                weight_qconfig_sequences_in_trace_order,
+                covering_qconfig_sequences,
+            ) = self.get_qconfig_sequences_constrained_by_traces_order(traces_order)
 
-        if not weight_qconfig_sequences_in_trace_order:
-            nncf_logger.error("All bitwidths configurations are incompatible with HW Config!")
-            return None
+            weight_quantizer_ids_in_execution_order = list(self._weight_quantizations_by_execution_order.keys())
 
-        weight_qconfig_sequences_in_trace_order = self._filter_qconfig_sequences_by_excessive_bitwidth(
-            weight_qconfig_sequences_in_trace_order
-        )
+            if not weight_qconfig_sequences_in_trace_order:
+                nncf_logger.error("All bitwidths configurations are incompatible with HW Config!")
+                return None
 
-        if self._bitwidth_assignment_mode == BitwidthAssignmentMode.STRICT:
-            weight_qconfig_sequences_in_trace_order = self._filter_qconfig_sequences_by_grouped_weight_quantizers(
-                weight_qconfig_sequences_in_trace_order,
-                weight_quantizer_ids_in_execution_order,
-                self._groups_of_adjacent_quantizers,
-                traces_order,
-            )
-        if not weight_qconfig_sequences_in_trace_order:
-            nncf_logger.error(
-                "No bitwidths configurations are left after removing inconsistent groups of "
-                "weight quantizers with adjacent activation quantizers!"
+            weight_qconfig_sequences_in_trace_order = self._filter_qconfig_sequences_by_excessive_bitwidth(
+                weight_qconfig_sequences_in_trace_order
             )
-            return self._algo.get_quantizer_setup_for_current_state()
 
-        compression_ratio_per_qconfig = self.get_compression_ratio_per_qconfig_sequence(
-            weight_qconfig_sequences_in_trace_order, traces_order
-        )
-        min_ratio = min(compression_ratio_per_qconfig)
-        max_ratio = max(compression_ratio_per_qconfig)
-        if not min_ratio <= self._compression_ratio <= max_ratio:
-            raise AttributeError(
-                "Invalid compression ratio={}. Should be within range [{:.3f}, {:.3f}]".format(
-                    self._compression_ratio, min_ratio, max_ratio
+            if self._bitwidth_assignment_mode == BitwidthAssignmentMode.STRICT:
+                weight_qconfig_sequences_in_trace_order = self._filter_qconfig_sequences_by_grouped_weight_quantizers(
+                    weight_qconfig_sequences_in_trace_order,
+                    weight_quantizer_ids_in_execution_order,
+                    self._groups_of_adjacent_quantizers,
+                    traces_order,
+                )
+            if not weight_qconfig_sequences_in_trace_order:
+                nncf_logger.error(
+                    "No bitwidths configurations are left after removing inconsistent groups of "
+                    "weight quantizers with adjacent activation quantizers!"
                 )
+                return self._algo.get_quantizer_setup_for_current_state()
+
+            compression_ratio_per_qconfig = self.get_compression_ratio_per_qconfig_sequence(
+                weight_qconfig_sequences_in_trace_order, traces_order
             )
+            min_ratio = min(compression_ratio_per_qconfig)
+            max_ratio = max(compression_ratio_per_qconfig)
+            if not min_ratio <= self._compression_ratio <= max_ratio:
+                raise AttributeError(
+                    "Invalid compression ratio={}. Should be within range [{:.3f}, {:.3f}]".format(
+                        self._compression_ratio, min_ratio, max_ratio
+                    )
+                )
 
-        perturbations, weight_observers = self.calc_quantization_noise(covering_qconfig_sequences, traces_order)
+            perturbations, weight_observers = self.calc_quantization_noise(covering_qconfig_sequences, traces_order)
 
-        metric_per_qconfig_sequence = self.calc_hawq_metric_per_qconfig_sequence(
-            weight_qconfig_sequences_in_trace_order, perturbations, traces_per_layer, self._init_device
-        )
+            metric_per_qconfig_sequence = self.calc_hawq_metric_per_qconfig_sequence(
+                weight_qconfig_sequences_in_trace_order, perturbations, traces_per_layer, self._init_device
+            )
+
+            qconfig_sequence_index = self.choose_qconfig_sequence(
+                metric_per_qconfig_sequence, compression_ratio_per_qconfig, self._compression_ratio
+            )
 
-        qconfig_sequence_index = self.choose_qconfig_sequence(
-            metric_per_qconfig_sequence, compression_ratio_per_qconfig, self._compression_ratio
-        )
         chosen_qconfig_sequence_in_traces_order = weight_qconfig_sequences_in_trace_order[qconfig_sequence_index]
         chosen_qconfig_sequence_in_execution_order = traces_order.get_execution_order_configs(
             chosen_qconfig_sequence_in_traces_order
@@ -406,6 +458,209 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
             compression_ratio_per_qconfig.append(compression_ratio)
         return compression_ratio_per_qconfig
 
+    def search_qconfig_sequence_by_dynamic_programming(
+        self, traces_per_layer: TracesPerLayer
+    ) -> Optional[Tuple[QConfigSequenceForHAWQToEvaluate, Perturbations, List[List[PerturbationObserver]]]]:
+        """
+        Searches for the weight qconfig sequence with the minimal HAWQ metric among the ones that satisfy the target
+        compression ratio. Both the HAWQ metric and the bit complexity of the model are sums over the weightable
+        layers, so the search is solved as a multiple-choice knapsack problem: the cost of a bitwidth for a layer is
+        the average Hessian trace of the layer multiplied by the quantization noise, and the weight is the bit
+        complexity of the layer. The layers with weight quantizers that share the input activation quantizer are
+        considered together, since the bitwidth of the activation quantizer depends on all of them. Unlike the
+        exhaustive search, all the sequences are considered, not only the ones with bitwidths that do not decrease
+        with the average Hessian traces. The time of the search is proportional to the number of the layers multiplied
+        by the number of the kept Pareto-optimal partial solutions, which is bounded by the number of distinct bit
+        complexities only, so it may still grow exponentially in the worst case. The layers considered together
+        contribute all combinations of their options.
+
+        :param traces_per_layer: Average Hessian traces of the weightable layers.
+        :return: The chosen weight qconfig sequence in the traces order, the quantization noise for all considered
+            qconfigs and the perturbation observers used to calculate it, or None if the weight quantizers that should
+            have the same bitwidth have no common one.
+        """
+        traces_order = traces_per_layer.traces_order
+        (
+            possible_qconfigs_sequence_in_trace_order,
+            indices_for_bitwidth_adjustment_only,
+        ) = self._get_possible_qconfigs_sequence_in_trace_order(traces_order)
+
+        # Each group of layers that should have the same bitwidth is assigned one of its qconfig options
+        groups_of_trace_indices = self._get_groups_of_trace_indices_with_same_bitwidth(traces_order)
+        qconfig_options_per_group = []  # type: List[List[List[QuantizerConfig]]]
+        observed_qconfs = [OrderedDict() for _ in range(len(traces_order))]
+        for trace_indices in groups_of_trace_indices:
+            qconfig_options = []
+            for bitwidth in sorted(self._bitwidths):
+                qconfig_option = [
+                    TraceOrderBitwidthMatcher.get_qconfig_for_bitwidth(
+                        possible_qconfigs_sequence_in_trace_order[trace_idx],
+                        bitwidth,
+                        trace_idx in indices_for_bitwidth_adjustment_only,
+                    )
+                    for trace_idx in trace_indices
+                ]
+                if len({qconfig.num_bits for qconfig in qconfig_option}) > 1 or qconfig_option in qconfig_options:
+                    continue
+                qconfig_options.append(qconfig_option)
+                for trace_idx, qconfig in zip(trace_indices, qconfig_option):
+                    observed_qconfs[trace_idx][qconfig] = qconfig
+            if not qconfig_options:
+                nncf_logger.error(
+                    "No bitwidths configurations are left after removing inconsistent groups of "
+                    "weight quantizers with adjacent activation quantizers!"
+                )
+                return None
+            qconfig_options_per_group.append(qconfig_options)
+
+        covering_qconfig_sequences = TraceOrderBitwidthMatcher.generate_covering_qconfig_sequences(observed_qconfs)
+        perturbations, weight_observers = self.calc_quantization_noise(covering_qconfig_sequences, traces_order)
+
+        hawq_metric_per_group_option = []  # type: List[List[float]]
+        for trace_indices, qconfig_options in zip(groups_of_trace_indices, qconfig_options_per_group):
+            hawq_metrics = []
+            for qconfig_option in qconfig_options:
+                hawq_metric = 0.0
+                for trace_idx, qconfig in zip(trace_indices, qconfig_option):
+                    execution_index = traces_order.get_execution_index_by_traces_index(trace_idx)
+                    perturbation = perturbations.get(layer_id=execution_index, qconfig=qconfig)
+                    hawq_metric += (traces_per_layer.get_by_trace_index(trace_idx) * perturbation).item()
+                hawq_metrics.append(hawq_metric)
+            hawq_metric_per_group_option.append(hawq_metrics)
+
+        # The groups of layers are merged into the knapsack items if they have weight quantizers with
+        # the common input, and each combination of the qconfig options of the merged groups is an item option
+        qp_ids_in_trace_order = self._get_weight_qp_ids_in_trace_order(traces_order)
+        group_index_per_qp_id = {}  # type: Dict[QuantizationPointId, int]
+        for group_index, trace_indices in enumerate(groups_of_trace_indices):
+            for trace_idx in trace_indices:
+                for qp_id in qp_ids_in_trace_order[trace_idx]:
+                    group_index_per_qp_id[qp_id] = group_index
+        quantizer_setup = deepcopy(self._algo.get_quantizer_setup_for_current_state())
+        shared_input_groups_per_group_index = [[] for _ in groups_of_trace_indices]
+        groups_graph = nx.Graph()
+        groups_graph.add_nodes_from(range(len(groups_of_trace_indices)))
+        for shared_input_group in quantizer_setup.shared_input_operation_set_groups.values():
+            group_indices = sorted(
+                {group_index_per_qp_id[qp_id] for qp_id in shared_input_group if qp_id in group_index_per_qp_id}
+            )
+            for group_index in group_indices:
+                shared_input_groups_per_group_index[group_index].append(shared_input_group)
+            groups_graph.add_edges_from(zip(group_indices, group_indices[1:]))
+        items = [sorted(component) for component in nx.connected_components(groups_graph)]
+
+        ratio_calculator = self._compression_ratio_calculator
+        group_option_indices_per_item = []  # type: List[List[Tuple[int, ...]]]
+        knapsack_options_per_item = []  # type: List[List[KnapsackOption]]
+        for item in items:
+            group_option_indices = list(itertools.product(*[range(len(qconfig_options_per_group[i])) for i in item]))
+            shared_input_groups = [group for i in item for group in shared_input_groups_per_group_index[i]]
+            knapsack_options = []
+            for option_indices in group_option_indices:
+                hawq_metric = 0.0
+                weight_qp_ids = []
+                for group_index, option_index in zip(item, option_indices):
+                    hawq_metric += hawq_metric_per_group_option[group_index][option_index]
+                    qconfig_option = qconfig_options_per_group[group_index][option_index]
+                    for trace_idx, qconfig in zip(groups_of_trace_indices[group_index], qconfig_option):
+                        for qp_id in qp_ids_in_trace_order[trace_idx]:
+                            quantizer_setup.quantization_points[qp_id].qconfig = deepcopy(qconfig)
+                            weight_qp_ids.append(qp_id)
+                for shared_input_group in shared_input_groups:
+                    quantizer_setup = self._set_activations_bitwidth_for_shared_input_group(
+                        quantizer_setup, shared_input_group
+                    )
+                bits_complexity = 0
+                for qp_id in weight_qp_ids:
+                    wq_num_bits = quantizer_setup.quantization_points[qp_id].qconfig.num_bits
+                    aq_qp_id = ratio_calculator.get_activation_qp_id(qp_id)
+                    aq_num_bits = quantizer_setup.quantization_points[aq_qp_id].qconfig.num_bits
+                    bits_complexity += ratio_calculator.get_bits_complexity(qp_id, wq_num_bits, aq_num_bits)
+                knapsack_options.append(KnapsackOption(weight=bits_complexity, cost=hawq_metric))
+            group_option_indices_per_item.append(group_option_indices)
+            knapsack_options_per_item.append(knapsack_options)
+
+        def get_bitwidths(item: List[int], option_indices: Tuple[int, ...]) -> Set[int]:
+            return {qconfig_options_per_group[i][j][0].num_bits for i, j in zip(item, option_indices)}
+
+        max_bits_complexity = ratio_calculator.maximum_bits_complexity / self._compression_ratio
+        best_solution = None
+        best_hawq_metric = None
+        # As in the exhaustive search, the sequences that contain all the weight bitwidths which are not supported
+        # by the activation quantizers are excluded by searching without each of these bitwidths in turn
+        excessive_weight_bitwidths = self._get_excessive_weight_bitwidths() if self._hw_precision_constraints else set()
+        for excluded_bitwidth in excessive_weight_bitwidths or [None]:
+            allowed_option_indexes_per_item = []
+            for item, group_option_indices in zip(items, group_option_indices_per_item):
+                allowed_option_indexes_per_item.append(
+                    [
+                        i
+                        for i, option_indices in enumerate(group_option_indices)
+                        if excluded_bitwidth not in get_bitwidths(item, option_indices)
+                    ]
+                )
+            solution = solve_multiple_choice_knapsack(
+                [
+                    [knapsack_options[i] for i in allowed_option_indexes]
+                    for knapsack_options, allowed_option_indexes in zip(
+                        knapsack_options_per_item, allowed_option_indexes_per_item
+                    )
+                ],
+                max_bits_complexity,
+            )
+            if solution is None:
+                continue
+            solution = [allowed[i] for allowed, i in zip(allowed_option_indexes_per_item, solution)]
+            hawq_metric = sum(options[i].cost for options, i in zip(knapsack_options_per_item, solution))
+            if best_hawq_metric is None or hawq_metric < best_hawq_metric:
+                best_solution = solution
+                best_hawq_metric = hawq_metric
+
+        if best_solution is None:
+            min_bits_complexity = sum(min(opt.weight for opt in options) for options in knapsack_options_per_item)
+            max_bits_complexity = sum(max(opt.weight for opt in options) for options in knapsack_options_per_item)
+            raise AttributeError(
+                "Invalid compression ratio={}. Should be within range [{:.3f}, {:.3f}]".format(
+                    self._compression_ratio,
+                    ratio_calculator.maximum_bits_complexity / max_bits_complexity,
+                    ratio_calculator.maximum_bits_complexity / min_bits_complexity,
+                )
+            )
+
+        chosen_qconfig_sequence_in_traces_order = [None] * len(traces_order)
+        for item, group_option_indices, option_index in zip(items, group_option_indices_per_item, best_solution):
+            for group_index, qconfig_option_index in zip(item, group_option_indices[option_index]):
+                qconfig_option = qconfig_options_per_group[group_index][qconfig_option_index]
+                for trace_idx, qconfig in zip(groups_of_trace_indices[group_index], qconfig_option):
+                    chosen_qconfig_sequence_in_traces_order[trace_idx] = qconfig
+        return chosen_qconfig_sequence_in_traces_order, perturbations, weight_observers
+
+    def _get_groups_of_trace_indices_with_same_bitwidth(self, traces_order: TracesOrder) -> List[List[int]]:
+        """
+        :return: Groups of the trace order indices of the weight quantizers that should have the same bitwidth. In the
+            strict bitwidth assignment mode these are the weight quantizers with common adjacent activation quantizers,
+            otherwise each weight quantizer forms a separate group.
+        """
+        trace_index_per_execution_index = traces_order.get_execution_order_configs(list(range(len(traces_order))))
+        if self._bitwidth_assignment_mode != BitwidthAssignmentMode.STRICT:
+            return [[trace_idx] for trace_idx in range(len(traces_order))]
+        weight_quantizer_ids_in_execution_order = list(self._weight_quantizations_by_execution_order.keys())
+        groups_of_trace_indices = []
+        grouped_trace_indices = set()
+        for group_of_adjacent_quantizers in self._groups_of_adjacent_quantizers:
+            trace_indices = []
+            for quantizer_id, _ in group_of_adjacent_quantizers.weight_quantizers:
+                if quantizer_id in weight_quantizer_ids_in_execution_order:
+                    execution_index = weight_quantizer_ids_in_execution_order.index(quantizer_id)
+                    trace_indices.append(trace_index_per_execution_index[execution_index])
+            if trace_indices:
+                groups_of_trace_indices.append(trace_indices)
+                grouped_trace_indices.update(trace_indices)
+        for trace_idx in range(len(traces_order)):
+            if trace_idx not in grouped_trace_indices:
+                groups_of_trace_indices.append([trace_idx])
+        return groups_of_trace_indices
+
     class ParamsToRestore(NamedTuple):
         originally_disabled_gradients: List[str]
         skipped_gradients_to_enable: List[Tuple[nn.Module, str]]
@@ -490,7 +745,12 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
             self._model, criterion_fn, criterion, self._init_device, self._data_loader, self._num_data_points
         )
         try:
-            avg_traces = trace_estimator.get_average_traces(max_iter=iter_number, tolerance=tolerance)
+            avg_traces = trace_estimator.get_average_traces(
+                max_iter=iter_number,
+                tolerance=tolerance,
+                num_probes=self._num_probes,
+                confidence_level=self._confidence_level,
+            )
         except RuntimeError as error:
             if "cuda out of memory" in error.args[0].lower():
                 raise RuntimeError(
@@ -536,6 +796,18 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
     def get_qconfig_sequences_constrained_by_traces_order(
         self, traces_order: TracesOrder
     ) -> Tuple[List[QConfigSequenceForHAWQToEvaluate], List[CoveringQConfigSequenceForQuantNoiseCalculation]]:
+        (
+            possible_qconfigs_sequence_in_trace_order,
+            trace_order_indices_of_defaulted_qconfig_sequence,
+        ) = self._get_possible_qconfigs_sequence_in_trace_order(traces_order)
+        matcher = TraceOrderBitwidthMatcher(self._bitwidths, traces_order)
+        return matcher.get_qconfig_sequences_constrained_by_trace_order(
+            possible_qconfigs_sequence_in_trace_order, trace_order_indices_of_defaulted_qconfig_sequence
+        )
+
+    def _get_possible_qconfigs_sequence_in_trace_order(
+        self, traces_order: TracesOrder
+    ) -> Tuple[List[List[QuantizerConfig]], Set[int]]:
         possible_qconfigs_sequence_in_trace_order = []  # type: List[List[QuantizerConfig]]
         trace_order_indices_of_defaulted_qconfig_sequence = set()  # type: Set[int]
         quantizer_ids_in_exec_order = list(self._weight_quantizations_by_execution_order.keys())
@@ -552,11 +824,7 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
             else:
                 possible_qconfigs_sequence_in_trace_order.append([default_qconfig])
                 trace_order_indices_of_defaulted_qconfig_sequence.add(trace_idx)
-
-        matcher = TraceOrderBitwidthMatcher(self._bitwidths, traces_order)
-        return matcher.get_qconfig_sequences_constrained_by_trace_order(
-            possible_qconfigs_sequence_in_trace_order, trace_order_indices_of_defaulted_qconfig_sequence
-        )
+        return possible_qconfigs_sequence_in_trace_order, trace_order_indices_of_defaulted_qconfig_sequence
 
     def _get_weight_qp_ids_in_trace_order(self, traces_order: TracesOrder) -> List[Set[QuantizationPointId]]:
         quant_module_ids = list(self._weight_quantizations_by_execution_order.keys())
@@ -583,6 +851,18 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
     def calc_quantization_noise(
         self, qconfig_sequences_to_run: List[CoveringQConfigSequenceForQuantNoiseCalculation], traces_order: TracesOrder
     ) -> Tuple[Perturbations, List[List[PerturbationObserver]]]:
+        """
+        Calculates the quantization noise of the weights for each given qconfig sequence. The noise only depends on
+        the weight and its quantizer, so the weight quantizers are applied directly to the weights instead of running
+        the model. The quantization model is only regenerated for the qconfig sequences that differ from the
+        current quantizer setup in more than bitwidths, while the bitwidths of the existing weight quantizers are
+        changed for the time of the calculation only.
+
+        :param qconfig_sequences_to_run: The qconfig sequences in the traces order to calculate the noise for.
+        :param traces_order: The order of the weightable layers by the average Hessian traces.
+        :return: The quantization noise for each weightable layer and qconfig and the perturbation observers with
+            the noise for each weightable layer in the traces order and each qconfig sequence.
+        """
         perturbations = Perturbations()
         qp_ids_in_trace_order = self._get_weight_qp_ids_in_trace_order(traces_order)
         ctrl = self._algo
@@ -591,31 +871,29 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
             quantizer_setup_to_run = self._apply_qconfig_sequence_to_quantizer_setup(
                 qconfig_sequence, qp_ids_in_trace_order, ctrl.get_quantizer_setup_for_current_state()
             )
-            ctrl, model = ctrl.apply_new_quantizer_setup(
-                quantizer_setup_to_run
-            )  # type: Tuple[ExperimentalQuantizationController, NNCFNetwork]
+            if ctrl.is_new_setup_requires_regeneration(quantizer_setup_to_run):
+                ctrl, _ = ctrl.apply_new_quantizer_setup(quantizer_setup_to_run)
 
-            hook_handles = []
             observers = []
-            for qp_id_set in qp_ids_in_trace_order:
-                for qp_id in qp_id_set:
-                    wq_id = ctrl.setup_to_module_id_translation_dict[qp_id]
-                    wq_module = ctrl.weight_quantizers[wq_id].quantizer_module_ref
-                    observer = PerturbationObserver(self._init_device)
-                    hook_handles.append(wq_module.register_forward_hook(observer.calc_perturbation))
-                    observers.append(observer)
-
-            model.nncf.do_dummy_forward(force_eval=True)
+            for trace_idx, qp_id_set in enumerate(qp_ids_in_trace_order):
+                # All quantization points of the layer correspond to the same weight quantizer
+                wq_id = ctrl.setup_to_module_id_translation_dict[next(iter(qp_id_set))]
+                wq_info = ctrl.weight_quantizers[wq_id]
+                wq_module = wq_info.quantizer_module_ref
+                observer = PerturbationObserver(self._init_device)
+                original_num_bits = wq_module.num_bits
+                wq_module.num_bits = qconfig_sequence[trace_idx].num_bits
+                with torch.no_grad():
+                    weight = wq_info.quantized_module.weight
+                    observer.calc_perturbation(wq_module, weight, wq_module(weight))
+                wq_module.num_bits = original_num_bits
+                observers.append(observer)
 
-            for i, observer in enumerate(observers):
                 perturbations.add(
-                    layer_id=traces_order.get_execution_index_by_traces_index(i),
-                    qconfig=qconfig_sequence[i],
+                    layer_id=traces_order.get_execution_index_by_traces_index(trace_idx),
+                    qconfig=qconfig_sequence[trace_idx],
                     perturbation=observer.get_observation().to(self._init_device),
                 )
-
-            for handle in hook_handles:
-                handle.remove()
             observers_for_all_qconfig_sequences.append(observers)
 
         return perturbations, observers_for_all_qconfig_sequences
@@ -669,28 +947,30 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
 
         assert quantizer_setup_to_set.shared_input_operation_set_groups
         for group in quantizer_setup_to_set.shared_input_operation_set_groups.values():
-            weight_qp_ids = []
-            act_qp_ids = []
-            for qp_id in group:
-                qp = quantizer_setup_to_set.quantization_points[qp_id]
-                if qp.is_weight_quantization_point():
-                    weight_qp_ids.append(qp_id)
-                elif qp.is_activation_quantization_point():
-                    act_qp_ids.append(qp_id)
-            weight_qps = [quantizer_setup_to_set.quantization_points[qp_id] for qp_id in weight_qp_ids]
-            weight_bitwidth_set = {weight_qp.qconfig.num_bits for weight_qp in weight_qps}
-
-            if self._bitwidth_assignment_mode == BitwidthAssignmentMode.STRICT:
-                quantizer_setup_to_set = self._set_activations_bitwidth_strictly(
-                    quantizer_setup_to_set, act_qp_ids, weight_bitwidth_set
-                )
-            else:
-                quantizer_setup_to_set = self._set_activation_bitwidth_liberally(
-                    quantizer_setup_to_set, act_qp_ids, weight_bitwidth_set
-                )
+            quantizer_setup_to_set = self._set_activations_bitwidth_for_shared_input_group(
+                quantizer_setup_to_set, group
+            )
 
         return quantizer_setup_to_set
 
+    def _set_activations_bitwidth_for_shared_input_group(
+        self, quantizer_setup_to_set: SingleConfigQuantizerSetup, group: Set[QuantizationPointId]
+    ) -> SingleConfigQuantizerSetup:
+        weight_qp_ids = []
+        act_qp_ids = []
+        for qp_id in group:
+            qp = quantizer_setup_to_set.quantization_points[qp_id]
+            if qp.is_weight_quantization_point():
+                weight_qp_ids.append(qp_id)
+            elif qp.is_activation_quantization_point():
+                act_qp_ids.append(qp_id)
+        weight_qps = [quantizer_setup_to_set.quantization_points[qp_id] for qp_id in weight_qp_ids]
+        weight_bitwidth_set = {weight_qp.qconfig.num_bits for weight_qp in weight_qps}
+
+        if self._bitwidth_assignment_mode == BitwidthAssignmentMode.STRICT:
+            return self._set_activations_bitwidth_strictly(quantizer_setup_to_set, act_qp_ids, weight_bitwidth_set)
+        return self._set_activation_bitwidth_liberally(quantizer_setup_to_set, act_qp_ids, weight_bitwidth_set)
+
     def _set_activation_bitwidth_liberally(
         self,
         quantizer_setup_to_set: SingleConfigQuantizerSetup,
@@ -801,15 +1081,7 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
     ) -> List[QConfigSequenceForHAWQToEvaluate]:
         result = weight_qconfig_sequences_in_trace_order
         if self._hw_precision_constraints:
-            all_weight_bitwidths = set()
-            for wq_id in self._algo.weight_quantizers:
-                all_weight_bitwidths.update(self._hw_precision_constraints.get_all_unique_bitwidths(wq_id))
-
-            all_activation_bitwidths = set()
-            for aq_id in self._algo.non_weight_quantizers:
-                all_activation_bitwidths.update(self._hw_precision_constraints.get_all_unique_bitwidths(aq_id))
-
-            excessive_weight_bitwidths = all_weight_bitwidths - all_activation_bitwidths
+            excessive_weight_bitwidths = self._get_excessive_weight_bitwidths()
 
             def filter_fn(qconfig_sequence: QConfigSequenceForHAWQToEvaluate):
                 all_qconfig_bitwidths = set(map(lambda qconfig: qconfig.num_bits, qconfig_sequence))
@@ -818,3 +1090,17 @@ class HAWQPrecisionInitializer(BasePrecisionInitializer):
             if excessive_weight_bitwidths:
                 result = list(filter(filter_fn, weight_qconfig_sequences_in_trace_order))
         return result
+
+    def _get_excessive_weight_bitwidths(self) -> Set[int]:
+        """
+        :return: Bitwidths that are allowed for the weight quantizers, but not for any activation quantizer.
+        """
+        all_weight_bitwidths = set()
+        for wq_id in self._algo.weight_quantizers:
+            all_weight_bitwidths.update(self._hw_precision_constraints.get_all_unique_bitwidths(wq_id))
+
+        all_activation_bitwidths = set()
+        for aq_id in self._algo.non_weight_quantizers:
+            all_activation_bitwidths.update(self._hw_precision_constraints.get_all_unique_bitwidths(aq_id))
+
+        return all_weight_bitwidths - all_activation_bitwidths
@@ -0,0 +1,59 @@
+# Copyright (c) 2023 Intel Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, NamedTuple, Optional
+
+
+class KnapsackOption(NamedTuple):
+    weight: float
+    cost: float
+
+
+def solve_multiple_choice_knapsack(
+    options_per_group: List[List[KnapsackOption]], max_weight: float
+) -> Optional[List[int]]:
+    """
+    Chooses exactly one option in each group so that the total cost of the chosen options is minimal and their total
+    weight does not exceed the given limit. The search is done by dynamic programming over the groups: only the
+    Pareto-optimal partial solutions, i.e. the ones that have the lowest cost among all the partial solutions of
+    the same or lower weight, are kept after each group, so the solution is exact. The number of kept partial
+    solutions is bounded by the number of distinct total weights, which is usually small in practice,
+    but may grow exponentially with the number of groups in the worst case.
+
+    :param options_per_group: The options to choose from for each group.
+    :param max_weight: The maximal total weight of the chosen options.
+    :return: The indexes of the chosen options for each group or None if there is no solution satisfying
+        the weight limit.
+    """
+    # A partial solution is represented by the tuple (weight, cost, path), where path is the linked list
+    # (index of the chosen option, path of the parent partial solution) to avoid copying of the chosen indexes.
+    frontier = [(0, 0, None)]
+    for options in options_per_group:
+        candidates = []
+        for weight, cost, path in frontier:
+            for option_index, option in enumerate(options):
+                candidate_weight = weight + option.weight
+                if candidate_weight <= max_weight:
+                    candidates.append((candidate_weight, cost + option.cost, (option_index, path)))
+        if not candidates:
+            return None
+        candidates.sort(key=lambda x: (x[0], x[1]))
+        frontier = []
+        for candidate in candidates:
+            if not frontier or candidate[1] < frontier[-1][1]:
+                frontier.append(candidate)
+
+    # The cost of the partial solutions in the frontier strictly decreases with the weight
+    _, _, path = frontier[-1]
+    chosen_option_indexes = []
+    while path is not None:
+        option_index, path = path
+        chosen_option_indexes.append(option_index)
+    return list(reversed(chosen_option_indexes))
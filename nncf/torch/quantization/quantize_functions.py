@@ -8,17 +8,55 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any
+from enum import Enum
+from typing import Any, List, Optional, Tuple
 
 import torch
 
 from nncf.common.logging import nncf_logger
+from nncf.common.utils.api_marker import api
 from nncf.torch.dynamic_graph.patch_pytorch import register_operator
 from nncf.torch.functions import STRound
 from nncf.torch.functions import clamp
 from nncf.torch.quantization.extensions import QuantizedFunctionsCPU
 from nncf.torch.quantization.extensions import QuantizedFunctionsCUDA
 from nncf.torch.utils import add_domain
+from nncf.torch.utils import is_torch_compiling
+
+
+class QuantizationKernelsType(Enum):
+    """
+    Implementation of the fake quantization operations used by the quantizer modules.
+
+    :param EXTENSIONS: The C++/CUDA extensions of NNCF, compiled just-in-time.
+    :param TORCH: The implementation composed of the PyTorch tensor operations only. Does not require
+        compiling the extensions and may be captured by `torch.compile`.
+    """
+
+    EXTENSIONS = "extensions"
+    TORCH = "torch"
+
+
+_QUANTIZATION_KERNELS_TYPE = QuantizationKernelsType.EXTENSIONS
+
+
+@api(canonical_alias="nncf.torch.set_quantization_kernels_type")
+def set_quantization_kernels_type(kernels_type: QuantizationKernelsType) -> None:
+    """
+    Selects the implementation of the fake quantization operations for all the quantizer modules.
+    Takes effect starting from the next forward call of the quantizers.
+
+    :param kernels_type: The implementation to be used.
+    """
+    global _QUANTIZATION_KERNELS_TYPE
+    _QUANTIZATION_KERNELS_TYPE = QuantizationKernelsType(kernels_type)
+
+
+def get_quantization_kernels_type() -> QuantizationKernelsType:
+    """
+    :return: The currently selected implementation of the fake quantization operations.
+    """
+    return _QUANTIZATION_KERNELS_TYPE
 
 
 # pylint:disable=abstract-method
@@ -28,7 +66,9 @@ class QuantizeSymmetric(torch.autograd.Function):
         input_low = scale * (level_low / level_high)
         input_range = scale - input_low
 
-        if input_.is_cuda:
+        if _QUANTIZATION_KERNELS_TYPE is QuantizationKernelsType.TORCH:
+            output = TorchQuantizedFunctions.Quantize_forward(input_, input_low, input_range, levels)
+        elif input_.is_cuda:
             if not input_.is_contiguous():
                 nncf_logger.debug("input_ is not contiguous!")
                 input_ = input_.contiguous()
@@ -57,7 +97,11 @@ class QuantizeSymmetric(torch.autograd.Function):
         level_low = ctx.level_low
         level_high = ctx.level_high
 
-        if grad_output.is_cuda:
+        if _QUANTIZATION_KERNELS_TYPE is QuantizationKernelsType.TORCH:
+            grad_input, _, grad_scale = TorchQuantizedFunctions.Quantize_backward(
+                grad_output, input_, input_low, input_range, levels, level_low, level_high, False
+            )
+        elif grad_output.is_cuda:
             if not grad_output.is_contiguous():
                 nncf_logger.debug("grad_output is not contiguous!")
                 grad_output = grad_output.contiguous()
@@ -77,7 +121,9 @@ class QuantizeSymmetric(torch.autograd.Function):
 class QuantizeAsymmetric(torch.autograd.Function):
     @staticmethod
     def forward(ctx, input_, input_low, input_range, level_low, level_high, levels):
-        if input_.is_cuda:
+        if _QUANTIZATION_KERNELS_TYPE is QuantizationKernelsType.TORCH:
+            output = TorchQuantizedFunctions.Quantize_forward(input_, input_low, input_range, levels)
+        elif input_.is_cuda:
             if not input_.is_contiguous():
                 nncf_logger.debug("input_ is not contiguous!")
                 input_ = input_.contiguous()
@@ -106,7 +152,11 @@ class QuantizeAsymmetric(torch.autograd.Function):
         level_low = ctx.level_low
         level_high = ctx.level_high
 
-        if grad_output.is_cuda:
+        if _QUANTIZATION_KERNELS_TYPE is QuantizationKernelsType.TORCH:
+            grad_input, grad_input_low, grad_input_range = TorchQuantizedFunctions.Quantize_backward(
+                grad_output, input_, input_low, input_range, levels, level_low, level_high, True
+            )
+        elif grad_output.is_cuda:
             if not grad_output.is_contiguous():
                 nncf_logger.debug("grad_output is not contiguous!")
                 grad_output = grad_output.contiguous()
@@ -188,12 +238,153 @@ def get_scale_zp_from_input_low_input_high(level_low, level_high, input_low, inp
     return y_scale, y_zero_point
 
 
+class TorchQuantizedFunctions:
+    """
+    Counterparts of the quantization extension functions, with the same signatures and results, composed of
+    the PyTorch operations only. Work on any device and do not require compiling the extensions.
+    """
+
+    @staticmethod
+    def Quantize_forward(
+        input_: torch.Tensor, input_low: torch.Tensor, input_range: torch.Tensor, levels: int
+    ) -> torch.Tensor:
+        input_low = input_low.to(dtype=input_.dtype)
+        input_range = input_range.to(dtype=input_.dtype)
+        # The reciprocal-based `scalar / tensor` of PyTorch would differ from the extensions in the last bit
+        scale = torch.full_like(input_range, levels - 1) / input_range
+        output = torch.max(torch.min(input_, input_low + input_range), input_low)
+        zero_point = torch.round(-input_low * scale)
+        output.sub_(input_low).mul_(scale).sub_(zero_point).round_().div_(scale)
+        return output
+
+    @staticmethod
+    def Quantize_backward(
+        grad_output: torch.Tensor,
+        input_: torch.Tensor,
+        input_low: torch.Tensor,
+        input_range: torch.Tensor,
+        levels: int,
+        level_low: int,
+        level_high: int,
+        is_asymmetric: bool = False,
+    ) -> List[Optional[torch.Tensor]]:
+        output = TorchQuantizedFunctions.Quantize_forward(input_, input_low, input_range, levels)
+        input_low = input_low.to(dtype=input_.dtype)
+        input_range = input_range.to(dtype=input_.dtype)
+        mask_hi = input_ > input_low + input_range
+        mask_lo = input_ < input_low
+
+        err = output.sub_(input_).div_(input_range)
+        err.masked_fill_(mask_hi, 1).masked_fill_(mask_lo, level_low / level_high).mul_(grad_output)
+        grad_input_range = err.sum_to_size(input_range.shape)
+
+        outside_mask = mask_hi.logical_or_(mask_lo)
+        grad_input = grad_output.masked_fill(outside_mask, 0)
+        grad_input_low = None
+        if is_asymmetric:
+            grad_input_low = grad_output.masked_fill(outside_mask.logical_not_(), 0).sum_to_size(input_low.shape)
+        return [grad_input, grad_input_low, grad_input_range]
+
+
+def _with_straight_through_gradient(value: torch.Tensor, surrogate: torch.Tensor) -> torch.Tensor:
+    """
+    Returns a tensor that is exactly equal to `value`, while the gradients are propagated as if `surrogate`
+    were returned.
+    """
+    return value + (surrogate - surrogate.detach())
+
+
+def torch_quantize(
+    input_: torch.Tensor,
+    input_low: torch.Tensor,
+    input_range: torch.Tensor,
+    level_low: int,
+    level_high: int,
+    levels: int,
+    range_param: torch.Tensor,
+    input_low_param: Optional[torch.Tensor] = None,
+) -> torch.Tensor:
+    """
+    Fake quantization with the same results and gradients as `TorchQuantizedFunctions` have, expressed without
+    custom autograd functions and in-place operations, so that it may be captured by `torch.compile` as a single
+    graph and fused, or compiled by TorchScript.
+
+    :param input_: The tensor to be quantized.
+    :param input_low: The lower bound of the quantization range.
+    :param input_range: The length of the quantization range.
+    :param level_low: The lowest quantization level.
+    :param level_high: The highest quantization level.
+    :param levels: The number of quantization levels.
+    :param range_param: The tensor that receives the gradient with respect to the quantization range, e.g. the scale
+        of the symmetric quantizer.
+    :param input_low_param: The tensor that receives the gradient with respect to the lower bound of the
+        quantization range. Receives no gradient if None, as is the case for the symmetric quantizer.
+    :return: The fake quantized tensor.
+    """
+    input_low = input_low.detach().to(dtype=input_.dtype)
+    input_range = input_range.detach().to(dtype=input_.dtype)
+    scale = torch.full_like(input_range, levels - 1) / input_range
+    output = torch.max(torch.min(input_.detach(), input_low + input_range), input_low)
+    zero_point = torch.round(-input_low * scale)
+    output = torch.round((output - input_low) * scale - zero_point) / scale
+    if not torch.is_grad_enabled():
+        return output
+
+    mask_hi = input_ > input_low + input_range
+    mask_lo = input_ < input_low
+    mask_in = torch.logical_not(torch.logical_or(mask_hi, mask_lo))
+    err = (output - input_.detach()) / input_range
+    range_coeff = torch.where(
+        mask_hi, torch.ones_like(err), torch.where(mask_lo, torch.full_like(err, level_low / level_high), err)
+    )
+
+    surrogate = torch.where(mask_in, input_, torch.zeros_like(output)) + range_param * range_coeff
+    if input_low_param is not None:
+        surrogate = surrogate + torch.where(mask_in, torch.zeros_like(output), input_low_param)
+    return _with_straight_through_gradient(output, surrogate)
+
+
+def torch_tune_range(
+    input_low: torch.Tensor, input_range: torch.Tensor, levels: int
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Counterpart of `TuneRange` that may be captured by `torch.compile` or compiled by TorchScript.
+    """
+    input_low_copy = torch.clamp(input_low.detach(), max=0)
+    input_high = torch.clamp(input_range.detach() + input_low.detach(), min=0)
+    n = levels - 1
+    # Need a cast here because fp16 division yileds fp32 results sometimes
+    scale = (levels / (input_high - input_low_copy)).to(dtype=input_high.dtype)
+    zp = torch.round(-input_low_copy * scale)
+
+    new_input_low = torch.where(zp < n, zp / (zp - n) * input_high, input_low_copy)
+    new_input_high = torch.where(zp > 0.0, (zp - n) / zp * input_low_copy, input_high)
+
+    range_1 = input_high - new_input_low
+    range_2 = new_input_high - input_low_copy
+
+    mask = (range_1 > range_2).to(input_high.dtype)
+    inv_mask = (1 - mask).abs()
+
+    new_input_low = mask * new_input_low + inv_mask * input_low_copy
+    new_input_range = inv_mask * new_input_high + mask * input_high - new_input_low
+
+    return (
+        _with_straight_through_gradient(new_input_low, input_low),
+        _with_straight_through_gradient(new_input_range, input_range),
+    )
+
+
 @register_operator()
 def symmetric_quantize(input_, levels, level_low, level_high, scale, eps, skip: bool = False):
     if skip:
         return input_
     scale = scale.to(dtype=input_.dtype)
     scale_safe = abs(scale) + eps
+    if _QUANTIZATION_KERNELS_TYPE is QuantizationKernelsType.TORCH and is_torch_compiling():
+        input_low = scale_safe * (level_low / level_high)
+        input_range = scale_safe - input_low
+        return torch_quantize(input_, input_low, input_range, level_low, level_high, levels, range_param=scale_safe)
     return QuantizeSymmetric.apply(input_, scale_safe, level_low, level_high, levels)
 
 
@@ -202,6 +393,18 @@ def asymmetric_quantize(input_, levels, level_low, level_high, input_low, input_
     if skip:
         return input_
     input_range_safe = abs(input_range) + eps
+    if _QUANTIZATION_KERNELS_TYPE is QuantizationKernelsType.TORCH and is_torch_compiling():
+        input_low_tuned, input_range_tuned = torch_tune_range(input_low, input_range_safe, levels)
+        return torch_quantize(
+            input_,
+            input_low_tuned,
+            input_range_tuned,
+            level_low,
+            level_high,
+            levels,
+            range_param=input_range_tuned,
+            input_low_param=input_low_tuned,
+        )
     input_low_tuned, input_range_tuned = TuneRange.apply(input_low, input_range_safe, levels)
     return QuantizeAsymmetric.apply(input_, input_low_tuned, input_range_tuned, level_low, level_high, levels)
 
@@ -97,6 +97,26 @@ class ReferenceQuantize:
 
 
 class ReferenceQuantizedFunctions:
+    """
+    Torch-native counterparts of the quantization extension functions, with the same signatures.
+    """
+
     _executor = ReferenceQuantize(backend_type=ReferenceBackendType.TORCH)
     Quantize_forward = _executor.forward
-    Quantize_backward = _executor.backward
+
+    @staticmethod
+    def Quantize_backward(
+        grad_output: torch.Tensor,
+        input_: torch.Tensor,
+        input_low: torch.Tensor,
+        input_range: torch.Tensor,
+        levels: int,
+        level_low: int,
+        level_high: int,
+        is_asymmetric: bool = False,
+    ) -> List[torch.Tensor]:
+        executor = ReferenceQuantizedFunctions._executor
+        output = executor.forward(input_, input_low, input_range, levels)
+        return executor.backward(
+            grad_output, input_, input_low, input_range, output, level_low, level_high, is_asymmetric
+        )
@@ -8,7 +8,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List
+from typing import List, Optional, Tuple
 
 import torch
 from torch import nn
@@ -24,6 +24,8 @@ class BinaryMask(nn.Module):
         super().__init__()
         self.register_buffer("_binary_mask", torch.ones(shape))
         self.frozen = False
+        self._masked_weight_cache = None  # type: Optional[torch.Tensor]
+        self._masked_weight_cache_key = None  # type: Optional[Tuple]
 
     @property
     def binary_mask(self):
@@ -37,6 +39,9 @@ class BinaryMask(nn.Module):
     def forward(self, weight):
         if is_tracing_state():
             return weight.mul(self.binary_mask)
+        if self._is_masked_weight_cacheable(weight):
+            return self._get_cached_masked_weight(weight)
+        self.clear_masked_weight_cache()
         tmp_tensor = self._calc_training_binary_mask(weight)
         return apply_binary_mask_impl(tmp_tensor, weight)
 
@@ -45,3 +50,40 @@ class BinaryMask(nn.Module):
 
     def apply_binary_mask(self, weight):
         return apply_binary_mask_impl(self.binary_mask, weight)
+
+    def train(self, mode: bool = True):
+        # The weights are updated in the training mode, also bypassing the version counters via `.data`
+        self.clear_masked_weight_cache()
+        return super().train(mode)
+
+    def clear_masked_weight_cache(self):
+        self._masked_weight_cache = None
+        self._masked_weight_cache_key = None
+
+    def _get_mask_sources(self) -> List[torch.Tensor]:
+        """
+        :return: Tensors the frozen binary mask is calculated from.
+        """
+        return [self._binary_mask]
+
+    def _is_masked_weight_cacheable(self, weight: torch.Tensor) -> bool:
+        """
+        The masked weight is cached only in the evaluation mode when the mask is frozen and no gradient has
+        to flow through the masking, e.g. in the validation loop under `torch.no_grad()`.
+        """
+        if self.training or not self.frozen:
+            return False
+        if not torch.is_grad_enabled():
+            return True
+        return not weight.requires_grad and not any(t.requires_grad for t in self._get_mask_sources())
+
+    def _get_cached_masked_weight(self, weight: torch.Tensor) -> torch.Tensor:
+        # pylint: disable=protected-access
+        # In-place updates of the weight or the mask (e.g. by the optimizer or by the controller) bump
+        # the version counter of the tensor, `.to()` and `.set_()` change the storage.
+        key = tuple((id(t), t.data_ptr(), t._version) for t in [weight, *self._get_mask_sources()])
+        if self._masked_weight_cache is None or self._masked_weight_cache_key != key:
+            with torch.no_grad():
+                self._masked_weight_cache = apply_binary_mask_impl(self._calc_training_binary_mask(weight), weight)
+            self._masked_weight_cache_key = key
+        return self._masked_weight_cache
@@ -11,8 +11,6 @@
 from copy import deepcopy
 from typing import List
 
-import torch
-
 from nncf import NNCFConfig
 from nncf.api.compression import CompressionStage
 from nncf.common.accuracy_aware_training.training_loop import ADAPTIVE_COMPRESSION_CONTROLLERS
@@ -39,6 +37,7 @@ from nncf.torch.sparsity.collector import PTSparseModelStatisticsCollector
 from nncf.torch.sparsity.layers import BinaryMask
 from nncf.torch.sparsity.magnitude.functions import WEIGHT_IMPORTANCE_FUNCTIONS
 from nncf.torch.sparsity.magnitude.functions import calc_magnitude_binary_mask
+from nncf.torch.sparsity.magnitude.functions import find_kth_smallest_value
 
 
 @PT_COMPRESSION_ALGORITHMS.register("magnitude_sparsity")
@@ -150,8 +149,8 @@ class MagnitudeSparsityController(BaseSparsityAlgoController):
         all_weights = self._collect_all_weights(target_sparsified_module_info_list)
         if not all_weights:
             return 0.0
-        all_weights_tensor, _ = torch.cat(all_weights).sort()
-        threshold = all_weights_tensor[int((all_weights_tensor.size(0) - 1) * sparsity_level)].item()
+        num_weights = sum(weights.numel() for weights in all_weights)
+        threshold = find_kth_smallest_value(all_weights, int((num_weights - 1) * sparsity_level))
         return threshold
 
     def _set_masks_for_threshold(self, threshold_val, target_sparsified_module_info_list):
@@ -8,6 +8,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import List
 
 import torch
 
@@ -25,3 +26,38 @@ WEIGHT_IMPORTANCE_FUNCTIONS = {"abs": abs_magnitude, "normed_abs": normed_magnit
 
 def calc_magnitude_binary_mask(weight, weight_importance, threshold):
     return (weight_importance(weight) > threshold).float()
+
+
+def find_kth_smallest_value(tensors: List[torch.Tensor], k: int, num_bins: int = 4096) -> float:
+    """
+    Finds the k-th smallest value among the elements of the tensors without concatenating and sorting them.
+    The histogram of the values locates the narrow range that contains the k-th value, and only the values
+    from this range are gathered to select the k-th value exactly, so the selection takes linear time.
+
+    :param tensors: Non-empty list of 1D tensors.
+    :param k: Zero-based index of the value in the sorted concatenation of the tensors.
+    :param num_bins: Number of bins of the histogram.
+    :return: The k-th smallest value.
+    """
+    if len(tensors) == 1:
+        return torch.kthvalue(tensors[0], k + 1).values.item()
+
+    low = min(t.min().item() for t in tensors)
+    high = max(t.max().item() for t in tensors)
+    if low == high:
+        return low
+
+    # The per-tensor histograms are accumulated in double precision since the float32 counts of
+    # the histogram are exact only up to 2 ** 24 elements.
+    hist = sum(torch.histc(t.float(), bins=num_bins, min=low, max=high).double() for t in tensors)
+    bin_idx = int(torch.searchsorted(hist.cumsum(0).cpu(), torch.tensor([k], dtype=torch.float64), right=True))
+    # The neighbouring bins are included in the range to tolerate the rounding of the bin edges
+    bin_width = (high - low) / num_bins
+    range_low = low + max(bin_idx - 1, 0) * bin_width
+    range_high = low + (bin_idx + 2) * bin_width if bin_idx + 2 < num_bins else high
+
+    num_below_range = sum(int((t < range_low).sum()) for t in tensors)
+    values_in_range = torch.cat([t[(t >= range_low) & (t <= range_high)] for t in tensors])
+    if num_below_range <= k < num_below_range + values_in_range.numel():
+        return torch.kthvalue(values_in_range, k - num_below_range + 1).values.item()
+    return torch.kthvalue(torch.cat(tensors), k + 1).values.item()
@@ -48,6 +48,9 @@ class RBSparsifyingWeight(BinaryMask):
         u = self.uniform if self.training and not self.frozen else None
         return calc_rb_binary_mask(self._mask, u, self.eps)
 
+    def _get_mask_sources(self) -> List[torch.Tensor]:
+        return [self._mask]
+
     def loss(self):
         return binary_mask(self._mask)
 
@@ -9,27 +9,121 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict
+import io
+from typing import Dict, List, Optional
 
 import numpy as np
 import torch
+from torch import distributed as dist
 
-from nncf.common.factory import TModel
+from nncf.common.engine import Engine
 from nncf.common.graph.transformations.commands import TransformationPriority
 from nncf.common.graph.transformations.layout import TransformationLayout
+from nncf.common.logging import nncf_logger
 from nncf.common.tensor_statistics.aggregator import StatisticPointsContainer
 from nncf.common.tensor_statistics.aggregator import StatisticsAggregator
+from nncf.common.tensor_statistics.statistic_point import StatisticPoint
+from nncf.data.dataset import Dataset
+from nncf.experimental.common.tensor_statistics.collectors import TensorAggregatorBase
+from nncf.experimental.common.tensor_statistics.collectors import TensorCollector
 from nncf.torch.graph.transformations.commands import PTInsertionCommand
 from nncf.torch.nncf_network import NNCFNetwork
 from nncf.torch.tensor import PTNNCFTensor
+from nncf.torch.tensor_statistics.algo import get_merged_tensor_collectors
+from nncf.torch.tensor_statistics.collectors import get_tensor_collector_hook
+from nncf.torch.utils import get_model_device
+from nncf.torch.utils import get_rank
+from nncf.torch.utils import get_world_size
 
 
 class PTStatisticsAggregator(StatisticsAggregator):
+    """
+    Collects statistics for the PyTorch models. In the data-parallel mode the statistics collection
+    should be called by all processes of the default process group of `torch.distributed`: each process
+    collects statistics on its part of the dataset, then the statistics of all processes are merged.
+    """
+
+    def __init__(self, dataset: Dataset, distributed: bool = False):
+        """
+        :param dataset: Dataset for the statistics collection.
+        :param distributed: Whether to collect statistics in the data-parallel mode when the default process
+            group of `torch.distributed` is initialized. Each process collects statistics on the whole subset
+            of the dataset otherwise.
+        """
+        super().__init__(dataset)
+        self._distributed = distributed
+
     def collect_statistics(self, model: NNCFNetwork) -> None:
+        self._device = get_model_device(model)
         with torch.no_grad():
             with model.nncf.temporary_clean_view() as intermediate_model:
                 super().collect_statistics(intermediate_model)
 
+    def _collect_statistics(self, engine: Engine, statistic_points: StatisticPointsContainer) -> None:
+        world_size = get_world_size() if self._distributed else 1
+        aggregators = self._get_aggregators(statistic_points) if world_size > 1 else None
+        if world_size > 1 and aggregators is None:
+            nncf_logger.warning(
+                "Statistics are collected on the whole dataset by each process, "
+                "because some statistic collectors could not be merged across processes."
+            )
+        if aggregators is None:
+            super()._collect_statistics(engine, statistic_points)
+            return
+
+        # Each process collects statistics on every world_size-th data item of the subset
+        # and the aggregators of all processes are merged afterwards
+        rank = get_rank()
+        indices = list(range(rank, self.stat_subset_size, world_size))
+        num_samples = [aggregator.num_samples for aggregator in aggregators]
+        for aggregator in aggregators:
+            if aggregator.num_samples is not None:
+                aggregator.num_samples = len(range(rank, aggregator.num_samples, world_size))
+        dataset = self.dataset.get_inference_data(indices)
+        self._collect_statistics_on_dataset(engine, dataset, len(indices), statistic_points)
+        for aggregator, aggregator_num_samples in zip(aggregators, num_samples):
+            aggregator.num_samples = aggregator_num_samples
+
+        all_aggregators = self._all_gather_aggregators(aggregators)
+        for idx, aggregator in enumerate(aggregators):
+            aggregator.reset()
+            for process_aggregators in all_aggregators:
+                aggregator.merge(process_aggregators[idx])
+
+    def _all_gather_aggregators(self, aggregators: List[TensorAggregatorBase]) -> List[List[TensorAggregatorBase]]:
+        """
+        Gathers the aggregators of all processes of the default process group. Should be called by all processes.
+
+        :param aggregators: Aggregators of the current process.
+        :return: Aggregators of each process ordered by the process rank.
+        """
+        # torch.save is used instead of pickle to load the tensors of all processes to the device of the model
+        buffer = io.BytesIO()
+        torch.save(aggregators, buffer)
+        all_buffers = [None] * get_world_size()
+        dist.all_gather_object(all_buffers, buffer.getvalue())
+        return [torch.load(io.BytesIO(data), map_location=self._device) for data in all_buffers]
+
+    @staticmethod
+    def _get_aggregators(statistic_points: StatisticPointsContainer) -> Optional[List[TensorAggregatorBase]]:
+        """
+        Returns the unique aggregators of the statistic points in the order of the statistic points registration.
+
+        :param statistic_points: StatisticPointsContainer instance with the statistic points.
+        :return: Aggregators of the statistic points or None if some of the statistic collectors
+            are not TensorCollector instances and could not be merged.
+        """
+        aggregators = {}
+        for _statistic_points in statistic_points.values():
+            for statistic_point in _statistic_points:
+                for collectors in statistic_point.algorithm_to_tensor_collectors.values():
+                    for collector in collectors:
+                        if not isinstance(collector, TensorCollector):
+                            return None
+                        for aggregator in collector.aggregators.values():
+                            aggregators[id(aggregator)] = aggregator
+        return list(aggregators.values())
+
     def _register_statistics(
         self, outputs: Dict[str, PTNNCFTensor], statistic_points: StatisticPointsContainer
     ) -> None:
@@ -44,10 +138,14 @@ class PTStatisticsAggregator(StatisticsAggregator):
             for _statistic_point in _statistic_points:
                 for collectors in _statistic_point.algorithm_to_tensor_collectors.values():
                     for collector in collectors:
+                        if isinstance(collector, TensorCollector):
+                            hook = get_tensor_collector_hook(collector)
+                        else:
+                            hook = collector.register_input
                         transformation_commands.append(
                             PTInsertionCommand(
                                 _statistic_point.target_point,
-                                collector.register_input,
+                                hook,
                                 TransformationPriority.FP32_TENSOR_STATISTICS_OBSERVATION,
                             )
                         )
@@ -59,10 +157,29 @@ class PTStatisticsAggregator(StatisticsAggregator):
 
     @staticmethod
     def _get_merged_statistic_points(
-        statistic_points: StatisticPointsContainer, model: TModel
+        statistic_points: StatisticPointsContainer, model: NNCFNetwork
     ) -> StatisticPointsContainer:
-        # TODO: mirgate to experimental statistic collector and use common merging algorithm
-        return statistic_points
+        merged_statistic_points = StatisticPointsContainer()
+        target_points_vs_tensor_collectors = []
+        for _statistic_points in statistic_points.values():
+            for statistic_point in _statistic_points:
+                target_point = statistic_point.target_point
+                for algorithm, collectors in statistic_point.algorithm_to_tensor_collectors.items():
+                    for collector in collectors:
+                        if isinstance(collector, TensorCollector):
+                            target_points_vs_tensor_collectors.append((target_point, collector))
+                        else:
+                            # Legacy statistic collectors are registered as is
+                            merged_statistic_points.add_statistic_point(
+                                StatisticPoint(target_point, collector, algorithm)
+                            )
+
+        merged_collectors = get_merged_tensor_collectors(
+            model.nncf.get_original_graph(), target_points_vs_tensor_collectors
+        )
+        for target_point, merged_collector in merged_collectors:
+            merged_statistic_points.add_statistic_point(StatisticPoint(target_point, merged_collector, "Merged"))
+        return merged_statistic_points
 
     @staticmethod
     def _process_outputs(outputs: Dict[str, np.ndarray]) -> Dict[str, PTNNCFTensor]:
@@ -8,14 +8,19 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Set
+from collections import defaultdict
+from typing import Dict, Hashable, List, Set, Tuple, Union
 
 from nncf.api.compression import CompressionStage
+from nncf.common.graph import NNCFGraph
+from nncf.common.graph.transformations.commands import TargetType
 from nncf.common.schedulers import StubCompressionScheduler
 from nncf.common.statistics import NNCFStatistics
 from nncf.common.tensor_statistics.collectors import ReductionShape
 from nncf.common.tensor_statistics.collectors import TensorStatisticCollectorBase
 from nncf.config import NNCFConfig
+from nncf.experimental.common.tensor_statistics.collectors import MergedTensorCollector
+from nncf.experimental.common.tensor_statistics.collectors import TensorCollector
 from nncf.torch.algo_selector import ZeroCompressionLoss
 from nncf.torch.compression_method_api import PTCompressionAlgorithmBuilder
 from nncf.torch.compression_method_api import PTCompressionAlgorithmController
@@ -24,6 +29,9 @@ from nncf.torch.graph.transformations.commands import PTTargetPoint
 from nncf.torch.graph.transformations.commands import TransformationPriority
 from nncf.torch.graph.transformations.layout import PTTransformationLayout
 from nncf.torch.nncf_network import NNCFNetwork
+from nncf.torch.tensor_statistics.collectors import get_tensor_collector_hook
+
+StatisticCollector = Union[TensorStatisticCollectorBase, TensorCollector]
 
 
 class TensorStatisticObservationPoint:
@@ -38,11 +46,44 @@ class TensorStatisticObservationPoint:
         return self.target_point == other.target_point
 
 
+def get_merged_tensor_collectors(
+    nncf_graph: NNCFGraph, target_points_vs_collectors: List[Tuple[PTTargetPoint, TensorCollector]]
+) -> List[Tuple[PTTargetPoint, MergedTensorCollector]]:
+    """
+    Merges the tensor collectors that receive the same tensor, i.e. the ones registered for the same target point
+    or for the inputs of different operations produced by the same output of an operation. The identical
+    reducers and aggregators of the merged collectors are applied only once and the aggregated statistics are
+    available in all the merged collectors.
+
+    :param nncf_graph: NNCFGraph of the model to collect statistics for.
+    :param target_points_vs_collectors: Target points and the tensor collectors to register at them.
+    :return: Target points and the merged tensor collectors to register at them.
+    """
+    collectors_per_tensor = defaultdict(list)  # type: Dict[Hashable, List[Tuple[PTTargetPoint, TensorCollector]]]
+    for target_point, collector in target_points_vs_collectors:
+        tensor_key = target_point
+        if target_point.target_type == TargetType.OPERATOR_PRE_HOOK:
+            node = nncf_graph.get_node_by_name(target_point.target_node_name)
+            for edge in nncf_graph.get_input_edges(node):
+                if edge.input_port_id == target_point.input_port_id:
+                    tensor_key = (edge.from_node.node_name, edge.output_port_id)
+        collectors_per_tensor[tensor_key].append((target_point, collector))
+
+    retval = []
+    for target_points_and_collectors in collectors_per_tensor.values():
+        target_point, _ = target_points_and_collectors[0]
+        collectors = [collector for _, collector in target_points_and_collectors]
+        retval.append((target_point, MergedTensorCollector(collectors)))
+    return retval
+
+
 class TensorStatisticsCollectionBuilder(PTCompressionAlgorithmBuilder):
     def __init__(
         self,
         config: NNCFConfig,
-        observation_points_vs_collectors: Dict[TensorStatisticObservationPoint, TensorStatisticCollectorBase],
+        observation_points_vs_collectors: Dict[
+            TensorStatisticObservationPoint, Dict[ReductionShape, StatisticCollector]
+        ],
     ):
         super().__init__(config)
         self._observation_points_vs_collectors = observation_points_vs_collectors
@@ -52,13 +93,28 @@ class TensorStatisticsCollectionBuilder(PTCompressionAlgorithmBuilder):
         # receives its own data, and should we use a thread-local collector, there would have to be a
         # separate thread reduction step involved. Still, is there a better option here than to rely on GIL?
         layout = PTTransformationLayout()
+        target_points_vs_tensor_collectors = []
         for op, rs_vs_collector in self._observation_points_vs_collectors.items():
             for collector in rs_vs_collector.values():
+                if isinstance(collector, TensorCollector):
+                    target_points_vs_tensor_collectors.append((op.target_point, collector))
+                    continue
                 hook_obj = collector.register_input
                 command = PTInsertionCommand(
                     op.target_point, hook_obj, TransformationPriority.FP32_TENSOR_STATISTICS_OBSERVATION
                 )
                 layout.register(command)
+
+        merged_collectors = get_merged_tensor_collectors(
+            target_model.nncf.get_original_graph(), target_points_vs_tensor_collectors
+        )
+        for target_point, merged_collector in merged_collectors:
+            command = PTInsertionCommand(
+                target_point,
+                get_tensor_collector_hook(merged_collector),
+                TransformationPriority.FP32_TENSOR_STATISTICS_OBSERVATION,
+            )
+            layout.register(command)
         return layout
 
     def _build_controller(self, model: NNCFNetwork) -> "TensorStatisticsCollectionController":
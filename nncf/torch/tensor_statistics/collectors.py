@@ -9,12 +9,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, Deque, List, Optional, Union
+from typing import Any, Callable, Deque, List, Optional, Tuple, Union
 
+import numpy as np
 import torch
 
 from nncf.common.tensor import NNCFTensor
 from nncf.common.tensor import TensorElementsType
+from nncf.common.tensor_statistics.collectors import HistogramMedianMADStatisticCollector
+from nncf.common.tensor_statistics.collectors import HistogramPercentileStatisticCollector
 from nncf.common.tensor_statistics.collectors import MeanMinMaxStatisticCollector
 from nncf.common.tensor_statistics.collectors import MeanPercentileStatisticCollector
 from nncf.common.tensor_statistics.collectors import MedianMADStatisticCollector
@@ -23,10 +26,19 @@ from nncf.common.tensor_statistics.collectors import MixedMinMaxStatisticCollect
 from nncf.common.tensor_statistics.collectors import NNCFCollectorTensorProcessor
 from nncf.common.tensor_statistics.collectors import PercentileStatisticCollector
 from nncf.common.tensor_statistics.collectors import ReductionShape
-from nncf.common.tensor_statistics.reduction import np_percentile_reduce_like
+from nncf.experimental.common.tensor_statistics.collectors import AbsMaxReducer
+from nncf.experimental.common.tensor_statistics.collectors import AbsQuantileReducer
+from nncf.experimental.common.tensor_statistics.collectors import InplaceInsertionFNType
+from nncf.experimental.common.tensor_statistics.collectors import MaxReducer
+from nncf.experimental.common.tensor_statistics.collectors import MeanReducer
+from nncf.experimental.common.tensor_statistics.collectors import MinReducer
+from nncf.experimental.common.tensor_statistics.collectors import NoopReducer
+from nncf.experimental.common.tensor_statistics.collectors import QuantileReducer
+from nncf.experimental.common.tensor_statistics.collectors import TensorCollector
 from nncf.torch.dynamic_graph.context import no_nncf_trace
 from nncf.torch.tensor import PTNNCFTensor
 from nncf.torch.tensor_statistics.reduction import expand_like
+from nncf.torch.tensor_statistics.reduction import get_per_channel_history
 from nncf.torch.tensor_statistics.statistics import PTMedianMADTensorStatistic
 from nncf.torch.tensor_statistics.statistics import PTMinMaxTensorStatistic
 from nncf.torch.tensor_statistics.statistics import PTPercentileTensorStatistic
@@ -86,6 +98,14 @@ class PTNNCFCollectorTensorProcessor(NNCFCollectorTensorProcessor):
         tensor_list = torch.unbind(tensor, dim=axis)
         return [PTNNCFTensor(t) for t in tensor_list]
 
+    @staticmethod
+    def to_numpy(x: NNCFTensor) -> np.ndarray:
+        return x.tensor.detach().cpu().numpy()
+
+    @staticmethod
+    def from_numpy(x: np.ndarray) -> NNCFTensor:
+        return PTNNCFTensor(torch.from_numpy(x))
+
     @staticmethod
     def sum(tensor: NNCFTensor) -> TensorElementsType:
         return torch.sum(tensor.tensor).item()
@@ -94,7 +114,28 @@ class PTNNCFCollectorTensorProcessor(NNCFCollectorTensorProcessor):
     def quantile(
         tensor: NNCFTensor, quantile: Union[float, List[float]], axis: Union[int, tuple, list], keepdims: bool = False
     ) -> List[NNCFTensor]:
-        raise NotImplementedError()
+        # torch.quantile reduces along a single dimension only and limits the input size,
+        # so the quantiles are computed with the linear interpolation of the sorted values as in np.quantile
+        x = tensor.tensor
+        axis = [axis] if isinstance(axis, int) else list(axis)
+        axis = [dim % x.dim() for dim in axis]
+        kept_dims = [dim for dim in range(x.dim()) if dim not in axis]
+        x = x.permute(*kept_dims, *axis).reshape(*[x.shape[dim] for dim in kept_dims], -1)
+        sorted_x = torch.sort(x, dim=-1).values
+
+        quantile = [quantile] if isinstance(quantile, float) else quantile
+        positions = torch.tensor(quantile, dtype=torch.float64) * (sorted_x.shape[-1] - 1)
+        low_idxs = torch.floor(positions).long().to(sorted_x.device)
+        high_idxs = torch.ceil(positions).long().to(sorted_x.device)
+        weights = (positions - torch.floor(positions)).to(device=sorted_x.device, dtype=sorted_x.dtype)
+        low_values = sorted_x.index_select(-1, low_idxs)
+        high_values = sorted_x.index_select(-1, high_idxs)
+        result = (low_values + (high_values - low_values) * weights).movedim(-1, 0)
+
+        if keepdims:
+            result_shape = [1 if dim in axis else size for dim, size in enumerate(tensor.shape)]
+            result = result.reshape(len(quantile), *result_shape)
+        return [PTNNCFTensor(x) for x in result]
 
     @staticmethod
     def mean_per_channel(x: NNCFTensor, axis: int) -> NNCFTensor:
@@ -107,6 +148,69 @@ class PTNNCFCollectorTensorProcessor(NNCFCollectorTensorProcessor):
         raise NotImplementedError()
 
 
+class PTReducerMixIn:
+    """
+    Torch reducers are applied out of place by the hooks of the model,
+    so neither inplace operations nor extra model outputs are required.
+    """
+
+    @staticmethod
+    def _get_processor() -> NNCFCollectorTensorProcessor:
+        return PTNNCFCollectorTensorProcessor()
+
+    def get_inplace_fn(self) -> Optional[InplaceInsertionFNType]:
+        return None
+
+    def get_output_names(self, target_node_name: str, port_id: int) -> List[str]:
+        return []
+
+
+class PTNoopReducer(PTReducerMixIn, NoopReducer):
+    pass
+
+
+class PTMinReducer(PTReducerMixIn, MinReducer):
+    pass
+
+
+class PTMaxReducer(PTReducerMixIn, MaxReducer):
+    pass
+
+
+class PTAbsMaxReducer(PTReducerMixIn, AbsMaxReducer):
+    pass
+
+
+class PTMeanReducer(PTReducerMixIn, MeanReducer):
+    pass
+
+
+class PTQuantileReducer(PTReducerMixIn, QuantileReducer):
+    pass
+
+
+class PTAbsQuantileReducer(PTReducerMixIn, AbsQuantileReducer):
+    pass
+
+
+def get_tensor_collector_hook(collector: TensorCollector) -> Callable[[torch.Tensor], torch.Tensor]:
+    """
+    Creates the hook that registers the tensors passed through it in the given tensor collector.
+    All the reducers of the torch tensor collector receive the same hooked tensor.
+
+    :param collector: TensorCollector instance with torch reducers.
+    :return: The hook to insert into the model.
+    """
+
+    def hook(x: torch.Tensor) -> torch.Tensor:
+        with no_nncf_trace():
+            inputs = [PTNNCFTensor(x.detach())]
+            collector.register_inputs({hash(reducer): inputs for reducer in collector.reducers})
+        return x
+
+    return hook
+
+
 class PTMinMaxStatisticCollector(MinMaxStatisticCollector):
     def __init__(
         self, use_abs_max: bool, reduction_shape: ReductionShape, output_shape: ReductionShape, num_samples: int = None
@@ -192,10 +296,81 @@ class PTMeanMinMaxStatisticCollector(MeanMinMaxStatisticCollector):
         return PTMinMaxTensorStatistic(min_values, max_values)
 
 
+def _quantile(x: torch.Tensor, quantile: float, axis: Union[int, tuple, list], keepdims: bool = False) -> torch.Tensor:
+    if x.numel() == 0:
+        # Keeps the NumPy behavior for the empty input
+        return torch.tensor(float("nan"), device=x.device)
+    return PTNNCFCollectorTensorProcessor.quantile(PTNNCFTensor(x), [quantile], axis, keepdims=keepdims)[0].tensor
+
+
+def percentile_reduce_like(input_: torch.Tensor, ref_tensor_shape: Tuple[int], pct: float) -> torch.Tensor:
+    """
+    Torch counterpart of `np_percentile_reduce_like`: reduces the input to the shape of the reference tensor
+    by taking the percentile along each dimension of the reference tensor of size 1 one after another.
+
+    :param input_: Tensor to reduce.
+    :param ref_tensor_shape: Shape of the reference tensor.
+    :param pct: Percentile to compute, which must be between 0 and 100 inclusive.
+    :return: Reduced tensor.
+    """
+    if np.prod(ref_tensor_shape) == 1:
+        return _quantile(input_, pct / 100, tuple(range(input_.dim()))).view(1)
+    tmp = input_
+    for dim_idx, dim in enumerate(ref_tensor_shape):
+        if dim == 1:
+            tmp = _quantile(tmp, pct / 100, dim_idx, keepdims=True)
+    return tmp
+
+
 class PTMedianMADStatisticCollector(MedianMADStatisticCollector):
     def _register_input(self, x: torch.Tensor):
         with no_nncf_trace():
-            self._samples.append(x.detach().cpu().numpy())
+            # The whole history of the inputs is kept in the host memory to not exhaust the device memory
+            self._samples.append(x.detach().to(device="cpu", copy=True))
+
+    def _get_statistics(self) -> PTMedianMADTensorStatistic:
+        per_channel_history = get_per_channel_history(self._samples, list(self._reduction_shape))
+        per_channel_median = []
+        per_channel_mad = []
+        for channel_history in per_channel_history:
+            # For post-RELU quantizers exact zeros may prevail and lead to zero mean and MAD - discard them
+            channel_history = channel_history[channel_history != 0]
+            median = _quantile(channel_history, 0.5, 0)
+            per_channel_median.append(median)
+            per_channel_mad.append(_quantile(torch.abs(channel_history - median), 0.5, 0))
+        median_tensor = torch.stack(per_channel_median).to(dtype=torch.float)
+        mad_tensor = torch.stack(per_channel_mad).to(dtype=torch.float)
+
+        median_tensor = expand_like(median_tensor, list(self._reduction_shape))
+        mad_tensor = expand_like(mad_tensor, list(self._reduction_shape))
+
+        return PTMedianMADTensorStatistic(median_tensor, mad_tensor)
+
+
+class PTPercentileStatisticCollector(PercentileStatisticCollector):
+    def _register_input(self, x: torch.Tensor):
+        with no_nncf_trace():
+            # The whole history of the inputs is kept in the host memory to not exhaust the device memory
+            self._samples.append(x.detach().to(device="cpu", copy=True))
+
+    def _get_statistics(self) -> PTPercentileTensorStatistic:
+        per_channel_history = get_per_channel_history(self._samples, list(self._reduction_shape))
+        quantiles = [pc / 100 for pc in self._percentiles_to_collect]
+        per_channel_percentiles = PTNNCFCollectorTensorProcessor.quantile(
+            PTNNCFTensor(per_channel_history), quantiles, axis=1
+        )
+        percentile_vs_values_dict = {}
+        for pc, val in zip(self._percentiles_to_collect, per_channel_percentiles):
+            torch_percentiles = val.tensor.to(dtype=torch.float)
+            percentile_vs_values_dict[pc] = expand_like(torch_percentiles, list(self._reduction_shape))
+        return PTPercentileTensorStatistic(percentile_vs_values_dict)
+
+
+class PTHistogramMedianMADStatisticCollector(HistogramMedianMADStatisticCollector):
+    def _register_input(self, x: torch.Tensor):
+        with no_nncf_trace():
+            per_channel_values = get_per_channel_history([x.detach()], list(self._reduction_shape))
+            self._register_input_common(per_channel_values.cpu().numpy())
 
     def _get_statistics(self) -> PTMedianMADTensorStatistic:
         numpy_median, numpy_mad = self._prepare_statistics()
@@ -208,10 +383,11 @@ class PTMedianMADStatisticCollector(MedianMADStatisticCollector):
         return PTMedianMADTensorStatistic(median_tensor, mad_tensor)
 
 
-class PTPercentileStatisticCollector(PercentileStatisticCollector):
+class PTHistogramPercentileStatisticCollector(HistogramPercentileStatisticCollector):
     def _register_input(self, x: torch.Tensor):
         with no_nncf_trace():
-            self._samples.append(x.detach().cpu().numpy())
+            per_channel_values = get_per_channel_history([x.detach()], list(self._reduction_shape))
+            self._register_input_common(per_channel_values.cpu().numpy())
 
     def _get_statistics(self) -> PTPercentileTensorStatistic:
         percentile_vs_values_dict = self._prepare_statistics()
@@ -225,9 +401,8 @@ class PTMeanPercentileStatisticCollector(MeanPercentileStatisticCollector):
     def _register_input(self, x: torch.Tensor):
         with no_nncf_trace():
             for pct, val in self._all_pct_values.items():
-                np_vals = np_percentile_reduce_like(x.cpu().numpy(), self._reduction_shape, pct)
-                torch_vals = torch.from_numpy(np_vals).to(dtype=torch.float)
-                val.append(torch_vals)
+                torch_vals = percentile_reduce_like(x.detach(), self._reduction_shape, pct)
+                val.append(torch_vals.to(dtype=torch.float))
 
     def _get_statistics(self) -> PTPercentileTensorStatistic:
         mean_percentile_values = {}
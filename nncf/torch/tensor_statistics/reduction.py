@@ -9,7 +9,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import numpy as np
 import torch
@@ -63,3 +63,18 @@ def expand_like(input_: torch.Tensor, scale_shape: List[int]) -> torch.Tensor:
     for _ in range(idx + 1, len(scale_shape)):
         retval = retval.unsqueeze(-1)
     return retval
+
+
+def get_per_channel_history(raw_input_history: Iterable[torch.Tensor], scale_shape: List[int]) -> torch.Tensor:
+    """
+    Gathers the values of each channel from the collected tensors.
+
+    :param raw_input_history: Collected tensors.
+    :param scale_shape: Shape of the statistics that defines the channel dimension.
+    :return: Tensor of [channel_count, N] shape that holds the flattened values of each channel in its row.
+    """
+    channel_count, channel_dim_idx = get_channel_count_and_dim_idx(scale_shape)
+    per_channel_entries = [
+        torch.movedim(entry, channel_dim_idx, 0).reshape(channel_count, -1) for entry in raw_input_history
+    ]
+    return torch.cat(per_channel_entries, dim=1)
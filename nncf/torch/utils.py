@@ -9,6 +9,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import random
+import sys
 from collections import OrderedDict
 from contextlib import contextmanager
 from typing import Any, Dict, List
@@ -117,6 +118,18 @@ def is_tracing_state():
     return torch._C._get_tracing_state() is not None
 
 
+def is_torch_compiling() -> bool:
+    """
+    :return: True if the code is being captured into a graph by `torch.compile`, False otherwise.
+    """
+    compiler = getattr(torch, "compiler", None)
+    if compiler is not None and hasattr(compiler, "is_compiling"):
+        return compiler.is_compiling()
+    # torch._dynamo is imported by torch.compile, there is no need to import it here otherwise
+    dynamo = sys.modules.get("torch._dynamo")
+    return dynamo is not None and dynamo.is_compiling()
+
+
 class no_jit_trace:
     def __enter__(self):
         # pylint: disable=protected-access
@@ -0,0 +1,67 @@
+# Copyright (c) 2023 Intel Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+import pytest
+
+from nncf.common.pruning.weights_flops_calculator import UniformPruningFlopsTable
+
+FULL_FLOPS = 10000
+
+
+class UniformlyPrunedModelStub:
+    def __init__(self, filters_num: int = 48):
+        self.filters_num = filters_num
+        self.num_calls = 0
+
+    def count_flops_and_weights(self, pruning_level: float):
+        self.num_calls += 1
+        remaining_filters = self.filters_num - int(pruning_level * self.filters_num)
+        flops = FULL_FLOPS * remaining_filters**2 // self.filters_num**2
+        return flops, flops // 10
+
+
+def bisection_search(count_flops_and_weights_fn, target_flops, error=0.01):
+    left, right = 0.0, 1.0
+    while abs(right - left) > error:
+        middle = (left + right) / 2
+        flops, _ = count_flops_and_weights_fn(middle)
+        if flops < target_flops:
+            right = middle
+        else:
+            left = middle
+    flops, params_num = count_flops_and_weights_fn(right)
+    if flops <= target_flops:
+        return right, flops, params_num
+    return None
+
+
+@pytest.mark.parametrize("error", [0.01, 0.05, 0.125])
+@pytest.mark.parametrize("target_flops_pruning_level", [0.0, 0.1, 0.3, 0.5, 0.75, 0.9, 0.999, 1.0])
+def test_uniform_pruning_flops_table_matches_bisection(target_flops_pruning_level, error):
+    model = UniformlyPrunedModelStub()
+    table = UniformPruningFlopsTable(model.count_flops_and_weights, error)
+    target_flops = FULL_FLOPS * (1 - target_flops_pruning_level)
+
+    ref_result = bisection_search(model.count_flops_and_weights, target_flops, error)
+    assert table.find_pruning_level(target_flops) == ref_result
+
+
+def test_uniform_pruning_flops_table_reuses_counted_levels():
+    model = UniformlyPrunedModelStub()
+    table = UniformPruningFlopsTable(model.count_flops_and_weights)
+
+    table.find_pruning_level(FULL_FLOPS * 0.5)
+    num_calls = model.num_calls
+    assert num_calls <= math.ceil(math.log2(1 / 0.01)) + 1
+    table.find_pruning_level(FULL_FLOPS * 0.5)
+    assert model.num_calls == num_calls
@@ -851,7 +851,7 @@ class TemplateTestStatisticsAggregator:
         target_point_args = (TargetType.POST_LAYER_OPERATION, "split", 0)
         for params_ in product_dict(**params):
             reducer = self.reducers_map()[statistics_type](**params_)
-            aggregator = NoopAggregator(1)
+            aggregator = NoopAggregator(reducer._tensor_processor, 1)  # pylint: disable=protected-access
             tensor_collector.register_statistic_branch(str(params_), reducer, aggregator)
             target_point = target_point_cls(*target_point_args)
             stat_point = StatisticPoint(target_point, tensor_collector, "TEST")
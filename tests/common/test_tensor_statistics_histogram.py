@@ -0,0 +1,100 @@
+# Copyright (c) 2023 Intel Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from nncf.common.tensor_statistics.histogram import PerChannelHistogram
+
+NUM_BINS = 1024
+
+
+def get_drifting_samples(num_samples: int, num_channels: int):
+    rng = np.random.default_rng(0)
+    scales = np.arange(1, num_channels + 1)[:, None]
+    return [rng.normal(size=(num_channels, 500)) * scales * (i + 1) + i for i in range(num_samples)]
+
+
+@pytest.mark.parametrize("q", [0.0, 0.001, 0.5, 0.999, 1.0])
+def test_quantile(q):
+    samples = get_drifting_samples(10, 4)
+    histogram = PerChannelHistogram(4, NUM_BINS)
+    for sample in samples:
+        histogram.update(sample)
+
+    all_values = np.concatenate(samples, axis=1)
+    ref_quantile = np.quantile(all_values, q, axis=1)
+    max_bin_width = np.ptp(all_values, axis=1) / NUM_BINS * 2
+    assert np.all(np.abs(histogram.quantile(q) - ref_quantile) <= max_bin_width)
+
+
+def test_median_absolute_deviation():
+    samples = get_drifting_samples(10, 4)
+    histogram = PerChannelHistogram(4, NUM_BINS)
+    for sample in samples:
+        histogram.update(sample)
+
+    all_values = np.concatenate(samples, axis=1)
+    ref_median = np.median(all_values, axis=1)
+    ref_mad = np.median(np.abs(all_values - ref_median[:, None]), axis=1)
+    max_bin_width = np.ptp(all_values, axis=1) / NUM_BINS * 2
+    assert np.all(np.abs(histogram.median_absolute_deviation(ref_median) - ref_mad) <= 2 * max_bin_width)
+
+
+def test_masked_values_are_not_registered():
+    histogram = PerChannelHistogram(2, NUM_BINS)
+    values = np.array([[0.0, 1.0, 2.0, 3.0], [0.0, 0.0, 0.0, 0.0]])
+    histogram.update(values, mask=values != 0)
+    values = np.array([[0.0, 0.0, 0.0, 100.0], [0.0, -1.0, 0.0, 1.0]])
+    histogram.update(values, mask=np.array([[False, False, False, False], [False, True, False, True]]))
+
+    quantiles = histogram.quantile(0.0), histogram.quantile(1.0)
+    assert np.allclose(quantiles[0], [1.0, -1.0], atol=1e-2)
+    assert np.allclose(quantiles[1], [3.0, 1.0], atol=1e-2)
+
+
+def test_quantile_of_empty_channel_is_nan():
+    histogram = PerChannelHistogram(2, NUM_BINS)
+    histogram.update(np.ones((2, 3)), mask=np.array([[True] * 3, [False] * 3]))
+    median = histogram.quantile(0.5)
+    assert median[0] == pytest.approx(1.0)
+    assert np.isnan(median[1])
+
+
+def test_merge():
+    samples = get_drifting_samples(10, 4)
+    histograms = [PerChannelHistogram(4, NUM_BINS) for _ in range(3)]
+    for idx, sample in enumerate(samples):
+        histograms[idx % 2].update(sample)
+    histograms[0].merge(histograms[1])
+    # The empty histogram takes the counts of the merged histogram as is
+    histograms[2].merge(histograms[0])
+
+    all_values = np.concatenate(samples, axis=1)
+    ref_median = np.median(all_values, axis=1)
+    max_bin_width = np.ptp(all_values, axis=1) / NUM_BINS * 2
+    for histogram in histograms[::2]:
+        assert np.all(np.abs(histogram.quantile(0.5) - ref_median) <= 2 * max_bin_width)
+    assert np.array_equal(histograms[0].quantile(0.5), histograms[2].quantile(0.5))
+
+
+def test_merge_different_number_of_channels():
+    with pytest.raises(ValueError):
+        PerChannelHistogram(2, NUM_BINS).merge(PerChannelHistogram(3, NUM_BINS))
+
+
+def test_state():
+    histogram = PerChannelHistogram(4, NUM_BINS)
+    for sample in get_drifting_samples(3, 4):
+        histogram.update(sample)
+    loaded_histogram = PerChannelHistogram(1, 8)
+    loaded_histogram.load_state(histogram.get_state())
+    assert np.array_equal(loaded_histogram.quantile(0.5), histogram.quantile(0.5))
@@ -10,11 +10,13 @@
 # limitations under the License.
 
 from abc import abstractmethod
+from functools import partial
 from itertools import product
 
 import numpy as np
 import pytest
 
+from nncf.experimental.common.tensor_statistics.collectors import HistogramMedianAggregator
 from nncf.experimental.common.tensor_statistics.collectors import MaxAggregator
 from nncf.experimental.common.tensor_statistics.collectors import MeanAggregator
 from nncf.experimental.common.tensor_statistics.collectors import MeanNoOutliersAggregator
@@ -120,8 +122,8 @@ class TemplateTestReducersAggreagtors:
         assert len(val) == 1
         assert self.all_close(val[0].tensor, ref)
 
-    def test_noop_aggregator(self):
-        aggregator = NoopAggregator(None)
+    def test_noop_aggregator(self, tensor_processor):
+        aggregator = NoopAggregator(tensor_processor, None)
 
         ref_shape = (1, 3, 5, 7, 9)
         input_ = np.arange(np.prod(ref_shape)).reshape(ref_shape)
@@ -225,6 +227,111 @@ class TemplateTestReducersAggreagtors:
         ret_val = aggregator.aggregate()
         assert self.all_close(ret_val, refs)
 
+    @pytest.mark.parametrize(
+        "aggregator_cls",
+        [
+            MinAggregator,
+            MaxAggregator,
+            MeanAggregator,
+            MedianAggregator,
+            partial(MeanNoOutliersAggregator, quantile=default_test_quantile),
+        ],
+    )
+    @pytest.mark.parametrize("num_samples", [None, 4])
+    def test_merge_aggregators(self, aggregator_cls, num_samples, tensor_processor):
+        inputs = [np.arange(9).reshape((3, 3)) * i for i in range(-3, 4)]
+        ref_aggregator = aggregator_cls(tensor_processor, num_samples=num_samples)
+        for input_ in inputs:
+            ref_aggregator.register_reduced_input(self.get_nncf_tensor(input_))
+
+        aggregators = [aggregator_cls(tensor_processor, num_samples=num_samples) for _ in range(3)]
+        for input_, aggregator in zip(inputs[: num_samples or len(inputs)], [0, 1, 1, 2, 2, 2, 2]):
+            aggregators[aggregator].register_reduced_input(self.get_nncf_tensor(input_))
+        for aggregator in aggregators[1:]:
+            aggregators[0].merge(aggregator)
+
+        # pylint: disable=protected-access
+        assert aggregators[0]._collected_samples == ref_aggregator._collected_samples
+        assert self.all_close(aggregators[0].aggregate(), ref_aggregator.aggregate())
+
+    def test_merge_different_aggregators(self, tensor_processor):
+        with pytest.raises(RuntimeError):
+            MinAggregator(tensor_processor).merge(MaxAggregator(tensor_processor))
+
+    @pytest.mark.parametrize(
+        "aggregator_cls",
+        [
+            MinAggregator,
+            MaxAggregator,
+            MeanAggregator,
+            partial(MeanAggregator, window_size=3),
+            MedianAggregator,
+            partial(MeanNoOutliersAggregator, quantile=default_test_quantile),
+            HistogramMedianAggregator,
+        ],
+    )
+    @pytest.mark.parametrize("use_per_sample_stats", [False, True])
+    def test_aggregator_state(self, aggregator_cls, use_per_sample_stats, tensor_processor):
+        aggregator = aggregator_cls(tensor_processor, use_per_sample_stats)
+        for i in range(-3, 4):
+            aggregator.register_reduced_input(self.get_nncf_tensor(np.arange(6.0).reshape((2, 3)) * i))
+
+        loaded_aggregator = aggregator_cls(tensor_processor, use_per_sample_stats)
+        loaded_aggregator.load_state(aggregator.get_state())
+        # pylint: disable=protected-access
+        assert loaded_aggregator._collected_samples == aggregator._collected_samples
+        assert self.all_close(loaded_aggregator.aggregate(), aggregator.aggregate())
+
+        deserialized_aggregator = aggregator_cls(tensor_processor, use_per_sample_stats)
+        deserialized_aggregator.deserialize(aggregator.serialize())
+        assert deserialized_aggregator._collected_samples == aggregator._collected_samples
+        assert self.all_close(deserialized_aggregator.aggregate(), aggregator.aggregate())
+
+        empty_aggregator = aggregator_cls(tensor_processor, use_per_sample_stats)
+        aggregator.deserialize(empty_aggregator.serialize())
+        assert aggregator._collected_samples == 0
+
+    def test_noop_shape_aggregators_state(self, tensor_processor):
+        input_ = np.arange(6).reshape((1, 2, 3))
+        for aggregator_cls in [partial(NoopAggregator, tensor_processor, None), ShapeAggregator]:
+            aggregator = aggregator_cls()
+            for _ in range(3):
+                aggregator.register_reduced_input(self.get_nncf_tensor(input_))
+            loaded_aggregator = aggregator_cls()
+            loaded_aggregator.deserialize(aggregator.serialize())
+            # pylint: disable=protected-access
+            assert loaded_aggregator._collected_samples == aggregator._collected_samples
+            if isinstance(aggregator, ShapeAggregator):
+                assert loaded_aggregator.aggregate() == input_.shape
+            else:
+                for val in loaded_aggregator.aggregate():
+                    assert self.all_close(val, input_)
+
+    @pytest.mark.parametrize("use_per_sample_stats", [False, True])
+    def test_histogram_median_aggregator(self, use_per_sample_stats, tensor_processor):
+        rng = np.random.default_rng(0)
+        # The odd number of the registered values to have the same median for all backends
+        inputs = [rng.normal(size=(3, 3, 3)).astype(np.float32) for _ in range(21)]
+        median_aggregator = MedianAggregator(tensor_processor, use_per_sample_stats)
+        histogram_aggregators = [HistogramMedianAggregator(tensor_processor, use_per_sample_stats) for _ in range(2)]
+        for idx, input_ in enumerate(inputs):
+            median_aggregator.register_reduced_input(self.get_nncf_tensor(input_))
+            histogram_aggregators[idx % 2].register_reduced_input(self.get_nncf_tensor(input_))
+        histogram_aggregators[0].merge(histogram_aggregators[1])
+
+        ref = self._to_numpy(median_aggregator.aggregate())
+        val = self._to_numpy(histogram_aggregators[0].aggregate())
+        assert val.shape == ref.shape
+        # The error of the median estimation is of the order of the histogram bin width
+        bin_width = (np.max(inputs) - np.min(inputs)) / 100
+        assert np.all(np.abs(val - ref) <= bin_width)
+
+    @staticmethod
+    def _to_numpy(x) -> np.ndarray:
+        if hasattr(x, "detach"):
+            x = x.detach().cpu()
+        return np.asarray(x)
+
     @pytest.mark.parametrize(
         "reducer_name",
         ["noop", "min", "max", "abs_max", "mean", "quantile", "abs_quantile", "batch_mean", "mean_per_ch"],
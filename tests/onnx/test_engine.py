@@ -59,3 +59,36 @@ def test_output_insertion(target_layers, target_layers_output):
 
     input_data = {"X": np.ones([1, 3, 32, 32]).astype(np.float32)}
     check_engine_creation_and_inference(transformed_model, input_data, target_layers_output)
+
+
+def test_inference_with_io_binding():
+    model = NonShapeModel().onnx_model
+    engine = ONNXEngine(model)
+    io_binding_engine = ONNXEngine(model, use_io_binding=True)
+
+    for value in [1.0, 2.0]:
+        input_data = {"X": np.full([1, 3, 32, 32], value, dtype=np.float32)}
+        outputs = engine.infer(input_data)
+        io_binding_outputs = io_binding_engine.infer(input_data)
+        assert outputs.keys() == io_binding_outputs.keys()
+        for name, output in outputs.items():
+            assert np.array_equal(output, io_binding_outputs[name])
+
+    # pylint: disable=protected-access
+    if io_binding_engine._output_buffers is not None:
+        assert all(
+            output is buffer for output, buffer in zip(io_binding_outputs.values(), io_binding_engine._output_buffers)
+        )
+
+
+def test_inference_with_io_binding_converts_inputs():
+    model = NonShapeModel().onnx_model
+    engine = ONNXEngine(model)
+    io_binding_engine = ONNXEngine(model, use_io_binding=True)
+
+    input_data = {"X": [np.full([3, 32, 32], 1.0, dtype=np.float64)]}
+    outputs = engine.infer(input_data)
+    io_binding_outputs = io_binding_engine.infer(input_data)
+    assert outputs.keys() == io_binding_outputs.keys()
+    for name, output in outputs.items():
+        assert np.array_equal(output, io_binding_outputs[name])
@@ -9,6 +9,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 from typing import List, Type
 
 import numpy as np
@@ -16,6 +17,10 @@ import pytest
 
 from nncf import Dataset
 from nncf.common.graph.transformations.commands import TargetType
+from nncf.common.logging import nncf_logger
+from nncf.common.tensor_statistics.collectors import TensorStatisticCollectorBase
+from nncf.common.tensor_statistics.statistic_point import StatisticPoint
+from nncf.common.tensor_statistics.statistic_point import StatisticPointsContainer
 from nncf.experimental.common.tensor_statistics.collectors import TensorReducerBase
 from nncf.onnx.graph.transformations.commands import ONNXTargetPoint
 from nncf.onnx.statistics.aggregator import ONNXStatisticsAggregator
@@ -23,6 +28,7 @@ from nncf.quantization.algorithms.bias_correction.onnx_backend import ONNXBiasCo
 from nncf.quantization.algorithms.fast_bias_correction.onnx_backend import ONNXFastBiasCorrectionAlgoBackend
 from nncf.quantization.algorithms.min_max.onnx_backend import ONNXMinMaxAlgoBackend
 from tests.common.test_statistics_aggregator import TemplateTestStatisticsAggregator
+from tests.shared.logging import nncf_caplog  # pylint:disable=unused-import
 from tests.onnx.models import IdentityConvolutionalModel
 
 INPUT_NAME = "X"
@@ -109,3 +115,50 @@ class TestStatisticsAggregator(TemplateTestStatisticsAggregator):
     @pytest.mark.skip("Merging is not implemented yet")
     def test_statistic_merging(self, dataset_samples, inplace_statistics):
         pass
+
+
+class TestStatisticsAggregatorWithWorkers(TestStatisticsAggregator):
+    def get_statistics_aggregator(self, dataset):
+        return ONNXStatisticsAggregator(dataset, num_workers=2, num_threads_per_worker=1)
+
+
+class InputsStatisticCollector(TensorStatisticCollectorBase):
+    """
+    Keeps the registered inputs, its statistics could not be merged across the worker processes.
+    """
+
+    def __init__(self, num_samples: int):
+        super().__init__(None, num_samples)
+        self._inputs = []
+
+    def _register_input(self, x):
+        self._inputs.append(x.tensor.copy())
+
+    def _get_statistics(self):
+        return self._inputs
+
+    def _reset(self):
+        self._inputs = []
+
+
+def test_not_mergeable_collectors_are_collected_in_current_process(mocker, nncf_caplog):
+    model = IdentityConvolutionalModel(input_shape=[1] + INPUT_SHAPE, inp_ch=3, out_ch=3, kernel_size=3).onnx_model
+    samples = [np.full(INPUT_SHAPE, i, dtype=np.float32) for i in range(4)]
+    dataset = Dataset(samples, lambda data_item: {INPUT_NAME: [data_item]})
+    collector = InputsStatisticCollector(num_samples=len(samples))
+    statistic_points = StatisticPointsContainer()
+    target_point = ONNXTargetPoint(TargetType.POST_LAYER_OPERATION, IDENTITY_NODE_NAME, 0)
+    statistic_points.add_statistic_point(StatisticPoint(target_point, collector, "TestAlgo"))
+
+    statistics_aggregator = ONNXStatisticsAggregator(dataset, num_workers=2)
+    collect_in_workers_spy = mocker.spy(statistics_aggregator, "_collect_statistics_in_workers")
+    statistics_aggregator.register_statistic_points(statistic_points)
+    with nncf_caplog.at_level(logging.WARNING, logger=nncf_logger.name):
+        statistics_aggregator.collect_statistics(model)
+
+    assert "could not be merged across worker processes" in nncf_caplog.text
+    collect_in_workers_spy.assert_not_called()
+    statistics = collector.get_statistics()
+    assert len(statistics) == len(samples)
+    for value, sample in zip(statistics, samples):
+        assert np.array_equal(value.reshape(INPUT_SHAPE), sample)
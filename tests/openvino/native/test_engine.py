@@ -58,3 +58,22 @@ def test_infer_quantized_model_list():
     model = QuantizedModel().ov_model
     input_data = [np.random.rand(*inp.shape) for inp in model.get_parameters()]
     check_engine_creation_and_inference(model, input_data)
+
+
+def test_infer_with_shared_outputs():
+    model = ConvModel().ov_model
+    engine = OVNativeEngine(model)
+    shared_outputs_engine = OVNativeEngine(model, share_outputs=True)
+    input_data = [np.random.rand(*inp.shape) for inp in model.get_parameters()]
+
+    outputs = engine.infer(input_data)
+    shared_outputs = shared_outputs_engine.infer(input_data)
+    assert outputs.keys() == shared_outputs.keys()
+    for name, output in outputs.items():
+        assert np.allclose(output, shared_outputs[name])
+
+    # The copied outputs are not overwritten by the next inference
+    copied_outputs = {name: output.copy() for name, output in outputs.items()}
+    engine.infer([np.random.rand(*inp.shape) for inp in model.get_parameters()])
+    for name, output in outputs.items():
+        assert np.array_equal(output, copied_outputs[name])
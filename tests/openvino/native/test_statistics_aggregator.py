@@ -19,12 +19,20 @@ from openvino.runtime import opset9 as opset
 from nncf import Dataset
 from nncf.common.graph.transformations.commands import TargetPoint
 from nncf.common.graph.transformations.commands import TargetType
+from nncf.common.tensor_statistics.statistic_point import StatisticPoint
+from nncf.common.tensor_statistics.statistic_point import StatisticPointsContainer
+from nncf.experimental.common.tensor_statistics.collectors import MinAggregator
+from nncf.experimental.common.tensor_statistics.collectors import NoopAggregator
+from nncf.experimental.common.tensor_statistics.collectors import TensorCollector
 from nncf.experimental.common.tensor_statistics.collectors import TensorReducerBase
 from nncf.openvino.graph.transformations.commands import OVTargetPoint
 from nncf.openvino.statistics.aggregator import OVStatisticsAggregator
 from nncf.openvino.statistics.collectors import OV_REDUCERS_MAP
 from nncf.openvino.statistics.collectors import OVBatchMeanReducer
 from nncf.openvino.statistics.collectors import OVMeanPerChanelReducer
+from nncf.openvino.statistics.collectors import OVMinReducer
+from nncf.openvino.statistics.collectors import OVNNCFCollectorTensorProcessor
+from nncf.openvino.statistics.collectors import OVNoopReducer
 from nncf.quantization.algorithms.bias_correction.openvino_backend import OVBiasCorrectionAlgoBackend
 from nncf.quantization.algorithms.fast_bias_correction.openvino_backend import OVFastBiasCorrectionAlgoBackend
 from nncf.quantization.algorithms.min_max.openvino_backend import OVMinMaxAlgoBackend
@@ -126,3 +134,38 @@ class TestStatisticsAggregator(TemplateTestStatisticsAggregator):
         map_ = OV_REDUCERS_MAP.copy()
         map_.update({"batch_mean": OVBatchMeanReducer, "mean_per_ch": OVMeanPerChanelReducer})
         return map_
+
+
+@pytest.mark.parametrize(
+    "reducer_type, inplace, ref_can_reuse_outputs",
+    [("min", False, True), ("min", True, False), ("noop", False, False)],
+    ids=["out_of_place_min", "inplace_min", "noop"],
+)
+def test_outputs_are_shared_when_collectors_reduce_them(reducer_type, inplace, ref_can_reuse_outputs):
+    model = get_StatisticAgregatorTestModel(INPUT_SHAPE, np.ones([3, 3, 1, 1]))
+    samples = [np.full(INPUT_SHAPE, i, dtype=np.float32) for i in reversed(range(4))]
+    dataset = Dataset(samples, lambda data: {INPUT_NAME: data})
+    collector = TensorCollector()
+    if reducer_type == "min":
+        reducer = OVMinReducer(reduction_shape=(0, 2, 3), inplace=inplace)
+        aggregator = MinAggregator(OVNNCFCollectorTensorProcessor, num_samples=len(samples))
+    else:
+        reducer = OVNoopReducer()
+        aggregator = NoopAggregator(OVNNCFCollectorTensorProcessor, num_samples=len(samples))
+    collector.register_statistic_branch("values", reducer, aggregator)
+    statistic_points = StatisticPointsContainer()
+    target_point = OVTargetPoint(TargetType.POST_LAYER_OPERATION, INPUT_NAME, 0)
+    statistic_points.add_statistic_point(StatisticPoint(target_point, collector, "TestAlgo"))
+
+    statistics_aggregator = OVStatisticsAggregator(dataset)
+    statistics_aggregator.register_statistic_points(statistic_points)
+    assert statistics_aggregator._can_reuse_outputs() == ref_can_reuse_outputs
+    statistics_aggregator.collect_statistics(model)
+
+    values = collector.get_statistics()["values"]
+    if reducer_type == "min":
+        assert np.array_equal(values.reshape(-1), np.zeros(INPUT_SHAPE[1]))
+    else:
+        assert len(values) == len(samples)
+        for value, sample in zip(values, samples):
+            assert np.array_equal(value, sample)
@@ -201,6 +201,20 @@ def test_evaluate_strategy(strategy, skip_bool, mocker):
             assert info_set["model_ratio"] == evaluated_strategy[-1] / qenv.model_size_calculator.FLOAT_BITWIDTH
 
 
+def test_evaluated_policies_are_not_evaluated_again(mocker):
+    qenv = create_test_quantization_env()
+    pipeline_spy = mocker.spy(qenv, "_run_quantization_pipeline")
+
+    _, reward, _, info_set = qenv.evaluate_strategy([8, 4], skip_constraint=True)
+    _, cached_reward, _, cached_info_set = qenv.evaluate_strategy([8, 4], skip_constraint=True)
+    assert pipeline_spy.call_count == 1
+    assert cached_reward == reward
+    assert cached_info_set == info_set
+
+    qenv.evaluate_strategy([8, 8], skip_constraint=True)
+    assert pipeline_spy.call_count == 2
+
+
 def check_bw_cfg(qenv, input_strategy, output_ref):
     if len(input_strategy) != len(qenv.qctrl.all_quantizations):
         with pytest.raises(AssertionError):
@@ -9,14 +9,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from itertools import product
 from typing import Any, Dict, List, NamedTuple
 
 import pytest
+import torch
 
 from nncf import NNCFConfig
 from nncf.config.structures import BNAdaptationInitArgs
 from nncf.experimental.torch.nas.bootstrapNAS import SearchAlgorithm
 from nncf.experimental.torch.nas.bootstrapNAS.elasticity.elasticity_dim import ElasticityDim
+from nncf.experimental.torch.nas.bootstrapNAS.search.parallel_evaluator import ParallelAccuracyEvaluator
 from nncf.experimental.torch.nas.bootstrapNAS.search.search import DataLoaderType
 from tests.torch.helpers import create_ones_mock_dataloader
 from tests.torch.helpers import get_empty_config
@@ -24,6 +27,7 @@ from tests.torch.nas.creators import NAS_MODEL_DESCS
 from tests.torch.nas.creators import create_bnas_model_and_ctrl_by_test_desc
 from tests.torch.nas.creators import create_bootstrap_training_model_and_ctrl
 from tests.torch.nas.models.synthetic import ThreeConvModel
+from tests.torch.nas.models.synthetic import TwoSequentialConvBNTestModel
 from tests.torch.nas.test_all_elasticity import fixture_nas_model_name  # pylint: disable=unused-import
 
 
@@ -61,7 +65,9 @@ def prepare_test_model(search_desc):
         },
     }
     nncf_config = NNCFConfig.from_dict(config)
-    bn_adapt_args = BNAdaptationInitArgs(data_loader=create_ones_mock_dataloader(nncf_config))
+    # Batch-norm layers need more than one value per channel to be adapted
+    data_loader = create_ones_mock_dataloader(nncf_config, num_samples=2, batch_size=2)
+    bn_adapt_args = BNAdaptationInitArgs(data_loader=data_loader)
     nncf_config.register_extra_structs([bn_adapt_args])
     return model, elasticity_ctrl, nncf_config
 
@@ -185,6 +191,98 @@ class TestSearchAlgorithm:
         else:
             bn_adapt_run_patch.assert_not_called()
 
+    @pytest.mark.parametrize(
+        "model_creator, bn_adapt_section_is_called, workers_numbers",
+        [(ThreeConvModel, False, [1, 3]), (TwoSequentialConvBNTestModel, True, [2, 3])],
+        ids=["without_bn_adapt", "with_bn_adapt"],
+    )
+    def test_parallel_evaluation_matches_sequential_evaluation(
+        self, mocker, tmp_path, model_creator, bn_adapt_section_is_called, workers_numbers
+    ):
+        search_desc = SearchTestDesc(
+            model_creator=model_creator,
+            algo_params={"width": {"min_width": 1, "width_step": 1}},
+            input_sizes=model_creator.INPUT_SIZE,
+        )
+
+        def validate_fn(model, unused_loader):
+            model.eval()
+            with torch.no_grad():
+                return model(torch.ones(model_creator.INPUT_SIZE)).sum().item()
+
+        evaluate_subnet_spy = mocker.spy(ParallelAccuracyEvaluator, "_evaluate_subnet")
+        search_results = []
+        for num_workers in workers_numbers:
+            nncf_network, ctrl, nncf_config = prepare_test_model(search_desc)
+            update_search_bn_adapt_section(nncf_config, bn_adapt_section_is_called)
+            nncf_config["bootstrapNAS"]["search"].update({"num_evals": 8, "population": 4, "num_workers": num_workers})
+            ctrl.multi_elasticity_handler.enable_all()
+            search_algo = SearchAlgorithm(nncf_network, ctrl, nncf_config)
+            _, best_config, performance_metrics = search_algo.run(validate_fn, None, tmp_path)
+            search_results.append((search_algo.search_records, best_config, performance_metrics))
+            assert search_algo.parallel_accuracy_evaluator is None
+
+        assert evaluate_subnet_spy.call_count > 0
+        assert search_results[0] == search_results[1]
+
+    def test_bn_statistics_are_not_restored_by_sequential_evaluation(self, mocker, tmp_path):
+        search_desc = SearchTestDesc(
+            model_creator=TwoSequentialConvBNTestModel,
+            algo_params={"width": {"min_width": 1, "width_step": 1}},
+            input_sizes=TwoSequentialConvBNTestModel.INPUT_SIZE,
+        )
+        nncf_network, ctrl, nncf_config = prepare_test_model(search_desc)
+        update_search_bn_adapt_section(nncf_config, bn_adapt_section_is_called=True)
+        nncf_config["bootstrapNAS"]["search"].update({"num_evals": 8, "population": 4})
+        ctrl.multi_elasticity_handler.enable_all()
+        search_algo = SearchAlgorithm(nncf_network, ctrl, nncf_config)
+        get_bn_statistics_patch = mocker.patch(
+            "nncf.experimental.torch.nas.bootstrapNAS.search.search.get_batchnorm_statistics"
+        )
+        set_bn_statistics_patch = mocker.patch(
+            "nncf.experimental.torch.nas.bootstrapNAS.search.search.set_batchnorm_statistics"
+        )
+        bn_adapt_run_spy = mocker.spy(search_algo.bn_adaptation, "run")
+
+        search_algo.run(lambda model, val_loader: 0, None, tmp_path)
+
+        assert bn_adapt_run_spy.call_count > 0
+        get_bn_statistics_patch.assert_not_called()
+        set_bn_statistics_patch.assert_not_called()
+
+    @pytest.mark.parametrize("model_creator", [ThreeConvModel, TwoSequentialConvBNTestModel])
+    def test_efficiency_lookup_table(self, mocker, tmp_path, model_creator):
+        search_desc = SearchTestDesc(
+            model_creator=model_creator,
+            algo_params={"width": {"min_width": 1, "width_step": 1}},
+            input_sizes=model_creator.INPUT_SIZE,
+        )
+        nncf_network, ctrl, nncf_config = prepare_test_model(search_desc)
+        update_search_bn_adapt_section(nncf_config, bn_adapt_section_is_called=False)
+        nncf_config["bootstrapNAS"]["search"].update({"num_evals": 8, "population": 4, "efficiency_lookup_table": True})
+        handler = ctrl.multi_elasticity_handler
+        handler.enable_all()
+        search_algo = SearchAlgorithm(nncf_network, ctrl, nncf_config)
+        count_flops_spy = mocker.spy(handler, "count_flops_and_weights_for_active_subnet")
+        search_algo.run(lambda model, val_loader: 0, None, tmp_path)
+
+        lookup_table = search_algo.efficiency_lookup_table
+        vars_upper = search_algo.vars_upper
+        num_measurements = count_flops_spy.call_count
+        num_pair_measurements = sum(vars_upper[i] * vars_upper[j] for i, j in lookup_table.pairs)
+        assert num_measurements == sum(vars_upper) + num_pair_measurements + 2
+        assert lookup_table.reference_value == search_algo.efficiency_evaluator_handler.input_model_value
+
+        # MACs of the sub-networks with several changed design variables, e.g. the widths of adjacent layers,
+        # are captured by the interactions of the pairs of the design variables
+        all_x = [list(x) for x in product(*[range(upper + 1) for upper in vars_upper])]
+        ref_macs = []
+        for x in all_x:
+            handler.activate_subnet_for_config(handler.get_config_from_pymoo(x))
+            flops, _ = handler.count_flops_and_weights_for_active_subnet()
+            ref_macs.append(flops / 2000000)
+        assert list(lookup_table.evaluate(all_x)) == pytest.approx(ref_macs)
+
 
 class TestSearchEvaluators:
     def test_create_default_evaluators(self, nas_model_name, tmp_path):
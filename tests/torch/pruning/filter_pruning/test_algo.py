@@ -18,6 +18,8 @@ import torch
 
 from nncf.common.pruning.schedulers import ExponentialPruningScheduler
 from nncf.common.pruning.shape_pruning_processor import ShapePruningProcessor
+from nncf.common.pruning.utils import get_prunable_layers_in_out_channels
+from nncf.common.pruning.weights_flops_calculator import IncrementalWeightsFlopsCounter
 from nncf.common.pruning.weights_flops_calculator import WeightsFlopsCalculator
 from nncf.torch.layers import NNCF_PRUNING_MODULES_DICT
 from nncf.torch.module_operations import UpdateWeightAndBias
@@ -777,6 +779,58 @@ def test_flops_calculator(model_module, all_weights, pruning_flops_target, ref_f
     assert (cur_flops, cur_params_num) == (ref_flops, ref_params_num)
 
 
+@pytest.mark.parametrize(
+    "model_module",
+    [
+        BigPruningTestModel,
+        PruningTestModelConcatBN,
+        PruningTestModelConcatWithLinear,
+        PruningTestModelBroadcastedLinearWithConcat,
+        PruningTestModelDiffChInPruningCluster,
+    ],
+)
+def test_incremental_flops_counter_matches_full_recount(model_module):
+    config = get_basic_pruning_config(input_sample_size=[1, 1, 8, 8])
+    config["compression"]["algorithm"] = "filter_pruning"
+    config["compression"]["params"]["prune_first_conv"] = True
+    config["compression"]["pruning_init"] = 0.0
+    _, pruning_algo = create_compressed_model_and_algo_for_test(model_module(), config)
+
+    # pylint:disable=protected-access
+    graph = pruning_algo._graph
+    in_channels, out_channels = get_prunable_layers_in_out_channels(graph)
+    flops_counter = IncrementalWeightsFlopsCounter(
+        pruning_algo._weights_flops_calc,
+        graph,
+        pruning_algo._output_shapes,
+        pruning_algo.pruned_module_groups_info,
+        pruning_algo._next_nodes,
+        in_channels,
+        out_channels,
+    )
+    quotas = pruning_algo.pruning_quotas.copy()
+    clusters = pruning_algo.pruned_module_groups_info.get_all_clusters()
+    for step in range(int(sum(quotas.values()))):
+        cluster = clusters[step % len(clusters)]
+        if quotas[cluster.id] == 0:
+            continue
+        quotas[cluster.id] -= 1
+        pruning_algo._shape_pruning_proc.prune_cluster_shapes(
+            cluster=cluster,
+            pruned_elems=1,
+            pruning_groups_next_nodes=pruning_algo._next_nodes,
+            input_channels=in_channels,
+            output_channels=out_channels,
+        )
+        ref_flops, ref_params_num = pruning_algo._weights_flops_calc.count_flops_and_weights(
+            graph=graph,
+            output_shapes=pruning_algo._output_shapes,
+            input_channels=in_channels,
+            output_channels=out_channels,
+        )
+        assert flops_counter.recount_group(cluster.id) == (ref_flops, ref_params_num)
+
+
 @pytest.mark.parametrize(
     "repeat_seq_of_shared_convs,ref_second_cluster", [(True, [4, 5, 6, 7, 8, 9]), (False, [4, 5, 6])]
 )
@@ -82,6 +82,6 @@ def mock_collect_statistics(mocker):
     min_, max_ = 0.0, 1.0
     min_, max_ = map(lambda x: torch.tensor(x), [min_, max_])
     _ = mocker.patch(
-        "nncf.common.tensor_statistics.collectors.TensorStatisticCollectorBase.get_statistics",
+        "nncf.experimental.common.tensor_statistics.collectors.TensorCollector.get_statistics",
         return_value=PTMinMaxTensorStatistic(min_, max_),
     )
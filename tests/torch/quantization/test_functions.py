@@ -17,9 +17,15 @@ from torch.autograd import Variable
 from torch.distributions.uniform import Uniform
 
 from nncf.common.quantization.structs import QuantizationMode
+from nncf.torch.quantization import quantize_functions
+from nncf.torch.quantization.extensions import QuantizedFunctionsCPU
+from nncf.torch.quantization.quantize_functions import QuantizationKernelsType
 from nncf.torch.quantization.quantize_functions import asymmetric_quantize
 from nncf.torch.quantization.quantize_functions import get_scale_zp_from_input_low_input_high
+from nncf.torch.quantization.quantize_functions import set_quantization_kernels_type
 from nncf.torch.quantization.quantize_functions import symmetric_quantize
+from nncf.torch.quantization.quantize_functions import torch_quantize
+from nncf.torch.quantization.quantize_functions import torch_tune_range
 from nncf.torch.quantization.reference import ReferenceBackendType
 from nncf.torch.quantization.reference import ReferenceQuantize
 from tests.torch.helpers import PTTensorListComparator
@@ -644,3 +650,121 @@ def test_get_scale_zp_from_input_low_input_high(
     )
     assert zero_point == ref_zero_point, f"{zero_point} != {ref_zero_point}"
     assert np.isclose(scale, ref_scale), f"{scale:.10f} != {ref_scale}"
+
+
+@pytest.mark.parametrize(
+    "input_size, scale_shape",
+    [
+        [[2, 96, 8, 8], [1]],
+        [[2, 96, 8, 8], [1, 96, 1, 1]],
+        [[96, 16, 3, 3], [96, 1, 1, 1]],
+        [[7, 13], [7, 1]],
+        [[5, 3, 4], [1, 1, 4]],
+    ],
+    ids=idfn,
+)
+@pytest.mark.parametrize("dtype", [torch.float, torch.double], ids=("fp32", "fp64"))
+@pytest.mark.parametrize("is_asymmetric", [False, True], ids=("symmetric", "asymmetric"))
+def test_fused_cpu_kernels_match_generic(input_size, scale_shape, dtype, is_asymmetric):
+    torch.manual_seed(42)
+    input_ = 2 * torch.randn(input_size, dtype=dtype)
+    grad_output = torch.randn(input_size, dtype=dtype)
+    input_low = -torch.rand(scale_shape, dtype=dtype) - 0.5
+    input_range = torch.rand(scale_shape, dtype=dtype) + 1.5
+    levels, level_low, level_high = 256, -128, 127
+
+    fused_output = QuantizedFunctionsCPU.get("Quantize_forward")(input_, input_low, input_range, levels)
+    generic_output = QuantizedFunctionsCPU.get("Quantize_forward_generic")(input_, input_low, input_range, levels)
+    assert torch.equal(fused_output, generic_output)
+
+    fused_grads = QuantizedFunctionsCPU.get("Quantize_backward")(
+        grad_output, input_, input_low, input_range, levels, level_low, level_high, is_asymmetric
+    )
+    generic_grads = QuantizedFunctionsCPU.get("Quantize_backward_generic")(
+        grad_output, input_, input_low, input_range, levels, level_low, level_high, is_asymmetric
+    )
+    assert torch.equal(fused_grads[0], generic_grads[0])
+    param_grad_ids = [1, 2] if is_asymmetric else [2]
+    for idx in param_grad_ids:
+        # The generic kernels may return parameter gradients that still need to be summed to the parameter shape
+        ref_grad = generic_grads[idx].sum_to_size(scale_shape)
+        assert fused_grads[idx].shape == ref_grad.shape
+        assert torch.allclose(fused_grads[idx], ref_grad, rtol=1e-4, atol=1e-4)
+
+
+@pytest.fixture(name="torch_kernels")
+def torch_kernels_fixture():
+    set_quantization_kernels_type(QuantizationKernelsType.TORCH)
+    yield
+    set_quantization_kernels_type(QuantizationKernelsType.EXTENSIONS)
+
+
+def quantize_with_grads(quantization_mode, input_, params, grad_output):
+    if quantization_mode == QuantizationMode.SYMMETRIC:
+        output = symmetric_quantize(input_, 256, -128, 127, *params, EPS)
+    else:
+        output = asymmetric_quantize(input_, 256, 0, 255, *params, EPS)
+    grads = torch.autograd.grad(output, [input_, *params], grad_output)
+    return output, grads
+
+
+def get_quantize_inputs(quantization_mode, input_size, scale_shape, dtype):
+    torch.manual_seed(42)
+    input_ = (2 * torch.randn(input_size, dtype=dtype)).requires_grad_()
+    grad_output = torch.randn(input_size, dtype=dtype)
+    if quantization_mode == QuantizationMode.SYMMETRIC:
+        params = [torch.rand(scale_shape, dtype=dtype) + 0.5]
+    else:
+        params = [-torch.rand(scale_shape, dtype=dtype) - 0.5, torch.rand(scale_shape, dtype=dtype) + 1.5]
+    return input_, [param.requires_grad_() for param in params], grad_output
+
+
+@pytest.mark.parametrize(
+    "input_size, scale_shape",
+    [
+        [[2, 16, 8, 8], [1]],
+        [[2, 16, 8, 8], [1, 16, 1, 1]],
+        [[7, 13], [7, 1]],
+    ],
+    ids=idfn,
+)
+@pytest.mark.parametrize("dtype", [torch.float, torch.double], ids=("fp32", "fp64"))
+def test_torch_kernels_match_extensions(quantization_mode, input_size, scale_shape, dtype):
+    input_, params, grad_output = get_quantize_inputs(quantization_mode, input_size, scale_shape, dtype)
+    ref_output, ref_grads = quantize_with_grads(quantization_mode, input_, params, grad_output)
+
+    set_quantization_kernels_type(QuantizationKernelsType.TORCH)
+    try:
+        output, grads = quantize_with_grads(quantization_mode, input_, params, grad_output)
+    finally:
+        set_quantization_kernels_type(QuantizationKernelsType.EXTENSIONS)
+
+    assert torch.equal(output, ref_output)
+    assert torch.equal(grads[0], ref_grads[0])
+    for grad, ref_grad in zip(grads[1:], ref_grads[1:]):
+        assert grad.shape == ref_grad.shape
+        assert torch.allclose(grad, ref_grad, rtol=1e-4, atol=1e-4)
+
+
+@pytest.mark.parametrize("dtype", [torch.float, torch.double], ids=("fp32", "fp64"))
+def test_graph_capturable_torch_kernels_match_eager(quantization_mode, dtype, torch_kernels, mocker):
+    input_, params, grad_output = get_quantize_inputs(quantization_mode, [2, 16, 8, 8], [1, 16, 1, 1], dtype)
+    ref_output, ref_grads = quantize_with_grads(quantization_mode, input_, params, grad_output)
+
+    mocker.patch.object(quantize_functions, "is_torch_compiling", return_value=True)
+    output, grads = quantize_with_grads(quantization_mode, input_, params, grad_output)
+
+    assert torch.equal(output, ref_output)
+    for grad, ref_grad in zip(grads, ref_grads):
+        assert torch.allclose(grad, ref_grad, rtol=1e-6, atol=1e-6)
+
+
+def test_graph_capturable_torch_kernels_are_scriptable():
+    scripted_quantize = torch.jit.script(torch_quantize)
+    scripted_tune_range = torch.jit.script(torch_tune_range)
+
+    input_ = torch.randn([2, 3, 4])
+    input_low, input_range = scripted_tune_range(-torch.ones([1, 3, 1]), 2 * torch.ones([1, 3, 1]), 256)
+    output = scripted_quantize(input_, input_low, input_range, 0, 255, 256, input_range, input_low)
+    ref_output = torch_quantize(input_, input_low, input_range, 0, 255, 256, input_range, input_low)
+    assert torch.equal(output, ref_output)
@@ -14,6 +14,7 @@ import math
 import os
 from collections import OrderedDict
 from collections import namedtuple
+from copy import deepcopy
 from functools import partial
 from pathlib import Path
 from typing import Callable, Dict, List, NamedTuple
@@ -39,8 +40,10 @@ from nncf.torch import register_default_init_args
 from nncf.torch.checkpoint_loading import load_state
 from nncf.torch.dynamic_graph.graph_tracer import create_input_infos
 from nncf.torch.initialization import default_criterion_fn
+from nncf.torch.nncf_network import NNCFNetworkInterface
 from nncf.torch.quantization.adjust_padding import add_adjust_padding_nodes
 from nncf.torch.quantization.hessian_trace import HessianTraceEstimator
+from nncf.torch.quantization.hessian_trace import RunningMeanVariance
 from nncf.torch.quantization.layers import QUANTIZATION_MODULES
 from nncf.torch.quantization.layers import QuantizerConfig
 from nncf.torch.quantization.layers import QuantizersSwitcher
@@ -48,8 +51,11 @@ from nncf.torch.quantization.precision_init.bitwidth_graph import BitwidthGraph
 from nncf.torch.quantization.precision_init.compression_ratio import CompressionRatioCalculator
 from nncf.torch.quantization.precision_init.hawq_debug import HAWQDebugger
 from nncf.torch.quantization.precision_init.hawq_init import BitwidthAssignmentMode
+from nncf.torch.quantization.precision_init.hawq_init import BitwidthSearchAlgorithm
 from nncf.torch.quantization.precision_init.hawq_init import HAWQPrecisionInitializer
 from nncf.torch.quantization.precision_init.hawq_init import TraceOrderBitwidthMatcher
+from nncf.torch.quantization.precision_init.knapsack import KnapsackOption
+from nncf.torch.quantization.precision_init.knapsack import solve_multiple_choice_knapsack
 from nncf.torch.quantization.precision_init.perturbations import PerturbationObserver
 from nncf.torch.quantization.precision_init.perturbations import Perturbations
 from nncf.torch.quantization.precision_init.traces_order import TracesOrder
@@ -433,6 +439,159 @@ def test_can_choose_pareto_optimal_sequence(ratios):
     assert compression_ratio_per_qconfig[qconfig_sequence_index] == expected_ratio
 
 
+@pytest.mark.parametrize("max_weight", [0, 10, 15, 20, 30, 100])
+def test_multiple_choice_knapsack_solution_is_optimal(max_weight):
+    options_per_group = [
+        [KnapsackOption(weight=2, cost=5.0), KnapsackOption(weight=4, cost=1.0), KnapsackOption(weight=8, cost=0.5)],
+        [KnapsackOption(weight=1, cost=3.0), KnapsackOption(weight=2, cost=2.0)],
+        [KnapsackOption(weight=3, cost=4.0), KnapsackOption(weight=6, cost=0.1), KnapsackOption(weight=12, cost=0.0)],
+        [KnapsackOption(weight=5, cost=1.0)],
+        [KnapsackOption(weight=0.5, cost=7.0), KnapsackOption(weight=1, cost=7.0), KnapsackOption(weight=4, cost=2.0)],
+    ]
+    ref_cost = None
+    for option_indexes in itertools.product(*[range(len(options)) for options in options_per_group]):
+        chosen_options = [options[i] for options, i in zip(options_per_group, option_indexes)]
+        if sum(option.weight for option in chosen_options) <= max_weight:
+            cost = sum(option.cost for option in chosen_options)
+            if ref_cost is None or cost < ref_cost:
+                ref_cost = cost
+
+    option_indexes = solve_multiple_choice_knapsack(options_per_group, max_weight)
+
+    if ref_cost is None:
+        assert option_indexes is None
+        return
+    chosen_options = [options[i] for options, i in zip(options_per_group, option_indexes)]
+    assert sum(option.weight for option in chosen_options) <= max_weight
+    assert sum(option.cost for option in chosen_options) == ref_cost
+
+
+class ConvStack(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = nn.Conv2d(1, 4, 3, padding=1)
+        self.conv2 = nn.Conv2d(4, 8, 3, padding=1)
+        self.conv3 = nn.Conv2d(8, 8, 1)
+        self.conv4 = nn.Conv2d(8, 2, 3, padding=1)
+
+    def forward(self, x):
+        x = torch.relu(self.conv1(x))
+        x = torch.relu(self.conv2(x))
+        x = torch.relu(self.conv3(x))
+        return self.conv4(x)
+
+
+@pytest.mark.parametrize("target_ratio", [1.1, 1.5, 1.9])
+def test_dynamic_programming_search_is_not_worse_than_exhaustive(_seed, mocker, target_ratio):
+    traces_per_layer = TracesPerLayer(torch.Tensor([3.0, 0.5, 2.0, 1.0]))
+    mocker.patch(
+        "nncf.torch.quantization.precision_init.hawq_init.HAWQPrecisionInitializer._calc_traces",
+        return_value=traces_per_layer,
+    )
+    mocker.patch("nncf.common.initialization.batchnorm_adaptation.BatchnormAdaptationAlgorithm.run")
+    choose_spy = mocker.spy(HAWQPrecisionInitializer, "choose_qconfig_sequence")
+    metric_spy = mocker.spy(HAWQPrecisionInitializer, "calc_hawq_metric_per_qconfig_sequence")
+    ratio_spy = mocker.spy(HAWQPrecisionInitializer, "get_compression_ratio_per_qconfig_sequence")
+
+    model = ConvStack()
+    results = {}
+    for search_algorithm in BitwidthSearchAlgorithm:
+        config = HAWQConfigBuilder().with_sample_size([1, 1, 8, 8]).for_trial().with_ratio(target_ratio).build()
+        config["compression"]["initializer"]["range"]["num_init_samples"] = 0
+        config["compression"]["initializer"]["precision"]["search_algorithm"] = search_algorithm.value
+        config.register_extra_structs(
+            [
+                QuantizationPrecisionInitArgs(
+                    criterion_fn=mocker.stub(), criterion=mocker.stub(), data_loader=mocker.stub(), device="cpu"
+                )
+            ]
+        )
+        create_compressed_model_and_algo_for_test(deepcopy(model), config)
+        metrics = metric_spy.spy_return
+        ratios = ratio_spy.spy_return
+        chosen_index = 0
+        if search_algorithm == BitwidthSearchAlgorithm.EXHAUSTIVE:
+            chosen_index = choose_spy.spy_return
+        results[search_algorithm] = (metrics[chosen_index].item(), ratios[chosen_index])
+
+    dp_metric, dp_ratio = results[BitwidthSearchAlgorithm.DYNAMIC_PROGRAMMING]
+    exhaustive_metric, _ = results[BitwidthSearchAlgorithm.EXHAUSTIVE]
+    assert dp_ratio >= target_ratio
+    assert dp_metric <= exhaustive_metric * (1 + 1e-6)
+
+
+def calc_quantization_noise_by_forward(
+    initializer: HAWQPrecisionInitializer, qconfig_sequences: List[List[QuantizerConfig]], traces_order: TracesOrder
+) -> Perturbations:
+    perturbations = Perturbations()
+    # pylint:disable=protected-access
+    qp_ids_in_trace_order = initializer._get_weight_qp_ids_in_trace_order(traces_order)
+    ctrl = initializer._algo
+    for qconfig_sequence in qconfig_sequences:
+        quantizer_setup = initializer._apply_qconfig_sequence_to_quantizer_setup(
+            qconfig_sequence, qp_ids_in_trace_order, ctrl.get_quantizer_setup_for_current_state()
+        )
+        ctrl, model = ctrl.apply_new_quantizer_setup(quantizer_setup)
+        observers = []
+        hook_handles = []
+        for qp_id_set in qp_ids_in_trace_order:
+            wq_id = ctrl.setup_to_module_id_translation_dict[next(iter(qp_id_set))]
+            wq_module = ctrl.weight_quantizers[wq_id].quantizer_module_ref
+            observer = PerturbationObserver("cpu")
+            hook_handles.append(wq_module.register_forward_hook(observer.calc_perturbation))
+            observers.append(observer)
+        model.nncf.do_dummy_forward(force_eval=True)
+        for handle in hook_handles:
+            handle.remove()
+        for trace_idx, observer in enumerate(observers):
+            perturbations.add(
+                layer_id=traces_order.get_execution_index_by_traces_index(trace_idx),
+                qconfig=qconfig_sequence[trace_idx],
+                perturbation=observer.get_observation(),
+            )
+    return perturbations
+
+
+def test_quantization_noise_is_calculated_without_forward(_seed, mocker):
+    mocker.patch(
+        "nncf.torch.quantization.precision_init.hawq_init.HAWQPrecisionInitializer._calc_traces",
+        return_value=TracesPerLayer(torch.Tensor([3.0, 0.5, 2.0, 1.0])),
+    )
+    mocker.patch("nncf.common.initialization.batchnorm_adaptation.BatchnormAdaptationAlgorithm.run")
+    forward_spy = mocker.spy(NNCFNetworkInterface, "do_dummy_forward")
+    calc_quantization_noise = HAWQPrecisionInitializer.calc_quantization_noise
+    noise_per_call = []
+
+    def calc_quantization_noise_without_forward(initializer, qconfig_sequences, traces_order):
+        num_forward_calls = forward_spy.call_count
+        perturbations, observers = calc_quantization_noise(initializer, qconfig_sequences, traces_order)
+        assert forward_spy.call_count == num_forward_calls
+        ref_perturbations = calc_quantization_noise_by_forward(initializer, qconfig_sequences, traces_order)
+        noise_per_call.append((perturbations, ref_perturbations))
+        return perturbations, observers
+
+    mocker.patch.object(HAWQPrecisionInitializer, "calc_quantization_noise", calc_quantization_noise_without_forward)
+    config = HAWQConfigBuilder().with_sample_size([1, 1, 8, 8]).for_trial().with_ratio(1.5).build()
+    config["compression"]["initializer"]["range"]["num_init_samples"] = 0
+    config.register_extra_structs(
+        [
+            QuantizationPrecisionInitArgs(
+                criterion_fn=mocker.stub(), criterion=mocker.stub(), data_loader=mocker.stub(), device="cpu"
+            )
+        ]
+    )
+    create_compressed_model_and_algo_for_test(ConvStack(), config)
+
+    assert len(noise_per_call) == 1
+    perturbations, ref_perturbations = noise_per_call[0]
+    ref_perturbations_per_layer = ref_perturbations.get_all()
+    assert perturbations.get_all().keys() == ref_perturbations_per_layer.keys()
+    for layer_id, perturbation_per_qconfig in perturbations.get_all().items():
+        assert perturbation_per_qconfig.keys() == ref_perturbations_per_layer[layer_id].keys()
+        for qconfig, perturbation in perturbation_per_qconfig.items():
+            assert torch.allclose(perturbation, ref_perturbations_per_layer[layer_id][qconfig])
+
+
 def test_hawq_hw_vpu_config_e2e(_seed, dataset_dir, tmp_path):
     config = HAWQConfigBuilder().for_vpu().liberal_mode().with_ratio(1.5).build()
     model = MobileNetV2(num_classes=10)
@@ -505,6 +664,44 @@ def test_hawq_on_single_conv_without_quantizers(_seed, dataset_dir, tmp_path, pa
     assert math.isclose(actual_state.item(), ref_trace, rel_tol=rtol)
 
 
+def test_running_mean_variance():
+    values = torch.randn([10, 3], dtype=torch.double)
+    stat = RunningMeanVariance()
+    for value in values:
+        stat.update(value)
+    assert stat.count == 10
+    assert torch.allclose(stat.mean, values.mean(dim=0))
+    assert torch.allclose(stat.variance, values.var(dim=0))
+
+
+def test_hessian_trace_estimation_with_multiple_probes():
+    torch.manual_seed(0)
+    inputs = torch.randn([64, 8])
+    targets = torch.randn([64, 1])
+    data_loader = torch.utils.data.DataLoader(torch.utils.data.TensorDataset(inputs, targets), batch_size=16)
+    model = nn.Linear(8, 1, bias=False)
+    num_forward_calls = 0
+
+    def count_forward_calls(*_):
+        nonlocal num_forward_calls
+        num_forward_calls += 1
+
+    model.register_forward_hook(count_forward_calls)
+
+    trace_estimator = HessianTraceEstimator(model, default_criterion_fn, nn.MSELoss(), "cpu", data_loader, 64)
+    avg_traces = trace_estimator.get_average_traces(
+        max_iter=100, tolerance=1e-2, num_probes=16, confidence_level=0.95
+    )
+
+    # The Hessian of the mean squared error of a linear layer is 2 * X^T X / N
+    ref_avg_trace = torch.trace(2 * inputs.T @ inputs / len(inputs)) / inputs.shape[1]
+    assert math.isclose(avg_traces.item(), ref_avg_trace.item(), rel_tol=0.05)
+    # The gradients are computed once per data batch for all probes
+    assert num_forward_calls % len(data_loader) == 0
+    num_iterations = num_forward_calls // len(data_loader)
+    assert num_iterations < 100
+
+
 def get_size_of_search_space(m, L):
     def nCr(n, r):
         f = math.factorial
@@ -23,6 +23,7 @@ from torch.utils.data import DataLoader
 from torchvision.models import squeezenet1_1
 
 from nncf.common.graph import NNCFNodeName
+from nncf.common.graph.transformations.commands import TargetType
 from nncf.common.quantization.initialization.range import PerLayerRangeInitConfig
 from nncf.common.quantization.initialization.range import RangeInitConfig
 from nncf.common.quantization.quantizer_setup import ActivationQuantizationInsertionPoint
@@ -33,11 +34,16 @@ from nncf.common.quantization.structs import QuantizerConfig
 from nncf.common.quantization.structs import QuantizerGroup
 from nncf.config import NNCFConfig
 from nncf.config.structures import QuantizationRangeInitArgs
+from nncf.experimental.common.tensor_statistics.collectors import MeanAggregator
+from nncf.experimental.common.tensor_statistics.collectors import MinAggregator
 from nncf.torch import utils
 from nncf.torch.checkpoint_loading import load_state
+from nncf.torch.dynamic_graph.graph_tracer import ModelInputInfo
+from nncf.torch.graph.transformations.commands import PTTargetPoint
 from nncf.torch.initialization import DefaultInitializingDataLoader
 from nncf.torch.initialization import wrap_dataloader_for_init
 from nncf.torch.nncf_network import EXTERNAL_QUANTIZERS_STORAGE_NAME
+from nncf.torch.nncf_network import NNCFNetwork
 from nncf.torch.quantization.init_range import PTRangeInitCollectorParams
 from nncf.torch.quantization.init_range import PTRangeInitParams
 from nncf.torch.quantization.init_range import StatCollectorGenerator
@@ -46,9 +52,13 @@ from nncf.torch.quantization.layers import AsymmetricQuantizer
 from nncf.torch.quantization.layers import BaseQuantizer
 from nncf.torch.quantization.layers import PTQuantizerSpec
 from nncf.torch.quantization.layers import SymmetricQuantizer
-from nncf.torch.tensor_statistics.collectors import PTMeanMinMaxStatisticCollector
+from nncf.torch.tensor_statistics.algo import TensorStatisticObservationPoint
+from nncf.torch.tensor_statistics.algo import TensorStatisticsCollectionBuilder
+from nncf.torch.tensor_statistics.collectors import PTHistogramMedianMADStatisticCollector
+from nncf.torch.tensor_statistics.collectors import PTHistogramPercentileStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMedianMADStatisticCollector
-from nncf.torch.tensor_statistics.collectors import PTMinMaxStatisticCollector
+from nncf.torch.tensor_statistics.collectors import PTMinReducer
+from nncf.torch.tensor_statistics.collectors import get_tensor_collector_hook
 from nncf.torch.tensor_statistics.statistics import pt_convert_stat_to_min_max_tensor_stat
 from nncf.torch.utils import get_all_modules_by_type
 from nncf.torch.utils import safe_thread_call
@@ -656,10 +666,11 @@ RANGE_INIT_CALL_COUNT_TEST_CASES = [
                 "target_scopes": ["{re}TwoConvTestModel/Sequential\\[features\\]/.*"],
             },
         ],
-        expected_call_count_initializer_create={"min_max": 2, "mean_min_max": 1, "three_sigma": 1},
+        # Mean min max collectors aggregate the means of both minimums and maximums
+        expected_call_count_initializer_create={"min_max": 2, "mean_min_max": 2, "three_sigma": 1},
         expected_call_count_register_input={
             "min_max": 2,  # Weights only require single input registration
-            "mean_min_max": 2,
+            "mean_min_max": 4,
             "three_sigma": 3,
         },
     ),
@@ -680,12 +691,12 @@ def test_per_layer_range_init_collectors_are_called_the_required_number_of_times
     data_loader = TestRangeInit.create_dataloader(True, config, 10)
     config.register_extra_structs([QuantizationRangeInitArgs(data_loader)])
 
-    range_minmax_init_create_spy = mocker.spy(PTMinMaxStatisticCollector, "__init__")
-    range_meanminmax_init_create_spy = mocker.spy(PTMeanMinMaxStatisticCollector, "__init__")
+    range_minmax_init_create_spy = mocker.spy(MinAggregator, "__init__")
+    range_meanminmax_init_create_spy = mocker.spy(MeanAggregator, "__init__")
     range_threesigma_init_create_spy = mocker.spy(PTMedianMADStatisticCollector, "__init__")
 
-    range_minmax_init_register_input_spy = mocker.spy(PTMinMaxStatisticCollector, "_register_input")
-    range_meanminmax_init_register_input_spy = mocker.spy(PTMeanMinMaxStatisticCollector, "_register_input")
+    range_minmax_init_register_input_spy = mocker.spy(MinAggregator, "_register_reduced_input_impl")
+    range_meanminmax_init_register_input_spy = mocker.spy(MeanAggregator, "_register_reduced_input_impl")
     range_threesigma_init_register_input_spy = mocker.spy(PTMedianMADStatisticCollector, "_register_input")
 
     TestRangeInit.create_algo_and_compressed_model(config)
@@ -809,6 +820,122 @@ def test_quantize_range_init_sets_correct_scale_shapes(quantizer_range_init_test
             assert False  # options above should be exhaustive
 
 
+TENSOR_COLLECTOR_VS_LEGACY_TEST_CASES = list(
+    itertools.product(QUANTIZER_RANGE_INIT_TEST_CASES, ["min_max", "mean_min_max", "mixed_min_max", "mean_percentile"])
+)
+
+
+@pytest.mark.parametrize("quantization_mode", [QuantizationMode.SYMMETRIC, QuantizationMode.ASYMMETRIC])
+@pytest.mark.parametrize(
+    "quantizer_range_init_test_struct", TENSOR_COLLECTOR_VS_LEGACY_TEST_CASES, ids=quantizer_range_init_scale_shape_idfn
+)
+def test_tensor_collector_statistics_match_legacy_collector_statistics(
+    quantizer_range_init_test_struct: Tuple[QRISSTS, str], quantization_mode: str
+):
+    test_struct, initializer_type = quantizer_range_init_test_struct
+    range_init_config = RangeInitConfig(init_type=initializer_type, num_init_samples=2)
+    input_shape = [*test_struct.input_shape[:2], 4, 4]
+    channel_idx = 0 if test_struct.is_weights else 1
+    collector_params = PTRangeInitCollectorParams(
+        test_struct.is_weights, quantization_mode, test_struct.per_channel, tuple(input_shape), channel_idx
+    )
+    legacy_collector = StatCollectorGenerator.generate_stat_collector_for_range_init_config(
+        range_init_config, test_struct.ref_scale_shape, collector_params
+    )
+    tensor_collector = StatCollectorGenerator.generate_tensor_collector_for_range_init_config(
+        range_init_config, test_struct.ref_scale_shape, collector_params
+    )
+    if initializer_type == "mean_percentile" and test_struct.per_channel:
+        # The legacy collector is used to keep the percentiles reduced dimension by dimension
+        assert tensor_collector is None
+        return
+    hook = get_tensor_collector_hook(tensor_collector)
+    for _ in range(3):
+        input_ = torch.randn(input_shape)
+        legacy_collector.register_input(input_)
+        hook(input_)
+
+    ref_stat = pt_convert_stat_to_min_max_tensor_stat(legacy_collector.get_statistics())
+    stat = tensor_collector.get_statistics()
+    assert stat.min_values.shape == stat.max_values.shape == test_struct.ref_scale_shape
+    assert torch.allclose(stat.min_values, ref_stat.min_values.to(stat.min_values.dtype), atol=1e-6)
+    assert torch.allclose(stat.max_values, ref_stat.max_values.to(stat.max_values.dtype), atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "quantizer_range_init_test_struct",
+    list(itertools.product(QUANTIZER_RANGE_INIT_TEST_CASES, ["threesigma", "percentile"])),
+    ids=quantizer_range_init_scale_shape_idfn,
+)
+def test_histogram_collector_statistics_match_legacy_collector_statistics(
+    quantizer_range_init_test_struct: Tuple[QRISSTS, str]
+):
+    test_struct, initializer_type = quantizer_range_init_test_struct
+    input_shape = [*test_struct.input_shape[:2], 4, 4]
+    channel_idx = 0 if test_struct.is_weights else 1
+    collector_params = PTRangeInitCollectorParams(
+        test_struct.is_weights, QuantizationMode.ASYMMETRIC, test_struct.per_channel, tuple(input_shape), channel_idx
+    )
+    legacy_collector = StatCollectorGenerator.generate_stat_collector_for_range_init_config(
+        RangeInitConfig(init_type=initializer_type, num_init_samples=3), test_struct.ref_scale_shape, collector_params
+    )
+    histogram_collector = StatCollectorGenerator.generate_stat_collector_for_range_init_config(
+        RangeInitConfig(
+            init_type=initializer_type, num_init_samples=3, init_type_specific_params={"num_histogram_bins": 4096}
+        ),
+        test_struct.ref_scale_shape,
+        collector_params,
+    )
+    assert isinstance(
+        histogram_collector, (PTHistogramMedianMADStatisticCollector, PTHistogramPercentileStatisticCollector)
+    )
+    for _ in range(3):
+        input_ = torch.randn(input_shape)
+        legacy_collector.register_input(input_)
+        histogram_collector.register_input(input_)
+
+    ref_stat = pt_convert_stat_to_min_max_tensor_stat(legacy_collector.get_statistics())
+    stat = pt_convert_stat_to_min_max_tensor_stat(histogram_collector.get_statistics())
+    assert stat.min_values.shape == stat.max_values.shape == test_struct.ref_scale_shape
+    assert torch.allclose(stat.min_values, ref_stat.min_values, atol=0.05)
+    assert torch.allclose(stat.max_values, ref_stat.max_values, atol=0.05)
+
+
+def test_tensor_collectors_of_shared_input_are_merged(mocker):
+    class SharedInputModel(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.conv1 = nn.Conv2d(1, 1, 1)
+            self.conv2 = nn.Conv2d(1, 1, 1)
+
+        def forward(self, x):
+            x = torch.relu(x)
+            return self.conv1(x) + self.conv2(x)
+
+    nncf_network = NNCFNetwork(SharedInputModel(), input_infos=[ModelInputInfo([2, 1, 4, 4])])
+    collector_params = PTRangeInitCollectorParams(False, QuantizationMode.ASYMMETRIC, False, (2, 1, 4, 4), 1)
+    observation_points_vs_collectors = {}
+    for node in nncf_network.nncf.get_original_graph().get_nodes_by_types(["conv2d"]):
+        target_point = PTTargetPoint(TargetType.OPERATOR_PRE_HOOK, node.node_name, input_port_id=0)
+        collector = StatCollectorGenerator.generate_tensor_collector_for_range_init_config(
+            RangeInitConfig(init_type="min_max", num_init_samples=1), (1,), collector_params
+        )
+        observation_points_vs_collectors[TensorStatisticObservationPoint(target_point)] = {(1,): collector}
+    assert len(observation_points_vs_collectors) == 2
+
+    builder = TensorStatisticsCollectionBuilder(NNCFConfig(), observation_points_vs_collectors)
+    builder.apply_to(nncf_network)
+    reduce_spy = mocker.spy(PTMinReducer, "_reduce_out_of_place")
+    input_ = torch.randn([2, 1, 4, 4])
+    nncf_network(input_)
+
+    assert reduce_spy.call_count == 1
+    for rs_vs_collector in observation_points_vs_collectors.values():
+        stat = rs_vs_collector[(1,)].get_statistics()
+        assert torch.allclose(stat.min_values, torch.relu(input_).min().view(1))
+        assert torch.allclose(stat.max_values, torch.relu(input_).max().view(1))
+
+
 def test_range_initialization_in_train_mode():
     """
     Check that if a model in train mode is being compressed,
@@ -19,6 +19,7 @@ from nncf.api.compression import CompressionStage
 from nncf.torch.module_operations import UpdateWeight
 from nncf.torch.sparsity.layers import BinaryMask
 from nncf.torch.sparsity.magnitude.algo import MagnitudeSparsityController
+from nncf.torch.sparsity.magnitude.functions import find_kth_smallest_value
 from nncf.torch.sparsity.magnitude.functions import normed_magnitude
 from tests.torch.helpers import BasicConvTestModel
 from tests.torch.helpers import MockModel
@@ -85,6 +86,22 @@ def test_magnitude_sparse_algo_sets_threshold(weight_importance, sparsity_level,
         assert layer_info.threshold == pytest.approx(threshold, 0.01)
 
 
+@pytest.mark.parametrize(
+    "tensors",
+    (
+        [torch.rand(1000)],
+        [torch.rand(1000), torch.rand(10) * 100, torch.zeros(500)],
+        [torch.randn(3000).abs(), torch.randn(200).abs() * 1e-6],
+        [torch.ones(100), torch.ones(50)],
+    ),
+)
+@pytest.mark.parametrize("sparsity_level", (0.0, 0.1, 0.5, 0.99))
+def test_find_kth_smallest_value_matches_sort(tensors, sparsity_level):
+    all_values, _ = torch.cat(tensors).sort()
+    k = int((all_values.numel() - 1) * sparsity_level)
+    assert find_kth_smallest_value(tensors, k, num_bins=16) == all_values[k].item()
+
+
 def test_can_not_set_sparsity_more_than_one_for_magnitude_sparse_algo():
     config = get_basic_magnitude_sparsity_config()
     _, compression_ctrl = create_compressed_model_and_algo_for_test(MagnitudeTestModel(), config)
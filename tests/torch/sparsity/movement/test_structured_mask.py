@@ -21,6 +21,7 @@ from pkg_resources import parse_version
 
 from nncf.common.logging import nncf_logger
 from nncf.config import NNCFConfig
+from nncf.experimental.torch.sparsity.movement.algo import MovementSparsityController
 from nncf.experimental.torch.sparsity.movement.algo import is_supported_model_family
 from nncf.experimental.torch.sparsity.movement.layers import MovementSparsifier
 from nncf.experimental.torch.sparsity.movement.layers import SparseConfig
@@ -426,6 +427,102 @@ class TestStructuredMaskHandler:
                 assert re.fullmatch(r"\[[0-9]+ items\]", item) is not None
         assert Path(tmp_path, f"{file_name}.csv").is_file()
 
+    def test_compact_model(self):
+        run_recipe = BertRunRecipe().model_config_(hidden_size=4, intermediate_size=4)
+        compression_ctrl, compressed_model = create_compressed_model(
+            run_recipe.model(), run_recipe.nncf_config(), dump_graphs=False
+        )
+        self._prune_first_block_and_freeze(compression_ctrl)
+        compressed_model.eval()
+
+        inputs = {info.keyword: torch.randint(0, 2, (2, *info.shape[1:])) for info in run_recipe.model_input_info}
+        ref_logits = compressed_model(**inputs).logits
+        stripped_model = compression_ctrl.strip_model(compressed_model, do_copy=True)
+        assert stripped_model.bert.encoder.layer[0].attention.self.query.weight.shape == (4, 4)
+        compacted_model = compression_ctrl.compact_model(compressed_model, do_copy=True)
+        logits = compacted_model(**inputs).logits
+        assert torch.allclose(logits, ref_logits, atol=1e-5)
+
+        block = compacted_model.bert.encoder.layer[0]
+        assert block.attention.self.num_attention_heads == 1
+        assert block.attention.self.all_head_size == 2
+        for module in [block.attention.self.query, block.attention.self.key, block.attention.self.value]:
+            assert module.weight.shape == (2, 4)
+            assert not module.pre_ops
+        assert block.attention.output.dense.weight.shape == (4, 2)
+        assert block.intermediate.dense.weight.shape == (3, 4)
+        assert block.output.dense.weight.shape == (4, 3)
+        original_block = compressed_model.bert.encoder.layer[0]
+        assert original_block.attention.self.query.weight.shape == (4, 4)
+
+        _, all_ctxes = self._get_handler_from_ctrl(compression_ctrl)
+        graph = compacted_model.nncf.get_graph()
+        for ctx in all_ctxes:
+            module = compacted_model.nncf.get_containing_module(ctx.module_node_name)
+            layer_attributes = graph.get_node_by_name(ctx.module_node_name).layer_attributes
+            assert layer_attributes.get_weight_shape() == list(module.weight.shape)
+
+    def test_compact_model_is_skipped_for_quantized_layers(self, nncf_caplog):
+        run_recipe = BertRunRecipe().model_config_(hidden_size=4, intermediate_size=4)
+        nncf_config = NNCFConfig.from_dict(
+            {
+                **run_recipe.nncf_config(),
+                "compression": [
+                    run_recipe.algo_config.to_dict(),
+                    {
+                        "algorithm": "quantization",
+                        "initializer": {
+                            "range": {"num_init_samples": 0},
+                            "batchnorm_adaptation": {"num_bn_adaptation_samples": 0},
+                        },
+                    },
+                ],
+            }
+        )
+        compression_ctrl, compressed_model = create_compressed_model(run_recipe.model(), nncf_config, dump_graphs=False)
+        movement_ctrl = next(
+            ctrl for ctrl in compression_ctrl.child_ctrls if isinstance(ctrl, MovementSparsityController)
+        )
+        self._prune_first_block_and_freeze(movement_ctrl)
+        compressed_model.eval()
+
+        inputs = {info.keyword: torch.randint(0, 2, (2, *info.shape[1:])) for info in run_recipe.model_input_info}
+        stripped_model = compression_ctrl.strip()
+        ref_logits = stripped_model(**inputs).logits
+        block = stripped_model.bert.encoder.layer[0]
+        assert block.attention.self.query.weight.shape == (4, 4)
+        assert block.attention.self.num_attention_heads == 2
+
+        with nncf_caplog.at_level(logging.WARNING, logger=nncf_logger.name):
+            compacted_model = movement_ctrl.compact_model(stripped_model, do_copy=True)
+        assert "since its layers have other compression operations" in nncf_caplog.text
+        logits = compacted_model(**inputs).logits
+        assert torch.equal(logits, ref_logits)
+        block = compacted_model.bert.encoder.layer[0]
+        assert block.attention.self.query.weight.shape == (4, 4)
+        assert block.attention.self.num_attention_heads == 2
+
+    def test_compact_model_requires_frozen_masks(self):
+        run_recipe = BertRunRecipe().model_config_(hidden_size=4, intermediate_size=4)
+        compression_ctrl, compressed_model = create_compressed_model(
+            run_recipe.model(), run_recipe.nncf_config(), dump_graphs=False
+        )
+        with pytest.raises(RuntimeError, match="binary masks are frozen"):
+            compression_ctrl.compact_model(compressed_model, do_copy=True)
+
+    def _prune_first_block_and_freeze(self, compression_ctrl):
+        handler, all_ctxes = self._get_handler_from_ctrl(compression_ctrl)
+        for ctx in all_ctxes:
+            independent_structured_mask = torch.ones(ctx.structured_mask_shape)
+            if ctx.prune_by_row:
+                independent_structured_mask[0, :] = 0
+            else:
+                independent_structured_mask[:, 0] = 0
+            ctx.independent_structured_mask = independent_structured_mask
+        handler.resolve_dependent_structured_mask()
+        handler.populate_dependent_structured_mask_to_operand()
+        compression_ctrl.freeze()
+
     # pylint: disable=protected-access
     def _get_handler_from_ctrl(self, compression_ctrl) -> Tuple[StructuredMaskHandler, List[StructuredMaskContext]]:
         handler = compression_ctrl._structured_mask_handler
@@ -72,6 +72,30 @@ class TestSparseModules:
         input_ = torch.ones([1, 1, 1, 1])
         assert model(input_).item() == ref_loss
 
+    def test_caches_masked_weight__with_frozen_mask(self, module):
+        model = sparse_model(module, True)
+        sm = model.layer
+        sm.weight.data.fill_(1)
+        sm.bias.data.fill_(0)
+        sw = model.sparsifier
+        input_ = torch.ones([1, 1, 1, 1])
+        model.eval()
+        with torch.no_grad():
+            assert model(input_).item() == 1
+            cached_weight = sw._masked_weight_cache
+            assert cached_weight is not None
+            assert model(input_).item() == 1
+            assert sw._masked_weight_cache is cached_weight
+
+            sm.weight.fill_(2)
+            assert model(input_).item() == 2
+            sw.mask = torch.zeros_like(sw.mask).fill_(-0.3)
+            assert model(input_).item() == 0
+
+        model.train()
+        assert sw._masked_weight_cache is None
+        assert model(input_).item() == 0
+
     @pytest.mark.parametrize(
         ("frozen", "raising"), ((None, True), (True, True), (False, False)), ids=("default", "frozen", "not_frozen")
     )
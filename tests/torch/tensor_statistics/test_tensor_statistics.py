@@ -12,6 +12,7 @@
 from functools import partial
 from typing import Dict, Tuple, Type
 
+import numpy as np
 import pytest
 import torch
 
@@ -19,8 +20,11 @@ from nncf.common.tensor_statistics.collectors import OfflineTensorStatisticColle
 from nncf.common.tensor_statistics.collectors import ReductionShape
 from nncf.common.tensor_statistics.collectors import StatisticsNotCollectedError
 from nncf.common.tensor_statistics.collectors import TensorStatisticCollectorBase
+from nncf.common.tensor_statistics.reduction import np_percentile_reduce_like
 from nncf.common.tensor_statistics.statistics import TensorStatistic
 from nncf.torch.tensor import PTNNCFTensor
+from nncf.torch.tensor_statistics.collectors import PTHistogramMedianMADStatisticCollector
+from nncf.torch.tensor_statistics.collectors import PTHistogramPercentileStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMeanMinMaxStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMeanPercentileStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMedianMADStatisticCollector
@@ -28,6 +32,7 @@ from nncf.torch.tensor_statistics.collectors import PTMinMaxStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTMixedMinMaxStatisticCollector
 from nncf.torch.tensor_statistics.collectors import PTNNCFCollectorTensorProcessor
 from nncf.torch.tensor_statistics.collectors import PTPercentileStatisticCollector
+from nncf.torch.tensor_statistics.collectors import percentile_reduce_like
 from nncf.torch.tensor_statistics.statistics import PTMedianMADTensorStatistic
 from nncf.torch.tensor_statistics.statistics import PTMinMaxTensorStatistic
 from nncf.torch.tensor_statistics.statistics import PTPercentileTensorStatistic
@@ -288,3 +293,71 @@ class TestCollectorTensorProcessor:
         tensor_unstacked2 = TestCollectorTensorProcessor.tensor_processor.unstack(PTNNCFTensor(tensor2))
 
         assert tensor_unstacked1 == tensor_unstacked2 == [PTNNCFTensor(torch.tensor(1.0))]
+
+    @pytest.mark.parametrize("axis", [0, (0, 2), (1, 2, 3), (0, 1, 2, 3)])
+    @pytest.mark.parametrize("keepdims", [False, True])
+    def test_quantile(self, axis, keepdims):
+        tensor = torch.randn([3, 4, 5, 6])
+        quantile = [0.01, 0.5, 0.99]
+        result = TestCollectorTensorProcessor.tensor_processor.quantile(
+            PTNNCFTensor(tensor), quantile, axis, keepdims=keepdims
+        )
+
+        ref_result = np.quantile(tensor.numpy(), quantile, axis, keepdims=keepdims)
+        assert len(result) == len(quantile)
+        for value, ref_value in zip(result, ref_result):
+            assert value.tensor.shape == ref_value.shape
+            assert np.allclose(value.tensor.numpy(), ref_value, atol=1e-6)
+
+
+@pytest.mark.parametrize("ref_tensor_shape", [(1,), (1, 3, 1, 1), (3, 1, 1, 1), (1, 3, 4, 1)])
+def test_percentile_reduce_like_matches_numpy_implementation(ref_tensor_shape):
+    input_ = torch.randn([2, 3, 4, 5])
+    pct = 99.0
+    result = percentile_reduce_like(input_, ref_tensor_shape, pct)
+
+    ref_result = np_percentile_reduce_like(input_.numpy(), ref_tensor_shape, pct)
+    assert result.shape == ref_result.shape
+    assert np.allclose(result.numpy(), ref_result, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    ("collector", "ref_collector"),
+    [
+        (PTHistogramMedianMADStatisticCollector, PTMedianMADStatisticCollector),
+        (
+            partial(PTHistogramPercentileStatisticCollector, [0.1, 50.0, 99.9]),
+            partial(PTPercentileStatisticCollector, [0.1, 50.0, 99.9]),
+        ),
+    ],
+)
+@pytest.mark.parametrize("reduction_shape", [(1,), (1, 8, 1, 1)])
+def test_histogram_collectors_match_collectors_with_full_history(collector, ref_collector, reduction_shape):
+    num_bins = 4096
+    inputs = [torch.relu(torch.randn([2, 8, 6, 6]) * (i + 1) + i) for i in range(10)]
+    collector_obj = collector(reduction_shape=reduction_shape, num_bins=num_bins)
+    ref_collector_obj = ref_collector(reduction_shape=reduction_shape)
+    for input_ in inputs:
+        collector_obj.register_input(input_)
+        ref_collector_obj.register_input(input_)
+
+    stat = collector_obj.get_statistics()
+    ref_stat = ref_collector_obj.get_statistics()
+    max_bin_width = 2 * (max(x.max() for x in inputs) - min(x.min() for x in inputs)) / num_bins
+    for value, ref_value in zip(vars(stat).values(), vars(ref_stat).values()):
+        if isinstance(value, dict):
+            value, ref_value = torch.stack(list(value.values())), torch.stack(list(ref_value.values()))
+        assert value.shape == ref_value.shape
+        assert torch.allclose(value, ref_value, atol=2 * max_bin_width)
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA is not available")
+@pytest.mark.parametrize(
+    "collector", [PTMedianMADStatisticCollector((1, 3, 1, 1)), PTPercentileStatisticCollector([0.1], (1, 3, 1, 1))]
+)
+def test_input_history_is_kept_in_host_memory(collector):
+    input_ = torch.randn([2, 3, 4, 5], device="cuda")
+    collector.register_input(input_)
+    # pylint: disable=protected-access
+    assert all(sample.device.type == "cpu" for sample in collector._samples)
+    collector.get_statistics()
@@ -68,8 +68,7 @@ def test_force_cuda_build(tmp_path):
 
     cpu_ext_dir = torch_ext_dir / "nncf" / "quantized_functions_cpu" / torch_version
     assert cpu_ext_dir.exists()
-    cpu_ext_so = cpu_ext_dir / "quantized_functions_cpu.so"
-    assert cpu_ext_so.exists()
+    assert list(cpu_ext_dir.glob("*/quantized_functions_cpu.so"))
 
     cuda_ext_dir = torch_ext_dir / "nncf" / "quantized_functions_cuda" / torch_version
     assert not cuda_ext_dir.exists()
@@ -78,8 +77,7 @@ def test_force_cuda_build(tmp_path):
 
     cpu_ext_dir = torch_ext_dir / "nncf" / "binarized_functions_cpu" / torch_version
     assert cpu_ext_dir.exists()
-    cpu_ext_so = cpu_ext_dir / "binarized_functions_cpu.so"
-    assert cpu_ext_so.exists()
+    assert list(cpu_ext_dir.glob("*/binarized_functions_cpu.so"))
 
     cuda_ext_dir = torch_ext_dir / "nncf" / "binarized_functions_cuda" / torch_version
     assert not cuda_ext_dir.exists()
@@ -97,10 +95,8 @@ def test_force_cuda_build(tmp_path):
 
     cuda_ext_dir = torch_ext_dir / "nncf" / "quantized_functions_cuda" / torch_version
     assert cuda_ext_dir.exists()
-    cuda_ext_so = cuda_ext_dir / "quantized_functions_cuda.so"
-    assert cuda_ext_so.exists()
+    assert list(cuda_ext_dir.glob("*/quantized_functions_cuda.so"))
 
     cuda_ext_dir = torch_ext_dir / "nncf" / "binarized_functions_cuda" / torch_version
     assert cuda_ext_dir.exists()
-    cuda_ext_so = cuda_ext_dir / "binarized_functions_cuda.so"
-    assert cuda_ext_so.exists()
+    assert list(cuda_ext_dir.glob("*/binarized_functions_cuda.so"))
@@ -0,0 +1,121 @@
+# Copyright (c) 2023 Intel Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+import pytest
+import torch
+
+from nncf.torch.extensions import ExtensionLoader
+from nncf.torch.extensions import ExtensionNamespace
+from nncf.torch.extensions import ExtensionsType
+from nncf.torch.extensions import get_build_directory_for_extension
+from nncf.torch.extensions import get_extensions_sources_hash
+from nncf.torch.quantization.reference import ReferenceBackendType
+from nncf.torch.quantization.reference import ReferenceQuantize
+from nncf.torch.quantization.reference import ReferenceQuantizedFunctions
+
+
+class ExtensionStub:
+    @staticmethod
+    def fn():
+        return "extension"
+
+
+class FallbackStub:
+    @staticmethod
+    def fn():
+        return "fallback"
+
+
+class BlockingLoaderStub(ExtensionLoader):
+    may_finish_loading = threading.Event()
+    raise_on_load = False
+
+    @classmethod
+    def extension_type(cls):
+        return ExtensionsType.CPU
+
+    @classmethod
+    def name(cls) -> str:
+        return "blocking_loader_stub"
+
+    @classmethod
+    def load(cls):
+        cls.may_finish_loading.wait()
+        if cls.raise_on_load:
+            raise RuntimeError("Loading failed")
+        return ExtensionStub
+
+
+@pytest.fixture(name="loader")
+def loader_fixture():
+    BlockingLoaderStub.may_finish_loading = threading.Event()
+    BlockingLoaderStub.raise_on_load = False
+    yield BlockingLoaderStub()
+    BlockingLoaderStub.may_finish_loading.set()
+
+
+def test_fallback_is_used_while_loading_in_background(loader):
+    namespace = ExtensionNamespace(loader, fallback_namespace=FallbackStub)
+    namespace.load_in_background()
+    assert namespace.get("fn")() == "fallback"
+
+    loader.may_finish_loading.set()
+    # pylint:disable=protected-access
+    namespace._loading_thread.join()
+    assert namespace.get("fn")() == "extension"
+
+
+def test_get_waits_for_background_loading_without_fallback(loader):
+    namespace = ExtensionNamespace(loader)
+    namespace.load_in_background()
+    threading.Timer(0.1, loader.may_finish_loading.set).start()
+    assert namespace.get("fn")() == "extension"
+
+
+def test_background_loading_error_is_raised_on_get(loader):
+    BlockingLoaderStub.raise_on_load = True
+    namespace = ExtensionNamespace(loader, fallback_namespace=FallbackStub)
+    namespace.load_in_background()
+    loader.may_finish_loading.set()
+    # pylint:disable=protected-access
+    namespace._loading_thread.join()
+    with pytest.raises(RuntimeError, match="Loading failed"):
+        namespace.get("fn")
+
+
+def test_build_directory_depends_on_sources_hash():
+    build_dir = get_build_directory_for_extension("some_extension")
+    assert build_dir.name == get_extensions_sources_hash()
+    assert build_dir.parent.name == torch.__version__
+
+
+@pytest.mark.parametrize("is_asymmetric", [False, True])
+def test_reference_functions_have_extension_signature(is_asymmetric):
+    input_ = torch.randn([2, 3, 4, 4])
+    grad_output = torch.randn_like(input_)
+    input_low = -torch.ones([1, 3, 1, 1])
+    input_range = 2 * torch.ones([1, 3, 1, 1])
+    levels, level_low, level_high = 256, -128, 127
+
+    executor = ReferenceQuantize(backend_type=ReferenceBackendType.TORCH)
+    ref_output = executor.forward(input_, input_low, input_range, levels)
+    ref_grads = executor.backward(
+        grad_output, input_, input_low, input_range, ref_output, level_low, level_high, is_asymmetric
+    )
+
+    output = ReferenceQuantizedFunctions.Quantize_forward(input_, input_low, input_range, levels)
+    grads = ReferenceQuantizedFunctions.Quantize_backward(
+        grad_output, input_, input_low, input_range, levels, level_low, level_high, is_asymmetric
+    )
+    assert torch.equal(output, ref_output)
+    for grad, ref_grad in zip(grads, ref_grads):
+        assert torch.equal(grad, ref_grad)
@@ -9,19 +9,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Type
+from pathlib import Path
+from typing import List, Optional, Type
 
 import numpy as np
 import pytest
 import torch
+from torch import distributed as dist
 from torch import nn
 
 from nncf import Dataset
 from nncf.common.graph.transformations.commands import TargetType
+from nncf.common.tensor_statistics.statistic_point import StatisticPoint
+from nncf.common.tensor_statistics.statistic_point import StatisticPointsContainer
+from nncf.experimental.common.tensor_statistics.collectors import MaxAggregator
+from nncf.experimental.common.tensor_statistics.collectors import MeanAggregator
+from nncf.experimental.common.tensor_statistics.collectors import MinAggregator
+from nncf.experimental.common.tensor_statistics.collectors import TensorCollector
 from nncf.experimental.common.tensor_statistics.collectors import TensorReducerBase
 from nncf.quantization.algorithms.min_max.torch_backend import PTMinMaxAlgoBackend
 from nncf.torch.graph.graph import PTTargetPoint
 from nncf.torch.statistics.aggregator import PTStatisticsAggregator
+from nncf.torch.tensor_statistics.collectors import PTMaxReducer
+from nncf.torch.tensor_statistics.collectors import PTMinReducer
+from nncf.torch.tensor_statistics.collectors import PTNNCFCollectorTensorProcessor
 from tests.common.test_statistics_aggregator import TemplateTestStatisticsAggregator
 from tests.torch.ptq.helpers import get_nncf_network
 from tests.torch.ptq.test_ptq_params import ToNNCFNetworkInterface
@@ -126,3 +137,58 @@ class TestStatisticsAggregator(TemplateTestStatisticsAggregator):
         self, dataset_samples, test_params, inplace_statistics, is_stat_in_shape_of_scale
     ):
         pass
+
+
+def collect_test_statistics(statistics_aggregator: PTStatisticsAggregator, num_samples: Optional[int]):
+    model = PTIdentityConvModel(np.zeros((3, 3, 3, 3))).get_nncf_network()
+    target_point = PTMinMaxAlgoBackend.target_point(TargetType.POST_LAYER_OPERATION, IDENTITY_NODE_NAME, 0)
+    tensor_processor = PTNNCFCollectorTensorProcessor()
+    collector = TensorCollector()
+    collector.register_statistic_branch("min", PTMinReducer(), MinAggregator(tensor_processor, num_samples))
+    collector.register_statistic_branch("max", PTMaxReducer(), MaxAggregator(tensor_processor, num_samples))
+    collector.register_statistic_branch(
+        "mean", PTMaxReducer(), MeanAggregator(tensor_processor, num_samples=num_samples)
+    )
+    statistic_points = StatisticPointsContainer()
+    statistic_points.add_statistic_point(StatisticPoint(target_point, collector, "TestAlgo"))
+    statistics_aggregator.register_statistic_points(statistic_points)
+    statistics_aggregator.collect_statistics(model)
+    return collector.get_statistics()
+
+
+def get_test_dataset() -> Dataset:
+    torch.manual_seed(0)
+    return Dataset([torch.randn(INPUT_SHAPE) for _ in range(5)])
+
+
+def data_parallel_statistics_collection_worker(
+    rank: int, world_size: int, init_method: str, num_samples: Optional[int], tmp_path: Path
+):
+    dist.init_process_group(backend="gloo", init_method=init_method, world_size=world_size, rank=rank)
+    try:
+        statistics = collect_test_statistics(PTStatisticsAggregator(get_test_dataset(), distributed=True), num_samples)
+        torch.save(statistics, tmp_path / f"statistics_{rank}.pt")
+    finally:
+        dist.destroy_process_group()
+
+
+@pytest.mark.parametrize("num_samples", [None, 3])
+def test_data_parallel_statistics_collection(num_samples, tmp_path):
+    ref_statistics = collect_test_statistics(PTStatisticsAggregator(get_test_dataset()), num_samples)
+    # Without the default process group the statistics are collected by the current process only
+    statistics = collect_test_statistics(PTStatisticsAggregator(get_test_dataset(), distributed=True), num_samples)
+    for key, ref_value in ref_statistics.items():
+        assert torch.allclose(statistics[key], ref_value)
+
+    world_size = 2
+    init_method = f"file://{tmp_path / 'process_group_init'}"
+    torch.multiprocessing.spawn(
+        data_parallel_statistics_collection_worker,
+        args=(world_size, init_method, num_samples, tmp_path),
+        nprocs=world_size,
+        join=True,
+    )
+    for rank in range(world_size):
+        statistics = torch.load(tmp_path / f"statistics_{rank}.pt")
+        for key, ref_value in ref_statistics.items():
+            assert torch.allclose(statistics[key], ref_value)
@@ -8,6 +8,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import threading
+
 import pytest
 import torch
 from pkg_resources import parse_version
@@ -118,3 +120,83 @@ def test_no_cross_forward_run_dependency():
         ctx.enable_trace_dynamic_graph()
         _ = module(tensor)
         ctx.disable_trace_dynamic_graph()
+
+
+def test_no_thread_synchronization_on_lookups_with_disabled_node_additions(mocker):
+    module = ModuleForTest()
+    tensor = torch.ones([1, 1, 1, 1])
+    ctx = TracingContext()
+    with ctx:
+        ctx.enable_trace_dynamic_graph()
+        _ = module(tensor)
+    ref_nodes_count = ctx.graph.get_nodes_count()
+
+    ctx.disable_node_additions()
+    # pylint:disable=protected-access
+    cond_mock = mocker.MagicMock()
+    ctx._threading.cond = cond_mock
+
+    def run_forward():
+        with ctx:
+            ctx.enable_trace_dynamic_graph()
+            _ = module(tensor)
+
+    threads = [threading.Thread(target=run_forward) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    cond_mock.__enter__.assert_not_called()
+    assert ctx.graph.get_nodes_count() == ref_nodes_count
+
+
+def test_node_is_not_added_after_node_additions_are_disabled_while_waiting():
+    ctx = TracingContext()
+    # pylint:disable=protected-access
+    cond = ctx._threading.cond
+    is_waiting = threading.Event()
+    original_wait = cond.wait
+
+    def wait(*args, **kwargs):
+        is_waiting.set()
+        return original_wait(*args, **kwargs)
+
+    cond.wait = wait
+    results = []
+
+    def run_maybe_add_node():
+        results.append(ctx.maybe_add_node(None, [], None))
+
+    with cond:
+        ctx._n_instances_searching_graph += 1
+    thread = threading.Thread(target=run_maybe_add_node)
+    thread.start()
+    is_waiting.wait()
+
+    ctx.disable_node_additions()
+    with cond:
+        ctx._n_instances_searching_graph -= 1
+        cond.notify_all()
+    thread.join()
+
+    assert results == [None]
+    assert ctx.graph.get_nodes_count() == 0
+
+
+def test_traced_tensors_have_no_metas_if_dynamic_graph_is_not_traced():
+    module = ModuleForTest()
+    tensor = torch.ones([1, 1, 1, 1])
+    with TracingContext() as ctx:
+        result = module(tensor)
+        # pylint:disable=protected-access
+        assert not ctx._threading.thread_local.traced_tensor_weakrefs
+    assert isinstance(result, TracedTensor)
+    assert result.tensor_meta is None
+    assert result.nncf_expired
+
+    with TracingContext() as ctx:
+        ctx.enable_trace_dynamic_graph()
+        result = module(tensor)
+        assert result.tensor_meta is not None
+        assert not result.nncf_expired
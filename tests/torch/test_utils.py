@@ -2,7 +2,9 @@ import pytest
 import torch
 from torch import nn
 
+from nncf.common.initialization.batchnorm_adaptation import BatchnormAdaptationAlgorithm
 from nncf.torch.initialization import DataLoaderBNAdaptationRunner
+from nncf.torch.initialization import DefaultInitializingDataLoader
 from nncf.torch.layer_utils import CompressionParameter
 from nncf.torch.utils import _ModuleState
 from nncf.torch.utils import save_module_state
@@ -74,3 +76,58 @@ def test_bn_training_state_switcher(_seed, model: nn.Module):
         check_were_only_bn_training_state_changed(model, saved_state)
 
     compare_saved_model_state_and_current_model_state(model, saved_state)
+
+
+class ConvBNLinearModel(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv = nn.Conv2d(1, 2, 2)
+        self.bn = nn.BatchNorm2d(2)
+        self.linear = nn.Linear(18, 1)
+
+    def forward(self, x):
+        return self.linear(self.bn(self.conv(x)).flatten(1))
+
+
+class CountingDataLoader(DefaultInitializingDataLoader):
+    def __init__(self, data_loader):
+        super().__init__(data_loader)
+        self.num_loaded_batches = 0
+
+    def __iter__(self):
+        for loaded_item in super().__iter__():
+            self.num_loaded_batches += 1
+            yield loaded_item
+
+
+def create_bn_adaptation_data_loader(num_batches: int, batch_size: int) -> CountingDataLoader:
+    dataset = torch.utils.data.TensorDataset(
+        torch.rand([num_batches * batch_size, 1, 4, 4]), torch.zeros([num_batches * batch_size])
+    )
+    return CountingDataLoader(torch.utils.data.DataLoader(dataset, batch_size=batch_size))
+
+
+@pytest.mark.parametrize("bn_only_forward", [False, True])
+def test_bn_adaptation_with_cached_batches(bn_only_forward):
+    data_loader = create_bn_adaptation_data_loader(num_batches=4, batch_size=2)
+    reference_model = ConvBNLinearModel()
+    model = ConvBNLinearModel()
+    model.load_state_dict(reference_model.state_dict())
+
+    BatchnormAdaptationAlgorithm(data_loader, num_bn_adaptation_samples=6).run(reference_model)
+    bn_adaptation = BatchnormAdaptationAlgorithm(
+        data_loader, num_bn_adaptation_samples=6, cache_batches=True, bn_only_forward=bn_only_forward
+    )
+    linear_forward_spy = []
+    model.linear.register_forward_hook(lambda *unused: linear_forward_spy.append(True))
+    data_loader.num_loaded_batches = 0
+    bn_adaptation.run(model)
+    num_loaded_batches = data_loader.num_loaded_batches
+    assert num_loaded_batches > 0
+
+    model.bn.reset_running_stats()
+    bn_adaptation.run(model)
+    assert data_loader.num_loaded_batches == num_loaded_batches
+    assert torch.allclose(model.bn.running_mean, reference_model.bn.running_mean)
+    assert torch.allclose(model.bn.running_var, reference_model.bn.running_var)
+    assert len(linear_forward_spy) == (2 if bn_only_forward else 6)
@@ -0,0 +1,157 @@
+# Copyright (c) 2023 Intel Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the CPU inference latency of a BERT model sparsified by the movement sparsity algorithm with structured
+masking, where the binary masks are applied to the dense weights on each forward, against the same model
+after `compact_model`, where the pruned heads and channels are removed from the linear layers.
+"""
+
+import sys
+import time
+from itertools import product
+from typing import Callable, Dict, List
+
+import pandas as pd
+import torch
+from tqdm import tqdm
+from transformers import BertConfig
+from transformers import BertForSequenceClassification
+
+from nncf import NNCFConfig
+from nncf.torch import create_compressed_model
+
+TIME_SCALES = {"ms": 1000}
+WARMUP_RUNS = 3
+CPU_RUNS = 20
+
+TEST_BATCH_SIZES = [1, 8]
+TEST_SEQUENCE_LENGTHS = [128, 384]
+# Fractions of the attention heads and of the feed-forward channels pruned in each transformer block
+TEST_PRUNED_FRACTIONS = [0.25, 0.5, 0.75]
+
+BERT_CONFIG = BertConfig(
+    hidden_size=768, intermediate_size=3072, num_attention_heads=12, num_hidden_layers=12, num_labels=2
+)
+MOVEMENT_SPARSITY_CONFIG = {
+    "algorithm": "movement_sparsity",
+    "params": {
+        "warmup_start_epoch": 1,
+        "warmup_end_epoch": 4,
+        "importance_regularization_factor": 0.01,
+        "enable_structured_masking": True,
+    },
+    "sparse_structure_by_scopes": [
+        {"mode": "block", "sparse_factors": [32, 32], "target_scopes": "{re}.*BertAttention.*"},
+        {"mode": "per_dim", "axis": 0, "target_scopes": "{re}.*BertIntermediate.*"},
+        {"mode": "per_dim", "axis": 1, "target_scopes": "{re}.*BertOutput.*"},
+    ],
+    "ignored_scopes": ["{re}.*NNCFEmbedding", "{re}.*pooler.*", "{re}.*classifier.*", "{re}.*LayerNorm.*"],
+}
+
+
+def measure(fn: Callable, runs: int) -> float:
+    for _ in range(WARMUP_RUNS):
+        fn()
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    elapsed = time.perf_counter() - start
+    _, scale = list(TIME_SCALES.items())[0]
+    return elapsed / runs * scale
+
+
+def create_structured_sparse_model(pruned_fraction: float, sequence_length: int):
+    nncf_config = NNCFConfig.from_dict(
+        {
+            "input_info": [
+                {"sample_size": [1, sequence_length], "type": "long", "keyword": "input_ids"},
+                {"sample_size": [1, sequence_length], "type": "long", "keyword": "attention_mask"},
+            ],
+            "compression": MOVEMENT_SPARSITY_CONFIG,
+        }
+    )
+    compression_ctrl, compressed_model = create_compressed_model(
+        BertForSequenceClassification(BERT_CONFIG), nncf_config, dump_graphs=False
+    )
+
+    # Prunes the same fraction of randomly chosen heads and channels in each structured mask context group
+    # pylint: disable=protected-access
+    handler = compression_ctrl._structured_mask_handler
+    for group in handler._structured_mask_ctx_groups:
+        ctxes = group.structured_mask_contexts
+        num_blocks = max(ctxes[0].structured_mask_shape)
+        kept_blocks = torch.ones(num_blocks)
+        kept_blocks[torch.randperm(num_blocks)[: int(num_blocks * pruned_fraction)]] = 0
+        for ctx in ctxes:
+            shape = (num_blocks, 1) if ctx.prune_by_row else (1, num_blocks)
+            ctx.independent_structured_mask = kept_blocks.view(shape)
+    handler.resolve_dependent_structured_mask()
+    handler.populate_dependent_structured_mask_to_operand()
+    compression_ctrl.freeze()
+    return compression_ctrl, compressed_model
+
+
+def run_benchmark(params: Dict, runs: int) -> Dict:
+    batch_size = params["batch_size"]
+    sequence_length = params["sequence_length"]
+    compression_ctrl, masked_model = create_structured_sparse_model(params["pruned_fraction"], sequence_length)
+    masked_model.eval()
+    compacted_model = compression_ctrl.compact_model(masked_model, do_copy=True)
+
+    input_ids = torch.randint(0, BERT_CONFIG.vocab_size, (batch_size, sequence_length))
+    attention_mask = torch.ones_like(input_ids)
+
+    def run_model(model: torch.nn.Module) -> Callable:
+        def fn():
+            with torch.no_grad():
+                return model(input_ids=input_ids, attention_mask=attention_mask).logits
+
+        return fn
+
+    masked_logits = run_model(masked_model)()
+    compacted_logits = run_model(compacted_model)()
+    max_abs_diff = (masked_logits - compacted_logits).abs().max().item()
+
+    ctime, _ = list(TIME_SCALES.items())[0]
+    masked_time = measure(run_model(masked_model), runs)
+    compacted_time = measure(run_model(compacted_model), runs)
+    return {
+        f"masked, {ctime}": masked_time,
+        f"compacted, {ctime}": compacted_time,
+        "speedup": masked_time / compacted_time,
+        "max_abs_diff": max_abs_diff,
+    }
+
+
+def get_test_params() -> List[Dict]:
+    return [
+        {"batch_size": batch_size, "sequence_length": sequence_length, "pruned_fraction": pruned_fraction}
+        for batch_size, sequence_length, pruned_fraction in product(
+            TEST_BATCH_SIZES, TEST_SEQUENCE_LENGTHS, TEST_PRUNED_FRACTIONS
+        )
+    ]
+
+
+if __name__ == "__main__":
+    file_name = "benchmark_movement_sparsity_compaction_result.csv" if len(sys.argv) == 1 else sys.argv[1]
+    print(f"Benchmark results will be saved to file {file_name}")
+    print(f"Number of threads: {torch.get_num_threads()}")
+
+    benchmark_data = []
+    for test_params in tqdm(get_test_params()):
+        result = run_benchmark(test_params, CPU_RUNS)
+        benchmark_data.append({**test_params, "threads": torch.get_num_threads(), **result})
+
+    df = pd.DataFrame(benchmark_data)
+    df.to_csv(file_name, index=False)
+    print(df.to_string())
+    print("Done!")
@@ -0,0 +1,121 @@
+# Copyright (c) 2023 Intel Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the fused CPU quantization kernels of the NNCF extension against the non-fused
+ATen-based kernels of the same extension, against the kernels composed of the PyTorch operations only
+and against the torch reference implementation.
+"""
+
+import sys
+import time
+from itertools import product
+from typing import Callable, Dict, List
+
+import pandas as pd
+import torch
+from tqdm import tqdm
+
+from nncf.torch.quantization.extensions import QuantizedFunctionsCPU
+from nncf.torch.quantization.layers import get_per_channel_scale_shape
+from nncf.torch.quantization.quantize_functions import TorchQuantizedFunctions
+from nncf.torch.quantization.reference import ReferenceQuantizedFunctions
+
+TIME_SCALES = {"ms": 1000}
+NBITS = 8
+WARMUP_RUNS = 3
+CPU_RUNS = 20
+
+TEST_INPUT_SIZES = [[2, 96, 64, 64], [32, 96, 64, 64], [1024, 1024]]
+TEST_PLACES = ["weights", "activations"]
+TEST_GRANULARITY = ["per_tensor", "per_channel"]
+TEST_SYMMETRIC = [True, False]
+TEST_DTYPES = [torch.float, torch.double]
+TEST_IMPLEMENTATIONS = {
+    "fused": lambda: (QuantizedFunctionsCPU.get("Quantize_forward"), QuantizedFunctionsCPU.get("Quantize_backward")),
+    "generic": lambda: (
+        QuantizedFunctionsCPU.get("Quantize_forward_generic"),
+        QuantizedFunctionsCPU.get("Quantize_backward_generic"),
+    ),
+    "torch": lambda: (TorchQuantizedFunctions.Quantize_forward, TorchQuantizedFunctions.Quantize_backward),
+    "reference": lambda: (ReferenceQuantizedFunctions.Quantize_forward, ReferenceQuantizedFunctions.Quantize_backward),
+}
+
+
+def measure(fn: Callable, runs: int) -> float:
+    for _ in range(WARMUP_RUNS):
+        fn()
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    elapsed = time.perf_counter() - start
+    _, scale = list(TIME_SCALES.items())[0]
+    return elapsed / runs * scale
+
+
+def run_benchmark(params: Dict, runs: int) -> Dict:
+    input_size = params["input_size"]
+    dtype = params["dtype"]
+    scale_shape = [1]
+    if params["granularity"] == "per_channel":
+        scale_shape = get_per_channel_scale_shape(input_size, is_weights=params["place"] == "weights")
+
+    level_high = 2 ** (NBITS - 1) - 1
+    level_low = -(level_high + 1)
+    levels = 2**NBITS
+    input_ = torch.randn(input_size, dtype=dtype)
+    grad_output = torch.randn(input_size, dtype=dtype)
+    input_low = -torch.rand(scale_shape, dtype=dtype) - 0.5
+    input_range = torch.rand(scale_shape, dtype=dtype) + 1.0
+    is_asymmetric = not params["symmetric"]
+
+    forward_fn, backward_fn = TEST_IMPLEMENTATIONS[params["implementation"]]()
+
+    def run_forward():
+        forward_fn(input_, input_low, input_range, levels)
+
+    def run_backward():
+        backward_fn(grad_output, input_, input_low, input_range, levels, level_low, level_high, is_asymmetric)
+
+    ctime, _ = list(TIME_SCALES.items())[0]
+    return {f"forward, {ctime}": measure(run_forward, runs), f"backward, {ctime}": measure(run_backward, runs)}
+
+
+def get_test_params() -> List[Dict]:
+    return [
+        {
+            "implementation": implementation,
+            "dtype": dtype,
+            "input_size": input_size,
+            "place": place,
+            "granularity": granularity,
+            "symmetric": symmetric,
+        }
+        for implementation, dtype, input_size, place, granularity, symmetric in product(
+            TEST_IMPLEMENTATIONS, TEST_DTYPES, TEST_INPUT_SIZES, TEST_PLACES, TEST_GRANULARITY, TEST_SYMMETRIC
+        )
+    ]
+
+
+if __name__ == "__main__":
+    file_name = "benchmark_quantize_cpu_kernels_result.csv" if len(sys.argv) == 1 else sys.argv[1]
+    print(f"Benchmark results will be saved to file {file_name}")
+    print(f"Number of threads: {torch.get_num_threads()}")
+
+    benchmark_data = []
+    for test_params in tqdm(get_test_params()):
+        result = run_benchmark(test_params, CPU_RUNS)
+        benchmark_data.append({**test_params, "threads": torch.get_num_threads(), **result})
+
+    df = pd.DataFrame(benchmark_data)
+    df.to_csv(file_name, index=False)
+    print(df.to_string())
+    print("Done!")